@@ -30,6 +30,18 @@ target_metadata = SQLModel.metadata
 # my_important_option = config.get_main_option("my_important_option")
 # ... etc.
 
+# Full-text search lives outside the models (app.models.task.TASK_SEARCH_DDL),
+# keep autogenerate from dropping it
+SEARCH_OBJECTS = {"search_vector", "search_rowid", "ix_tasks_search_vector", "ix_tasks_search_rowid"}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if type_ == "table" and name.startswith("tasks_fts"):
+        return False
+    if reflected and compare_to is None and name in SEARCH_OBJECTS:
+        return False
+    return True
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
@@ -49,6 +61,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -70,7 +83,7 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata, include_object=include_object
         )
 
         with context.begin_transaction():
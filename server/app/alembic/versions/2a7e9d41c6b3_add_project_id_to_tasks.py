@@ -0,0 +1,35 @@
+"""add project id to tasks
+
+Revision ID: 2a7e9d41c6b3
+Revises: 8c3d0b6e4f21
+Create Date: 2026-10-18 16:40:05.281733
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2a7e9d41c6b3'
+down_revision: Union[str, Sequence[str], None] = '8c3d0b6e4f21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Batch mode so SQLite (no ALTER ... ADD CONSTRAINT) can add the foreign key too
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.add_column(sa.Column('project_id', sa.Uuid(), nullable=True))
+        batch_op.create_foreign_key('fk_tasks_project_id_projects', 'projects', ['project_id'], ['id'])
+        batch_op.create_index('ix_tasks_project_id', ['project_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.drop_index('ix_tasks_project_id')
+        batch_op.drop_constraint('fk_tasks_project_id_projects', type_='foreignkey')
+        batch_op.drop_column('project_id')
@@ -0,0 +1,67 @@
+"""add task full text search
+
+Revision ID: 3c9e5a7d1f42
+Revises: 7b2f4c8e1a59
+Create Date: 2026-10-18 20:31:17.554902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9e5a7d1f42'
+down_revision: Union[str, Sequence[str], None] = '7b2f4c8e1a59'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        # FTS5 table over tasks, kept in step by triggers, filled from the existing rows
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5("
+            "title, description, content='tasks', tokenize='porter unicode61')"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN "
+            "INSERT INTO tasks_fts (rowid, title, description) VALUES (new.rowid, new.title, new.description); END"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN "
+            "INSERT INTO tasks_fts (tasks_fts, rowid, title, description) "
+            "VALUES ('delete', old.rowid, old.title, old.description); END"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN "
+            "INSERT INTO tasks_fts (tasks_fts, rowid, title, description) "
+            "VALUES ('delete', old.rowid, old.title, old.description); "
+            "INSERT INTO tasks_fts (rowid, title, description) VALUES (new.rowid, new.title, new.description); END"
+        )
+        op.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+        return
+    # A stored generated column rewrites tasks under an exclusive lock, run it in a quiet window
+    op.execute(
+        "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')) STORED"
+    )
+    # CONCURRENTLY so tasks stays writable while the index builds
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tasks_search_vector "
+            "ON tasks USING gin (search_vector)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        for trigger in ("tasks_fts_insert", "tasks_fts_delete", "tasks_fts_update"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS tasks_fts")
+        return
+    op.execute("DROP INDEX IF EXISTS ix_tasks_search_vector")
+    op.execute("ALTER TABLE tasks DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,132 @@
+"""partition timesheets by month on work_date
+
+Revision ID: 5a8c3e1f7b24
+Revises: 9e4b1d6a3c70
+Create Date: 2026-10-18 23:12:40.518377
+
+"""
+from datetime import date, datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a8c3e1f7b24'
+down_revision: Union[str, Sequence[str], None] = '9e4b1d6a3c70'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows copied per transaction while timesheets stays writable
+BATCH_SIZE = 10_000
+# Months created past the current one, the maintenance command keeps this up
+MONTHS_AHEAD = 3
+INDEXES = ['task_id', 'user_id', 'work_date']
+FOREIGN_KEYS = [('user_id', 'users'), ('task_id', 'tasks')]
+
+
+def month_after(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        # SQLite has no partitioning, timesheets stays a plain table there
+        return
+
+    # 1. Partitioned copy of timesheets, the partition key has to be in the primary key
+    op.execute(
+        "CREATE TABLE timesheets_partitioned "
+        "(LIKE timesheets INCLUDING DEFAULTS INCLUDING CONSTRAINTS, PRIMARY KEY (id, work_date)) "
+        "PARTITION BY RANGE (work_date)"
+    )
+    for column, table in FOREIGN_KEYS:
+        op.execute(f"ALTER TABLE timesheets_partitioned ADD CONSTRAINT timesheets_partitioned_{column}_fkey "
+                   f"FOREIGN KEY ({column}) REFERENCES {table} (id)")
+    for column in INDEXES:
+        op.execute(f"CREATE INDEX ix_timesheets_partitioned_{column} ON timesheets_partitioned ({column})")
+
+    # 2. One partition per month from the oldest timesheet, and a default for anything else
+    # (named like timesheet_partition_service.month_partition, which maintains them afterwards)
+    oldest = op.get_bind().execute(sa.text("SELECT min(work_date) FROM timesheets")).scalar()
+    today = datetime.now(timezone.utc).date()
+    month = (oldest.date() if oldest else today).replace(day=1)
+    last = today.replace(day=1)
+    for _ in range(MONTHS_AHEAD):
+        last = month_after(last)
+    while month <= last:
+        end = month_after(month)
+        op.execute(f"CREATE TABLE timesheets_y{month.year:04d}m{month.month:02d} PARTITION OF timesheets_partitioned "
+                   f"FOR VALUES FROM ('{month.isoformat()}') TO ('{end.isoformat()}')")
+        month = end
+    op.execute("CREATE TABLE timesheets_default PARTITION OF timesheets_partitioned DEFAULT")
+
+    # 3. Writes to timesheets during the copy are mirrored by a trigger
+    op.execute("""
+        CREATE FUNCTION timesheets_partition_sync() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                DELETE FROM timesheets_partitioned WHERE id = OLD.id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO timesheets_partitioned SELECT NEW.* ON CONFLICT DO NOTHING;
+            END IF;
+            RETURN NULL;
+        END
+        $$
+    """)
+    op.execute("CREATE TRIGGER timesheets_partition_sync AFTER INSERT OR UPDATE OR DELETE ON timesheets "
+               "FOR EACH ROW EXECUTE FUNCTION timesheets_partition_sync()")
+
+    # 4. Copy in id order, one short transaction per batch. FOR SHARE makes a
+    # concurrent update wait for the batch (its trigger then replaces the copy),
+    # or hands the batch the updated row if it committed first.
+    with op.get_context().autocommit_block():
+        params = {"limit": BATCH_SIZE}
+        while True:
+            after = "WHERE id > :last_id " if "last_id" in params else ""
+            # uuid has no max(), the last id of the batch comes from ORDER BY
+            last_id = op.get_bind().execute(sa.text(
+                "WITH batch AS ("
+                f"  SELECT * FROM timesheets {after}ORDER BY id LIMIT :limit FOR SHARE"
+                "), copied AS ("
+                "  INSERT INTO timesheets_partitioned SELECT * FROM batch ON CONFLICT DO NOTHING"
+                ") SELECT id FROM batch ORDER BY id DESC LIMIT 1"
+            ), params).scalar()
+            if last_id is None:
+                break
+            params["last_id"] = last_id
+
+    # 5. Swap, the only step holding an exclusive lock on timesheets
+    op.execute("LOCK TABLE timesheets IN ACCESS EXCLUSIVE MODE")
+    op.execute("DROP TRIGGER timesheets_partition_sync ON timesheets")
+    op.execute("DROP FUNCTION timesheets_partition_sync()")
+    op.execute("DROP TABLE timesheets")
+    op.execute("ALTER TABLE timesheets_partitioned RENAME TO timesheets")
+    op.execute("ALTER TABLE timesheets RENAME CONSTRAINT timesheets_partitioned_pkey TO timesheets_pkey")
+    for column, _ in FOREIGN_KEYS:
+        op.execute(f"ALTER TABLE timesheets RENAME CONSTRAINT timesheets_partitioned_{column}_fkey "
+                   f"TO timesheets_{column}_fkey")
+    for column in INDEXES:
+        op.execute(f"ALTER INDEX ix_timesheets_partitioned_{column} RENAME TO ix_timesheets_{column}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    # Offline: timesheets is locked while the rows are copied back into a plain table
+    op.execute("LOCK TABLE timesheets IN ACCESS EXCLUSIVE MODE")
+    op.execute("CREATE TABLE timesheets_plain (LIKE timesheets INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+    op.execute("INSERT INTO timesheets_plain SELECT * FROM timesheets")
+    op.execute("DROP TABLE timesheets")
+    op.execute("ALTER TABLE timesheets_plain RENAME TO timesheets")
+    op.execute("ALTER TABLE timesheets ADD CONSTRAINT timesheets_pkey PRIMARY KEY (id)")
+    for column, table in FOREIGN_KEYS:
+        op.execute(f"ALTER TABLE timesheets ADD CONSTRAINT timesheets_{column}_fkey "
+                   f"FOREIGN KEY ({column}) REFERENCES {table} (id)")
+    for column in INDEXES:
+        op.create_index(f'ix_timesheets_{column}', 'timesheets', [column], unique=False)
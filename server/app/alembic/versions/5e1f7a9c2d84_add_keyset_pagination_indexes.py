@@ -0,0 +1,31 @@
+"""add keyset pagination indexes
+
+Revision ID: 5e1f7a9c2d84
+Revises: b394a32a4c07
+Create Date: 2026-10-18 14:02:17.530914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e1f7a9c2d84'
+down_revision: Union[str, Sequence[str], None] = 'b394a32a4c07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_workspaces_owner_id_created_at_id', 'workspaces',
+                    ['owner_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_projects_workspace_id_created_at_id', 'projects',
+                    ['workspace_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_projects_workspace_id_created_at_id', table_name='projects')
+    op.drop_index('ix_workspaces_owner_id_created_at_id', table_name='workspaces')
@@ -0,0 +1,32 @@
+"""add comment thread index
+
+Revision ID: 7b2f4c8e1a59
+Revises: d61b58e2a9f7
+Create Date: 2026-10-18 19:12:04.381520
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2f4c8e1a59'
+down_revision: Union[str, Sequence[str], None] = 'd61b58e2a9f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_comments_task_id_created_at_id', 'comments',
+                    ['task_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+    # Covered by the leading column of the new index
+    op.drop_index(op.f('ix_comments_task_id'), table_name='comments')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_comments_task_id'), 'comments', ['task_id'], unique=False)
+    op.drop_index('ix_comments_task_id_created_at_id', table_name='comments')
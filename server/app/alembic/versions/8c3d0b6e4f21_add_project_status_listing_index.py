@@ -0,0 +1,28 @@
+"""add project status listing index
+
+Revision ID: 8c3d0b6e4f21
+Revises: 5e1f7a9c2d84
+Create Date: 2026-10-18 15:26:48.117402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c3d0b6e4f21'
+down_revision: Union[str, Sequence[str], None] = '5e1f7a9c2d84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_projects_workspace_id_status_created_at_id', 'projects',
+                    ['workspace_id', 'status', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_projects_workspace_id_status_created_at_id', table_name='projects')
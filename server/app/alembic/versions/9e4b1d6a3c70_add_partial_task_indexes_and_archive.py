@@ -0,0 +1,134 @@
+"""add partial task indexes and archive tables
+
+Revision ID: 9e4b1d6a3c70
+Revises: 3c9e5a7d1f42
+Create Date: 2026-10-18 21:47:52.906144
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4b1d6a3c70'
+down_revision: Union[str, Sequence[str], None] = '3c9e5a7d1f42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# name, columns, predicate (Postgres), predicate (SQLite, as SQLAlchemy writes the boolean test)
+PARTIAL_INDEXES = [
+    ('ix_tasks_open_owner_id_status_priority_due_date', 'owner_id, status, priority, due_date',
+     'NOT is_archived', 'is_archived = 0'),
+    ('ix_tasks_open_project_id_status_priority_due_date', 'project_id, status, priority, due_date',
+     'NOT is_archived', 'is_archived = 0'),
+    ('ix_tasks_archived_at', 'archived_at', 'is_archived', 'is_archived = 1'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    postgres = op.get_bind().dialect.name == "postgresql"
+    op.add_column('tasks', sa.Column('archived_at', sa.DateTime(), nullable=True))
+    # Tasks archived before this column existed start their countdown from their last change
+    op.execute("UPDATE tasks SET archived_at = updated_at WHERE is_archived")
+
+    if postgres:
+        # CONCURRENTLY so tasks stays writable while the indexes build
+        with op.get_context().autocommit_block():
+            for name, columns, where, _ in PARTIAL_INDEXES:
+                op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON tasks ({columns}) WHERE {where}")
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_status")
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_priority")
+    else:
+        for name, columns, _, where in PARTIAL_INDEXES:
+            op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON tasks ({columns}) WHERE {where}")
+        op.drop_index(op.f('ix_tasks_status'), table_name='tasks')
+        op.drop_index(op.f('ix_tasks_priority'), table_name='tasks')
+
+    # Archive tables: same columns as the live ones, no foreign keys
+    task_status = postgresql.ENUM('DRAFT', 'IN_PROGRESS', 'IN_REVIEW', 'DONE', 'CANCELLED',
+                                  name='taskstatus', create_type=False)
+    task_priority = postgresql.ENUM('LOW', 'MEDIUM', 'HIGH', 'URGENT', name='taskpriority', create_type=False)
+    op.create_table('tasks_archive',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('title', sqlmodel.sql.sqltypes.AutoString(length=300), nullable=False),
+    sa.Column('description', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.Column('is_archived', sa.Boolean(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(), nullable=True),
+    sa.Column('status', task_status, nullable=False),
+    sa.Column('priority', task_priority, nullable=False),
+    sa.Column('estimated_hours', sa.Float(), nullable=True),
+    sa.Column('actual_hours', sa.Float(), nullable=True),
+    sa.Column('progress_percentage', sa.Integer(), nullable=False),
+    sa.Column('due_date', sa.DateTime(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('owner_id', sa.Uuid(), nullable=False),
+    sa.Column('project_id', sa.Uuid(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_tasks_archive_project_id', 'tasks_archive', ['project_id'], unique=False)
+    op.create_index('ix_tasks_archive_owner_id', 'tasks_archive', ['owner_id'], unique=False)
+    op.create_table('comments_archive',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('content', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('is_edited', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('author_id', sa.Uuid(), nullable=False),
+    sa.Column('task_id', sa.Uuid(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_comments_archive_task_id', 'comments_archive', ['task_id'], unique=False)
+    op.create_table('timesheets_archive',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('description', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False),
+    sa.Column('hours', sa.Float(), nullable=False),
+    sa.Column('work_date', sa.DateTime(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('user_id', sa.Uuid(), nullable=False),
+    sa.Column('task_id', sa.Uuid(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_timesheets_archive_task_id', 'timesheets_archive', ['task_id'], unique=False)
+    op.create_table('timesheet_rollups_archive',
+    sa.Column('user_id', sa.Uuid(), nullable=False),
+    sa.Column('task_id', sa.Uuid(), nullable=False),
+    sa.Column('week_start', sa.Date(), nullable=False),
+    sa.Column('hours', sa.Float(), nullable=False),
+    sa.Column('entries', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('user_id', 'task_id', 'week_start')
+    )
+    op.create_index('ix_timesheet_rollups_archive_task_id', 'timesheet_rollups_archive', ['task_id'], unique=False)
+    op.create_table('task_tags_archive',
+    sa.Column('task_id', sa.Uuid(), nullable=False),
+    sa.Column('tag_id', sa.Uuid(), nullable=False),
+    sa.PrimaryKeyConstraint('task_id', 'tag_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('task_tags_archive')
+    op.drop_index('ix_timesheet_rollups_archive_task_id', table_name='timesheet_rollups_archive')
+    op.drop_table('timesheet_rollups_archive')
+    op.drop_index('ix_timesheets_archive_task_id', table_name='timesheets_archive')
+    op.drop_table('timesheets_archive')
+    op.drop_index('ix_comments_archive_task_id', table_name='comments_archive')
+    op.drop_table('comments_archive')
+    op.drop_index('ix_tasks_archive_owner_id', table_name='tasks_archive')
+    op.drop_index('ix_tasks_archive_project_id', table_name='tasks_archive')
+    op.drop_table('tasks_archive')
+
+    op.create_index(op.f('ix_tasks_status'), 'tasks', ['status'], unique=False)
+    op.create_index(op.f('ix_tasks_priority'), 'tasks', ['priority'], unique=False)
+    for name, *_ in PARTIAL_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    # Not batch mode, recreating tasks on SQLite would lose the tasks_fts triggers
+    op.drop_column('tasks', 'archived_at')
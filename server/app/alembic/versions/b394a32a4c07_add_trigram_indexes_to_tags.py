@@ -0,0 +1,45 @@
+"""add trigram indexes to tags
+
+Revision ID: b394a32a4c07
+Revises: c4e323a6547d
+Create Date: 2026-10-18 10:12:41.208315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b394a32a4c07'
+down_revision: Union[str, Sequence[str], None] = 'c4e323a6547d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        # No trigrams on SQLite, only exact and prefix matches get an index
+        op.execute("CREATE INDEX IF NOT EXISTS ix_tags_name_lower ON tags (lower(name))")
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # CONCURRENTLY so a large tags table stays writable while the indexes build
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tags_name_trgm "
+            "ON tags USING gin (lower(name) gin_trgm_ops)"
+        )
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tags_name_lower_c '
+            'ON tags (lower(name) COLLATE "C")'
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_tags_name_lower")
+        return
+    op.execute("DROP INDEX IF EXISTS ix_tags_name_lower_c")
+    op.execute("DROP INDEX IF EXISTS ix_tags_name_trgm")
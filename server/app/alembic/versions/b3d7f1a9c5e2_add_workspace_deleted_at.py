@@ -0,0 +1,33 @@
+"""add workspace deleted_at
+
+Revision ID: b3d7f1a9c5e2
+Revises: 5a8c3e1f7b24
+Create Date: 2026-10-19 00:21:08.734615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d7f1a9c5e2'
+down_revision: Union[str, Sequence[str], None] = '5a8c3e1f7b24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('workspaces', sa.Column('deleted_at', sa.DateTime(), nullable=True))
+    # Partial, only the deleted workspaces waiting for their purge are indexed
+    op.create_index('ix_workspaces_deleted_at', 'workspaces', ['deleted_at'], unique=False,
+                    postgresql_where=sa.text('deleted_at IS NOT NULL'),
+                    sqlite_where=sa.text('deleted_at IS NOT NULL'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_workspaces_deleted_at', table_name='workspaces')
+    op.drop_column('workspaces', 'deleted_at')
@@ -0,0 +1,40 @@
+"""add timesheet rollups
+
+Revision ID: d61b58e2a9f7
+Revises: 2a7e9d41c6b3
+Create Date: 2026-10-18 17:55:39.604127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd61b58e2a9f7'
+down_revision: Union[str, Sequence[str], None] = '2a7e9d41c6b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('timesheet_rollups',
+    sa.Column('user_id', sa.Uuid(), nullable=False),
+    sa.Column('task_id', sa.Uuid(), nullable=False),
+    sa.Column('week_start', sa.Date(), nullable=False),
+    sa.Column('hours', sa.Float(), nullable=False),
+    sa.Column('entries', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('user_id', 'task_id', 'week_start')
+    )
+    op.create_index(op.f('ix_timesheet_rollups_task_id'), 'timesheet_rollups', ['task_id'], unique=False)
+    # Fill it with `python -m app.commands.rebuild_timesheet_rollups` (make rebuild_rollups)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_timesheet_rollups_task_id'), table_name='timesheet_rollups')
+    op.drop_table('timesheet_rollups')
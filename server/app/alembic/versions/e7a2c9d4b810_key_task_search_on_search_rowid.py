@@ -0,0 +1,90 @@
+"""key task search on search_rowid
+
+Revision ID: e7a2c9d4b810
+Revises: b3d7f1a9c5e2
+Create Date: 2026-10-19 02:14:52.318406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a2c9d4b810'
+down_revision: Union[str, Sequence[str], None] = 'b3d7f1a9c5e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGGERS = ("tasks_fts_insert", "tasks_fts_delete", "tasks_fts_update")
+
+
+def _drop_search() -> None:
+    for trigger in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    op.execute("DROP TABLE IF EXISTS tasks_fts")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        # The tsvector lives on the row itself, nothing is keyed on the rowid
+        return
+    # The implicit rowid of tasks (no INTEGER PRIMARY KEY) can be renumbered by VACUUM,
+    # key the FTS5 rows on a stored integer instead
+    _drop_search()
+    op.execute("ALTER TABLE tasks ADD COLUMN search_rowid INTEGER")
+    op.execute("UPDATE tasks SET search_rowid = rowid")
+    op.execute("CREATE UNIQUE INDEX IF NOT EXISTS ix_tasks_search_rowid ON tasks (search_rowid)")
+    op.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5("
+        "title, description, content='tasks', content_rowid='search_rowid', tokenize='porter unicode61')"
+    )
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN "
+        "UPDATE tasks SET search_rowid = (SELECT coalesce(max(search_rowid), 0) + 1 FROM tasks) "
+        "WHERE rowid = new.rowid; "
+        "INSERT INTO tasks_fts (rowid, title, description) "
+        "SELECT search_rowid, title, description FROM tasks WHERE rowid = new.rowid; END"
+    )
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN "
+        "INSERT INTO tasks_fts (tasks_fts, rowid, title, description) "
+        "VALUES ('delete', old.search_rowid, old.title, old.description); END"
+    )
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN "
+        "INSERT INTO tasks_fts (tasks_fts, rowid, title, description) "
+        "VALUES ('delete', old.search_rowid, old.title, old.description); "
+        "INSERT INTO tasks_fts (rowid, title, description) VALUES (new.search_rowid, new.title, new.description); END"
+    )
+    op.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        return
+    _drop_search()
+    op.execute("DROP INDEX IF EXISTS ix_tasks_search_rowid")
+    op.execute("ALTER TABLE tasks DROP COLUMN search_rowid")
+    op.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5("
+        "title, description, content='tasks', tokenize='porter unicode61')"
+    )
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN "
+        "INSERT INTO tasks_fts (rowid, title, description) VALUES (new.rowid, new.title, new.description); END"
+    )
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN "
+        "INSERT INTO tasks_fts (tasks_fts, rowid, title, description) "
+        "VALUES ('delete', old.rowid, old.title, old.description); END"
+    )
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN "
+        "INSERT INTO tasks_fts (tasks_fts, rowid, title, description) "
+        "VALUES ('delete', old.rowid, old.title, old.description); "
+        "INSERT INTO tasks_fts (rowid, title, description) VALUES (new.rowid, new.title, new.description); END"
+    )
+    op.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
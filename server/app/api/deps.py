@@ -1,13 +1,24 @@
 import uuid
-from fastapi import Depends
+from collections.abc import AsyncGenerator, Generator
+from fastapi import Depends, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
-from typing import Annotated
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import Annotated, Optional
 
+from app.core import database
 from app.core.config import settings
-from app.core.database import SessionDep
+from app.core.database import (
+    AsyncSessionDep, DbSessionDep, RedisDep, RoutingSession, SessionDep, pick_replica, run_in_session
+)
 from app.core.security import decode_access_token
-from app.models.user import User
-from app.exceptions.user import InactiveUserException, UserNotFoundException, UnAuthorizedException
+from app.schemas.auth import UserPrincipal
+from app.schemas.pagination import PageParams
+from app.services import principal_service, redis_service
+from app.exceptions.user import (
+    InactiveUserException, NotSuperUserException, UserNotFoundException, UnAuthorizedException
+)
 
 # OAuth2 reusable token dependency
 reusable_oauth2 = OAuth2PasswordBearer(
@@ -17,21 +28,99 @@ reusable_oauth2 = OAuth2PasswordBearer(
 )
 TokenDep = Annotated[str, Depends(reusable_oauth2)]
 
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
 
 # -----------------------------
 # Current User Dependency
 # -----------------------------
-def get_current_user(session: SessionDep, token: TokenDep) -> User:
-    """ Return the current authenticated user. """
+async def get_current_user(request: Request, session: DbSessionDep, redis: RedisDep, token: TokenDep) -> UserPrincipal:
+    """ Return the current authenticated user (served from the principal cache). """
     if token is None:
         raise UnAuthorizedException()
-    user_id = decode_access_token(token=token)
-    user = session.get(User, uuid.UUID(user_id))
+    user_id = uuid.UUID(decode_access_token(token=token))
+    # Redis is called in the threadpool, only the database fallback goes through the session
+    # (on the async engine that runs on the event loop, where a blocking Redis call would stall it)
+    user = await run_in_threadpool(principal_service.get_cached_principal, redis=redis, user_id=user_id)
+    if user is None:
+        user = await run_in_session(session, principal_service.load_principal, user_id=user_id)
+        if user is not None:
+            await run_in_threadpool(principal_service.cache_principal, redis=redis, principal=user)
     if not user:
         raise UserNotFoundException()
     if not user.is_active:
         raise InactiveUserException()
+    if database.replica_engines and request.method not in SAFE_METHODS:
+        # The user is about to write, keep their reads on the primary for a while
+        await run_in_threadpool(
+            redis_service.mark_primary_sticky, redis=redis, user_id=user.id,
+            seconds=settings.DATABASE_REPLICA_STICKY_SECONDS)
     return user
 
 
-CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUser = Annotated[UserPrincipal, Depends(get_current_user)]
+
+
+def get_current_superuser(current_user: CurrentUser) -> UserPrincipal:
+    """ Return the current user if they are a superuser. """
+    if not current_user.is_superuser:
+        raise NotSuperUserException()
+    return current_user
+
+
+CurrentSuperUser = Annotated[UserPrincipal, Depends(get_current_superuser)]
+
+
+# -----------------------------
+# Read Session Dependency (replicas)
+# -----------------------------
+def _reads_from_primary(redis: RedisDep, token: str | None) -> bool:
+    if token is None:
+        return False
+    user_id = decode_access_token(token=token)
+    return redis_service.is_primary_sticky(redis=redis, user_id=uuid.UUID(user_id))
+
+
+def get_read_db(session: SessionDep, redis: RedisDep, token: TokenDep) -> Generator[Session, None, None]:
+    """ Session for GET routes: a replica, unless the user wrote in the sticky window. """
+    replica = pick_replica(database.replica_engines)
+    if replica is None or _reads_from_primary(redis, token):
+        yield session
+        return
+    with RoutingSession(bind=session.get_bind(), replica=replica) as read_session:
+        yield read_session
+
+
+async def get_async_read_db(session: AsyncSessionDep, redis: RedisDep, token: TokenDep) -> AsyncGenerator[AsyncSession, None]:
+    """ Async version of `get_read_db`. """
+    replica = pick_replica(database.async_replica_engines)
+    if replica is None or await run_in_threadpool(_reads_from_primary, redis, token):
+        yield session
+        return
+    async with AsyncSession(
+        session.bind,
+        sync_session_class=RoutingSession,
+        replica=replica.sync_engine,
+        expire_on_commit=False,
+    ) as read_session:
+        yield read_session
+
+
+ReadSessionDep = Annotated[
+    AsyncSession if settings.DATABASE_ASYNC else Session,
+    Depends(get_async_read_db if settings.DATABASE_ASYNC else get_read_db),
+]
+
+
+# -----------------------------
+# Pagination Dependency
+# -----------------------------
+def get_page_params(
+    limit: int = Query(default=settings.PAGE_DEFAULT_LIMIT, ge=1, le=settings.PAGE_MAX_LIMIT,
+                       description="Max items to return"),
+    cursor: Optional[str] = Query(default=None, description="next_cursor of the previous page"),
+) -> PageParams:
+    return PageParams(limit=limit, cursor=cursor)
+
+
+PageParamsDep = Annotated[PageParams, Depends(get_page_params)]
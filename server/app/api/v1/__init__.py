@@ -1,8 +1,14 @@
 from fastapi import APIRouter
-from app.api.v1 import auth, tag, workspace
+from app.api.v1 import auth, board, comment, project, system, tag, task, timesheet, workspace
 
 api_router = APIRouter()
 
 api_router.include_router(auth.router, prefix="/auth")
 api_router.include_router(workspace.router, prefix="/workspaces")
+api_router.include_router(project.router, prefix="/projects")
+api_router.include_router(task.router, prefix="/tasks")
+api_router.include_router(comment.router, prefix="/tasks")
+api_router.include_router(timesheet.router, prefix="/timesheets")
+api_router.include_router(board.router, prefix="/board")
 api_router.include_router(tag.router, prefix="/tags")
+api_router.include_router(system.router, prefix="/system")
@@ -1,11 +1,14 @@
-from fastapi import APIRouter, status, Depends
+import uuid
+from fastapi import APIRouter, Header, status, Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
-from typing import Annotated
+from redis.exceptions import RedisError
+from typing import Annotated, List, Optional
 
 from app.api.deps import CurrentUser
-from app.core.database import SessionDep, RedisDep
-from app.core.security import create_access_token, create_refresh_token, decode_refresh_token
-from app.services import user_service, redis_service, workspace_service
+from app.core.database import DbSessionDep, RedisDep, run_in_session
+from app.core.security import create_access_token, create_refresh_token, decode_refresh_token_payload
+from app.services import job_service, user_service, redis_service, workspace_service
 from app.exceptions.auth import InvalidTokenException
 from app.exceptions.user import UserAlreadyExistException, IncorrectCredsException, InactiveUserException
 from app.schemas.auth import (
@@ -16,6 +19,7 @@ from app.schemas.auth import (
     RefreshTokenSchema,
     RefreshTokenResponse,
     LogoutSchema,
+    RefreshSessionResponse,
 )
 
 router = APIRouter(tags=["Auth"])
@@ -26,16 +30,26 @@ router = APIRouter(tags=["Auth"])
     response_model=RegisterResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Register new user with email and password.")
-def auth_register(session: SessionDep, register_user: UserCreate):
-    user = user_service.get_user_by_email(
-        session=session, email=register_user.email)
+async def auth_register(session: DbSessionDep, redis: RedisDep, register_user: UserCreate):
+    user = await run_in_session(
+        session, user_service.get_user_by_email_detached, email=register_user.email)
     if user:
         raise UserAlreadyExistException()
-    new_user = user_service.create_new_user(
+    # Password is hashed on the dedicated pool, not the shared threadpool
+    new_user = await user_service.create_new_user_async(
         session=session, user_create=register_user)
-    # After creating user, create a personal workspace for the user
-    workspace_service.create_default_workspace_for_user(
-        session=session, user_id=new_user.id, user_name=new_user.full_name)
+    # The personal workspace is created by the worker, off the request
+    try:
+        await run_in_threadpool(
+            job_service.enqueue_job,
+            redis=redis, name="create_default_workspace",
+            kwargs={"user_id": new_user.id, "user_name": new_user.full_name},
+            idempotency_key=f"default-workspace:{new_user.id}")
+    except RedisError:
+        # The user is already committed, without the queue create it here
+        await run_in_session(
+            session, workspace_service.create_default_workspace_for_user,
+            user_id=new_user.id, user_name=new_user.full_name)
     return new_user
 
 
@@ -44,21 +58,29 @@ def auth_register(session: SessionDep, register_user: UserCreate):
     response_model=LoginResponse,
     status_code=status.HTTP_200_OK,
     summary="Login the user using email and password.")
-def auth_login(session: SessionDep, redis: RedisDep, form_data: Annotated[OAuth2PasswordRequestForm, Depends()]):
-    user = user_service.authenticate_user(
+async def auth_login(
+    session: DbSessionDep,
+    redis: RedisDep,
+    form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+    user_agent: Annotated[Optional[str], Header()] = None,
+):
+    user = await user_service.authenticate_user_async(
         session=session, email=form_data.username, password=form_data.password)
     if not user:
         raise IncorrectCredsException()
     if not user.is_active:
         raise InactiveUserException()
 
-    # Create access and refresh token
+    # Create access and refresh token, one refresh session per login (device)
+    session_id = uuid.uuid4().hex
     access_token = create_access_token(subject=user.id)
-    refresh_token = create_refresh_token(subject=user.id)
+    refresh_token = create_refresh_token(subject=user.id, session_id=session_id)
 
-    #  Store refresh token in redis for 7 days
-    redis_service.store_refresh_token_in_redis(
-        redis=redis, user_id=user.id, token=refresh_token)
+    #  Store refresh session in redis for 7 days
+    await run_in_threadpool(
+        redis_service.store_refresh_session,
+        redis=redis, user_id=user.id, session_id=session_id,
+        token=refresh_token, device=user_agent)
     return LoginResponse(
         access_token=access_token,
         refresh_token=refresh_token,
@@ -81,27 +103,20 @@ def auth_current_user(current_user: CurrentUser):
     status_code=status.HTTP_200_OK,
     summary="Refresh and get the new access token.")
 def auth_token_refresh(refresh_schema: RefreshTokenSchema, redis: RedisDep):
-    user_id = decode_refresh_token(token=refresh_schema.refresh_token)
+    payload = decode_refresh_token_payload(token=refresh_schema.refresh_token)
+    user_id, session_id = payload["sub"], payload["sid"]
 
-    # Get stored refresh token from Redis
-    stored_token = redis_service.get_refresh_token_from_redis(
-        redis=redis, user_id=user_id)
+    # Create new access and refresh token for the same session
+    access_token = create_access_token(subject=user_id)
+    refresh_token = create_refresh_token(subject=user_id, session_id=session_id)
 
-    # Check token validity
-    if not stored_token or stored_token != refresh_schema.refresh_token:
+    # Swap the stored refresh token for the new one (atomic compare-and-set)
+    rotated = redis_service.rotate_refresh_token(
+        redis=redis, user_id=user_id, session_id=session_id,
+        old_token=refresh_schema.refresh_token, new_token=refresh_token)
+    if not rotated:
         raise InvalidTokenException(
             detail="Refresh token is invalid or expired.")
-
-    # Delete old refresh token
-    redis_service.delete_refresh_token_from_Redis(redis=redis, user_id=user_id)
-
-    # Create new access and refresh token
-    access_token = create_access_token(subject=user_id)
-    refresh_token = create_refresh_token(subject=user_id)
-
-    #  Store new refresh token in redis for 7 days
-    redis_service.store_refresh_token_in_redis(
-        redis=redis, user_id=user_id, token=refresh_token)
     return RefreshTokenResponse(
         access_token=access_token,
         refresh_token=refresh_token
@@ -113,5 +128,25 @@ def auth_token_refresh(refresh_schema: RefreshTokenSchema, redis: RedisDep):
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Logout user.")
 def auth_logout(logout_schema: LogoutSchema, redis: RedisDep):
-    user_id = decode_refresh_token(token=logout_schema.refresh_token)
-    redis_service.delete_refresh_token_from_Redis(redis=redis, user_id=user_id)
+    payload = decode_refresh_token_payload(token=logout_schema.refresh_token)
+    redis_service.revoke_refresh_session(
+        redis=redis, user_id=payload["sub"], session_id=payload["sid"])
+
+
+@router.post(
+    "/logout-all",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Logout user from every device.")
+def auth_logout_all(redis: RedisDep, current_user: CurrentUser):
+    redis_service.revoke_all_refresh_sessions(
+        redis=redis, user_id=current_user.id)
+
+
+@router.get(
+    "/sessions",
+    response_model=List[RefreshSessionResponse],
+    status_code=status.HTTP_200_OK,
+    summary="List the current user's active sessions.")
+def auth_list_sessions(redis: RedisDep, current_user: CurrentUser):
+    return redis_service.list_refresh_sessions(
+        redis=redis, user_id=current_user.id)
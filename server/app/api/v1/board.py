@@ -0,0 +1,44 @@
+import uuid
+from fastapi import APIRouter, Query, status
+from fastapi.concurrency import run_in_threadpool
+from typing import Optional
+
+from app.core.database import DbSessionDep, RedisDep, run_in_session
+from app.api.deps import CurrentUser
+from app.services import access_service, board_service
+from app.schemas.board import BoardSummaryResponse
+from app.exceptions.project import ProjectNotFoundException
+
+router = APIRouter(tags=["Board"])
+
+
+@router.get("/summary",
+            response_model=BoardSummaryResponse,
+            status_code=status.HTTP_200_OK,
+            summary="Task counts by status and priority")
+async def board_summary_api(
+    session: DbSessionDep,
+    redis: RedisDep,
+    current_user: CurrentUser,
+    project_id: Optional[uuid.UUID] = Query(default=None, description="Project board, the user's own tasks if empty")
+):
+    """ Counts of a project's tasks, or of the current user's tasks, cached until one of them changes. """
+    if project_id is not None:
+        can_access = await run_in_session(
+            session, access_service.can_access_project, project_id=project_id, user_id=current_user.id)
+        if not can_access:
+            raise ProjectNotFoundException()
+        scope = {"project_id": project_id}
+    else:
+        scope = {"owner_id": current_user.id}
+
+    # Redis is called in the threadpool, only the GROUP BY goes through the session.
+    # The version is read before the query, a write made meanwhile bumps it past the stored one
+    summary, version = await run_in_threadpool(board_service.get_cached_board_summary, redis=redis, **scope)
+    if summary is None:
+        # Computed on the primary, a lagging replica would cache old counts under a new version
+        summary = await run_in_session(session, board_service.compute_board_summary, **scope)
+        if version is not None:
+            await run_in_threadpool(
+                board_service.store_board_summary, redis=redis, version=version, summary=summary, **scope)
+    return summary
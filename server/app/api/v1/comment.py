@@ -0,0 +1,66 @@
+import uuid
+from fastapi import APIRouter, status
+
+from app.core.database import DbSessionDep, run_in_session
+from app.api.deps import CurrentUser, PageParamsDep, ReadSessionDep
+from app.services import access_service, comment_service
+from app.schemas.comment import CommentCreate, CommentResponse, CommentUpdate
+from app.schemas.pagination import Page
+from app.exceptions.comment import CommentNotFoundException
+from app.exceptions.task import TaskNotFoundException
+
+router = APIRouter(tags=["Comment"])
+
+
+@router.post("/{task_id}/comments/",
+             response_model=CommentResponse,
+             status_code=status.HTTP_201_CREATED,
+             summary="Comment on a task")
+async def comment_create_api(session: DbSessionDep, task_id: uuid.UUID, comment_create: CommentCreate, current_user: CurrentUser):
+    can_access = await run_in_session(
+        session, access_service.can_access_task, task_id=task_id, user_id=current_user.id)
+    if not can_access:
+        raise TaskNotFoundException()
+    return await run_in_session(
+        session, comment_service.create_comment,
+        task_id=task_id, comment_create=comment_create, author_id=current_user.id)
+
+
+@router.get("/{task_id}/comments/",
+            response_model=Page[CommentResponse],
+            status_code=status.HTTP_200_OK,
+            summary="Get Task Comments, newest first")
+async def comment_list_api(session: ReadSessionDep, page: PageParamsDep, task_id: uuid.UUID, current_user: CurrentUser):
+    """ One query per page after the access check. """
+    can_access = await run_in_session(
+        session, access_service.can_access_task, task_id=task_id, user_id=current_user.id)
+    if not can_access:
+        raise TaskNotFoundException()
+    comments, next_cursor = await run_in_session(
+        session, comment_service.get_task_comments,
+        task_id=task_id, limit=page.limit, cursor=page.cursor)
+    return Page(items=comments, next_cursor=next_cursor)
+
+
+@router.patch("/{task_id}/comments/{comment_id}/",
+              response_model=CommentResponse,
+              status_code=status.HTTP_200_OK,
+              summary="Edit a comment")
+async def comment_update_api(
+    session: DbSessionDep,
+    task_id: uuid.UUID,
+    comment_id: uuid.UUID,
+    comment_update: CommentUpdate,
+    current_user: CurrentUser
+):
+    # The author may have lost access to the task since writing the comment
+    can_access = await run_in_session(
+        session, access_service.can_access_task, task_id=task_id, user_id=current_user.id)
+    if not can_access:
+        raise TaskNotFoundException()
+    comment = await run_in_session(
+        session, comment_service.update_comment,
+        task_id=task_id, comment_id=comment_id, comment_update=comment_update, author_id=current_user.id)
+    if comment is None:
+        raise CommentNotFoundException()
+    return comment
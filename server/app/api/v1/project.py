@@ -0,0 +1,72 @@
+import uuid
+from fastapi import APIRouter, Query, status
+from typing import Optional
+
+from app.core.database import DbSessionDep, run_in_session
+from app.api.deps import CurrentUser, PageParamsDep, ReadSessionDep
+from app.models.project import ProjectStatus
+from app.services import access_service, project_service
+from app.schemas.pagination import Page
+from app.schemas.project import ProjectCreate, ProjectResponse
+from app.exceptions.project import ProjectAlreadyExistException, ProjectNotFoundException
+from app.exceptions.workspace import WorkspaceNotFoundException
+
+router = APIRouter(tags=["Project"])
+
+
+@router.post("/",
+             response_model=ProjectResponse,
+             status_code=status.HTTP_201_CREATED,
+             summary="Create a new project in a workspace")
+async def project_create_api(session: DbSessionDep, project_create: ProjectCreate, current_user: CurrentUser):
+    can_access = await run_in_session(
+        session, access_service.can_access_workspace,
+        workspace_id=project_create.workspace_id, user_id=current_user.id)
+    if not can_access:
+        raise WorkspaceNotFoundException()
+    project_exist = await run_in_session(
+        session, project_service.check_project_name_exists_for_workspace,
+        workspace_id=project_create.workspace_id, project_name=project_create.name)
+    if project_exist:
+        raise ProjectAlreadyExistException()
+    project = await run_in_session(
+        session, project_service.create_project_service,
+        project_create=project_create, user_id=current_user.id)
+    return project
+
+
+@router.get("/",
+            response_model=Page[ProjectResponse],
+            status_code=status.HTTP_200_OK,
+            summary="Get Workspace Projects")
+async def project_list_api(
+    session: ReadSessionDep,
+    page: PageParamsDep,
+    workspace_id: uuid.UUID,
+    current_user: CurrentUser,
+    project_status: Optional[ProjectStatus] = Query(default=None, alias="status")
+):
+    can_access = await run_in_session(
+        session, access_service.can_access_workspace, workspace_id=workspace_id, user_id=current_user.id)
+    if not can_access:
+        raise WorkspaceNotFoundException()
+    projects, next_cursor = await run_in_session(
+        session, project_service.get_all_workspace_projects,
+        workspace_id=workspace_id, status=project_status, limit=page.limit, cursor=page.cursor)
+    return Page(items=projects, next_cursor=next_cursor)
+
+
+@router.get("/{project_id}/",
+            response_model=ProjectResponse,
+            status_code=status.HTTP_200_OK,
+            summary="Get Project Details")
+async def project_get_details_api(session: ReadSessionDep, project_id: uuid.UUID, current_user: CurrentUser):
+    can_access = await run_in_session(
+        session, access_service.can_access_project, project_id=project_id, user_id=current_user.id)
+    if not can_access:
+        raise ProjectNotFoundException()
+    project = await run_in_session(
+        session, project_service.get_project_details_by_id, project_id=project_id)
+    if project is None:
+        raise ProjectNotFoundException()
+    return project
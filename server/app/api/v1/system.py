@@ -0,0 +1,19 @@
+import os
+from fastapi import APIRouter, status
+
+from app.api.deps import CurrentSuperUser
+from app.core import database
+from app.core.pool import get_pool_stats
+from app.schemas.system import DbPoolStatsResponse
+
+router = APIRouter(tags=["System"])
+
+
+@router.get("/db-pool", response_model=DbPoolStatsResponse, status_code=status.HTTP_200_OK,
+            summary="Database connection pool stats")
+def db_pool_stats_api(current_user: CurrentSuperUser):
+    """ Live pool state and checkout wait metrics of this worker process. """
+    engines = {"sync": get_pool_stats(engine=database.engine)}
+    if database.async_engine is not None:
+        engines["async"] = get_pool_stats(engine=database.async_engine.sync_engine)
+    return DbPoolStatsResponse(pid=os.getpid(), engines=engines)
@@ -1,43 +1,79 @@
 from fastapi import APIRouter, Query, status
-from typing import List, Optional
+from fastapi.concurrency import run_in_threadpool
+from redis import Redis
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import Optional
 
-from app.core.database import SessionDep
-from app.services import tag_service
+from app.core.config import settings
+from app.core.database import DbSessionDep, RedisDep, run_in_session
+from app.services import tag_catalog_service, tag_service
+from app.services.tag_catalog_service import TagCatalog
+from app.schemas.pagination import Page
 from app.schemas.tag import (
     TagCreate,
     TagResponse
 )
 from app.exceptions.tag import TagAlreadyExistException
-from app.api.deps import CurrentUser
+from app.api.deps import CurrentUser, PageParamsDep, ReadSessionDep
 
 router = APIRouter(tags=["Tag"])
 
 
+async def _get_tag_catalog(session: Session | AsyncSession, redis: Redis) -> TagCatalog:
+    """ The Redis steps run in the threadpool, only the database load goes through the session. """
+    catalog = tag_catalog_service.get_cached_tag_catalog()
+    if catalog is None:
+        version = await run_in_threadpool(tag_catalog_service.read_tag_catalog_version, redis=redis)
+        catalog = await run_in_session(session, tag_catalog_service.load_tag_catalog, version=version)
+    return catalog
+
+
 @router.post(
     "/",
     response_model=TagResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create new tag")
-def tag_create_new_tag_api(session: SessionDep, tag_create: TagCreate, current_user: CurrentUser):
-    tag = tag_service.get_tag_by_name(
-        session=session, tag_name=tag_create.name)
+async def tag_create_new_tag_api(session: DbSessionDep, redis: RedisDep, tag_create: TagCreate, current_user: CurrentUser):
+    if settings.TAG_CATALOG_ENABLED:
+        catalog = await _get_tag_catalog(session, redis)
+        tag = catalog.get_by_name(tag_create.name)
+    else:
+        tag = await run_in_session(
+            session, tag_service.get_tag_by_name, tag_name=tag_create.name)
     if tag:
         raise TagAlreadyExistException()
-    new_tag = tag_service.create_new_tag(
-        session=session, tag_create=tag_create)
+    try:
+        new_tag = await run_in_session(
+            session, tag_service.create_new_tag, tag_create=tag_create)
+    except IntegrityError:
+        # Another worker's catalog had not seen this tag yet
+        raise TagAlreadyExistException()
+    await run_in_threadpool(tag_catalog_service.publish_tags_changed, redis=redis)
     return new_tag
 
 
 @router.get(
     "/search/",
-    response_model=List[TagResponse],
+    response_model=Page[TagResponse],
     status_code=status.HTTP_200_OK,
     summary="Search tags by query"
 )
-def tag_search_tags_api(
-    session: SessionDep,
-    q: Optional[str] = Query(default=None, description="Search query"),
-    current_user: CurrentUser = None
+async def tag_search_tags_api(
+    session: ReadSessionDep,
+    primary_session: DbSessionDep,
+    redis: RedisDep,
+    page: PageParamsDep,
+    current_user: CurrentUser,
+    q: Optional[str] = Query(default=None, description="Search query")
 ):
-    tags = tag_service.search_tags(session=session, query=q)
-    return tags
+    """ Exact match first, then prefix matches, then similar names. """
+    if settings.TAG_CATALOG_ENABLED:
+        # Loaded from the primary, a lagging replica would stamp old tags with a new version
+        catalog = await _get_tag_catalog(primary_session, redis)
+        tags, next_cursor = catalog.search(query=q, limit=page.limit, cursor=page.cursor)
+    else:
+        tags, next_cursor = await run_in_session(
+            session, tag_service.search_tags, query=q, limit=page.limit, cursor=page.cursor)
+    return Page(items=tags, next_cursor=next_cursor)
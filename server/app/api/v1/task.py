@@ -0,0 +1,68 @@
+import uuid
+from fastapi import APIRouter, Query, status
+from fastapi.concurrency import run_in_threadpool
+from typing import Optional
+
+from app.core.config import settings
+from app.core.database import DbSessionDep, RedisDep, run_in_session
+from app.api.deps import CurrentUser, PageParamsDep, ReadSessionDep
+from app.models.task import TaskPriority, TaskStatus
+from app.services import board_service, task_service
+from app.schemas.pagination import Page
+from app.schemas.task import TaskBulkCreateRequest, TaskBulkResponse, TaskBulkUpdateRequest, TaskResponse
+from app.exceptions.task import TaskBulkLimitException
+
+router = APIRouter(tags=["Task"])
+
+
+def _check_bulk_size(count: int) -> None:
+    if count > settings.TASK_BULK_MAX_ITEMS:
+        raise TaskBulkLimitException(detail=f"At most {settings.TASK_BULK_MAX_ITEMS} tasks per bulk request!")
+
+
+@router.post("/bulk",
+             response_model=TaskBulkResponse,
+             status_code=status.HTTP_200_OK,
+             summary="Create many tasks in one transaction")
+async def task_bulk_create_api(session: DbSessionDep, redis: RedisDep, bulk_create: TaskBulkCreateRequest, current_user: CurrentUser):
+    _check_bulk_size(len(bulk_create.tasks))
+    results, project_ids = await run_in_session(
+        session, task_service.bulk_create_tasks, tasks=bulk_create.tasks, owner_id=current_user.id)
+    await run_in_threadpool(
+        board_service.invalidate_board_summaries,
+        redis=redis, owner_ids=[current_user.id], project_ids=project_ids)
+    return TaskBulkResponse(results=results)
+
+
+@router.patch("/bulk",
+              response_model=TaskBulkResponse,
+              status_code=status.HTTP_200_OK,
+              summary="Change status, priority or archive flag of many tasks in one transaction")
+async def task_bulk_update_api(session: DbSessionDep, redis: RedisDep, bulk_update: TaskBulkUpdateRequest, current_user: CurrentUser):
+    _check_bulk_size(len(bulk_update.tasks))
+    results, project_ids = await run_in_session(
+        session, task_service.bulk_update_tasks, tasks=bulk_update.tasks, owner_id=current_user.id)
+    await run_in_threadpool(
+        board_service.invalidate_board_summaries,
+        redis=redis, owner_ids=[current_user.id], project_ids=project_ids)
+    return TaskBulkResponse(results=results)
+
+
+@router.get("/search/",
+            response_model=Page[TaskResponse],
+            status_code=status.HTTP_200_OK,
+            summary="Full-text search of tasks, best matches first")
+async def task_search_api(
+    session: ReadSessionDep,
+    page: PageParamsDep,
+    current_user: CurrentUser,
+    q: str = Query(min_length=1, max_length=200, description="Words to find in titles and descriptions"),
+    task_status: Optional[TaskStatus] = Query(default=None, alias="status"),
+    priority: Optional[TaskPriority] = Query(default=None),
+    owner_id: Optional[uuid.UUID] = Query(default=None)
+):
+    tasks, next_cursor = await run_in_session(
+        session, task_service.search_tasks,
+        query=q, user_id=current_user.id, status=task_status, priority=priority, owner_id=owner_id,
+        limit=page.limit, cursor=page.cursor)
+    return Page(items=tasks, next_cursor=next_cursor)
@@ -0,0 +1,101 @@
+import io
+import uuid
+from datetime import date, datetime, timezone
+from fastapi import APIRouter, Query, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from typing import List, Optional
+
+from app.core.database import DbSessionDep, SessionDep, run_in_session
+from app.api.deps import CurrentSuperUser, CurrentUser, ReadSessionDep
+from app.services import access_service, timesheet_import_service, timesheet_service
+from app.schemas.timesheet import (
+    TimesheetCreate,
+    TimesheetImportResponse,
+    TimesheetResponse,
+    TimesheetRollupResponse,
+    TimesheetUpdate)
+from app.exceptions.task import TaskNotFoundException
+from app.exceptions.timesheet import TimesheetNotFoundException
+
+router = APIRouter(tags=["Timesheet"])
+
+
+@router.post("/",
+             response_model=TimesheetResponse,
+             status_code=status.HTTP_201_CREATED,
+             summary="Log time on a task")
+async def timesheet_create_api(session: DbSessionDep, timesheet_create: TimesheetCreate, current_user: CurrentUser):
+    can_access = await run_in_session(
+        session, access_service.can_access_task, task_id=timesheet_create.task_id, user_id=current_user.id)
+    if not can_access:
+        raise TaskNotFoundException()
+    return await run_in_session(
+        session, timesheet_service.create_timesheet,
+        timesheet_create=timesheet_create, user_id=current_user.id)
+
+
+@router.post("/import/",
+             response_model=TimesheetImportResponse,
+             status_code=status.HTTP_200_OK,
+             summary="Import timesheets from a CSV file")
+async def timesheet_import_api(session: SessionDep, file: UploadFile, current_user: CurrentSuperUser):
+    """ CSV with the header user_email,task_id,work_date,hours,description, read in chunks.
+
+    Always on the sync engine in the threadpool, a large file must not hold the event loop.
+    """
+    lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        return await run_in_threadpool(
+            timesheet_import_service.import_timesheets, session=session, lines=lines)
+    finally:
+        lines.detach()
+
+
+@router.get("/weekly/",
+            response_model=List[TimesheetRollupResponse],
+            status_code=status.HTTP_200_OK,
+            summary="Hours per task in a week")
+async def timesheet_weekly_api(
+    session: ReadSessionDep,
+    current_user: CurrentUser,
+    week: Optional[date] = Query(default=None, description="Any day of the week, this week if empty"),
+    include_archived: bool = Query(default=False, description="Add the hours of tasks moved to the archive")
+):
+    return await run_in_session(
+        session, timesheet_service.get_user_week_rollups,
+        user_id=current_user.id, week=week or datetime.now(timezone.utc).date(),
+        include_archived=include_archived)
+
+
+@router.patch("/{timesheet_id}/",
+              response_model=TimesheetResponse,
+              status_code=status.HTTP_200_OK,
+              summary="Edit a timesheet")
+async def timesheet_update_api(
+    session: DbSessionDep,
+    timesheet_id: uuid.UUID,
+    timesheet_update: TimesheetUpdate,
+    current_user: CurrentUser
+):
+    if timesheet_update.task_id is not None:
+        can_access = await run_in_session(
+            session, access_service.can_access_task, task_id=timesheet_update.task_id, user_id=current_user.id)
+        if not can_access:
+            raise TaskNotFoundException()
+    timesheet = await run_in_session(
+        session, timesheet_service.update_timesheet,
+        timesheet_id=timesheet_id, timesheet_update=timesheet_update, user_id=current_user.id)
+    if timesheet is None:
+        raise TimesheetNotFoundException()
+    return timesheet
+
+
+@router.delete("/{timesheet_id}/",
+               status_code=status.HTTP_200_OK,
+               summary="Delete a timesheet")
+async def timesheet_delete_api(session: DbSessionDep, timesheet_id: uuid.UUID, current_user: CurrentUser):
+    deleted = await run_in_session(
+        session, timesheet_service.delete_timesheet, timesheet_id=timesheet_id, user_id=current_user.id)
+    if not deleted:
+        raise TimesheetNotFoundException()
+    return {"message": "Timesheet deleted successfully!"}
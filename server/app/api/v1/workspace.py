@@ -1,10 +1,14 @@
 import uuid
-from fastapi import APIRouter, status
-from typing import List
-
-from app.core.database import SessionDep
-from app.api.deps import CurrentUser
-from app.services import workspace_service
+from fastapi import APIRouter, BackgroundTasks, Query, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from redis.exceptions import RedisError
+from typing import List, Optional
+
+from app.core.database import DbSessionDep, RedisDep, SessionDep, run_in_session
+from app.api.deps import CurrentUser, PageParamsDep, ReadSessionDep
+from app.services import export_service, job_service, workspace_purge_service, workspace_service
+from app.schemas.pagination import Page
 from app.schemas.workspace import (
     WorkspaceResponse,
     WorkspaceCreate,
@@ -19,67 +23,103 @@ router = APIRouter(tags=["Workspace"])
              response_model=WorkspaceResponse,
              status_code=status.HTTP_201_CREATED,
              summary="Create a new workspace")
-def workspace_create_api(session: SessionDep, workspace_create: WorkspaceCreate, current_user: CurrentUser):
-    workspace_exist = workspace_service.check_workspace_exists_for_user(
-        session=session, user_id=current_user.id, workspace_name=workspace_create.name)
+async def workspace_create_api(session: DbSessionDep, workspace_create: WorkspaceCreate, current_user: CurrentUser):
+    workspace_exist = await run_in_session(
+        session, workspace_service.check_workspace_exists_for_user,
+        user_id=current_user.id, workspace_name=workspace_create.name)
     if workspace_exist:
         raise WorkspaceAlreadyExistException()
-    workspace = workspace_service.create_workspace_service(
-        session=session, workspace_create=workspace_create, user_id=current_user.id)
+    workspace = await run_in_session(
+        session, workspace_service.create_workspace_service,
+        workspace_create=workspace_create, user_id=current_user.id)
     return workspace
 
 
 @router.get("/",
-            response_model=List[WorkspaceResponse],
+            response_model=Page[WorkspaceResponse],
             status_code=status.HTTP_200_OK,
             summary="Get User Workspaces - Owned and Member")
-def workspace_get_api(session: SessionDep, current_user: CurrentUser):
-    workspaces = workspace_service.get_user_workspaces(
-        session=session, user_id=current_user.id)
-    return workspaces
+async def workspace_get_api(session: ReadSessionDep, page: PageParamsDep, current_user: CurrentUser):
+    workspaces, next_cursor = await run_in_session(
+        session, workspace_service.get_user_workspaces,
+        user_id=current_user.id, limit=page.limit, cursor=page.cursor)
+    return Page(items=workspaces, next_cursor=next_cursor)
 
 
 @router.get("/{workspace_id}/",
             response_model=WorkspaceResponse,
             status_code=status.HTTP_200_OK,
             summary="Get Workspace Details")
-def workspace_get_details_api(session: SessionDep, workspace_id: str, current_user: CurrentUser):
-    workspace = workspace_service.get_workspace_service(
-        session=session, workspace_id=uuid.UUID(workspace_id))
+async def workspace_get_details_api(session: ReadSessionDep, workspace_id: str, current_user: CurrentUser):
+    workspace = await run_in_session(
+        session, workspace_service.get_workspace_service, workspace_id=uuid.UUID(workspace_id))
     if workspace is None:
         raise WorkspaceNotFoundException()
     return workspace
 
 
+@router.get("/{workspace_id}/export/",
+            response_class=StreamingResponse,
+            status_code=status.HTTP_200_OK,
+            summary="Export workspace projects, tasks, comments and timesheets")
+async def workspace_export_api(
+    session: SessionDep,
+    workspace_id: uuid.UUID,
+    current_user: CurrentUser,
+    export_format: export_service.ExportFormat = Query(default="ndjson", alias="format"),
+    resource: Optional[export_service.ExportResource] = Query(default=None, description="Only this resource (CSV: projects if empty)"),
+    gzip: bool = Query(default=False, description="Gzip the export on the fly"),
+    include_archived: bool = Query(default=False, description="Add the tasks moved to the archive")
+):
+    """ Streamed from a server-side cursor on the sync engine (iterated in the threadpool). """
+    workspace = await run_in_session(session, workspace_service.get_workspace_service, workspace_id=workspace_id)
+    if workspace is None or workspace.owner_id != current_user.id:
+        raise WorkspaceNotFoundException(detail="Workspace not found or not allowed to export")
+
+    extension = export_format if export_format == "ndjson" or not resource else f"{resource}.csv"
+    filename = f"workspace-{workspace.slug}.{extension}{'.gz' if gzip else ''}"
+    media_type = "application/gzip" if gzip else ("application/x-ndjson" if export_format == "ndjson" else "text/csv")
+    return StreamingResponse(
+        export_service.iter_workspace_export(
+            session=session, workspace_id=workspace_id,
+            export_format=export_format, resource=resource, compress=gzip,
+            include_archived=include_archived),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.put("/{workspace_id}/",
             response_model=WorkspaceResponse,
             status_code=status.HTTP_200_OK,
             summary="Update workspace details")
-def workspace_update_api(
+async def workspace_update_api(
     workspace_id: str,
     workspace_update: WorkspaceUpdate,
-    session: SessionDep,
+    session: DbSessionDep,
     current_user: CurrentUser
 ):
     # First, get the current workspace
-    workspace = workspace_service.get_workspace_service(
-        session=session, workspace_id=uuid.UUID(workspace_id)
+    workspace = await run_in_session(
+        session, workspace_service.get_workspace_service, workspace_id=uuid.UUID(workspace_id)
     )
     if not workspace:
         raise WorkspaceNotFoundException(detail="Workspace not found")
 
     # Only check duplicate if name is changing
     if workspace_update.name and workspace_update.name != workspace.name:
-        workspace_exist = workspace_service.check_workspace_exists_for_user(
-            session=session, user_id=current_user.id, workspace_name=workspace_update.name
+        workspace_exist = await run_in_session(
+            session, workspace_service.check_workspace_exists_for_user,
+            user_id=current_user.id, workspace_name=workspace_update.name
         )
         if workspace_exist:
             raise WorkspaceAlreadyExistException(
                 detail="You already have a workspace with this name"
             )
 
-    updated_workspace = workspace_service.update_workspace_service(
-        session=session,
+    updated_workspace = await run_in_session(
+        session,
+        workspace_service.update_workspace_service,
         workspace_id=uuid.UUID(workspace_id),
         workspace_update=workspace_update,
         user_id=current_user.id
@@ -93,18 +133,56 @@ def workspace_update_api(
 
 
 @router.delete("/{workspace_id}/",
-               status_code=status.HTTP_200_OK,
+               status_code=status.HTTP_202_ACCEPTED,
                summary="Delete workspace by id")
-def workspace_delete_api(session: SessionDep, workspace_id: str):
-    delete_workspace = workspace_service.delete_workspace_service(
-        session=session, workspace_id=uuid.UUID(workspace_id))
+async def workspace_delete_api(
+    session: DbSessionDep,
+    redis: RedisDep,
+    workspace_id: uuid.UUID,
+    current_user: CurrentUser,
+    background_tasks: BackgroundTasks
+):
+    """ Hidden right away, its projects, tasks and members are purged by the worker. """
+    workspace = await run_in_session(session, workspace_service.get_workspace_service, workspace_id=workspace_id)
+    if workspace is None or workspace.owner_id != current_user.id:
+        raise WorkspaceNotFoundException(detail="Workspace not found or not allowed to delete")
+    delete_workspace = await run_in_session(
+        session, workspace_service.delete_workspace_service, workspace_id=workspace_id)
     if delete_workspace:
+        try:
+            await run_in_threadpool(
+                job_service.enqueue_job,
+                redis=redis, name="purge_workspace", kwargs={"workspace_id": workspace_id},
+                idempotency_key=f"purge-workspace:{workspace_id}")
+        except RedisError:
+            # The workspace is already hidden, without the queue purge it after the response
+            background_tasks.add_task(
+                run_in_session, session, workspace_purge_service.purge_workspace, workspace_id=workspace_id)
         return {"message": "Workspace deleted successfully!"}
     return {"error": "Failed to delete workspace", "status_code": status.HTTP_400_BAD_REQUEST}
 
 
 @router.post("/{workspace_id}/invite/",
-             status_code=status.HTTP_200_OK,
+             status_code=status.HTTP_202_ACCEPTED,
              summary="Invite user to workspace")
-def workspace_invite_user_api(session: SessionDep, workspace_invite: WorkspaceInviteRequest, current_user: CurrentUser):
-    pass
+async def workspace_invite_user_api(
+    session: DbSessionDep,
+    redis: RedisDep,
+    workspace_id: uuid.UUID,
+    workspace_invite: WorkspaceInviteRequest,
+    current_user: CurrentUser
+):
+    """ Checks the workspace, the invitation itself is created by the worker.
+
+    Not deduped by an idempotency key, a repeated invite updates the pending
+    invitation (see workspace_service.invite_user_to_workspace).
+    """
+    workspace = await run_in_session(session, workspace_service.get_workspace_service, workspace_id=workspace_id)
+    if workspace is None or workspace.owner_id != current_user.id:
+        raise WorkspaceNotFoundException(detail="Workspace not found or not allowed to invite")
+    await run_in_threadpool(
+        job_service.enqueue_job,
+        redis=redis, name="invite_user",
+        kwargs={"workspace_id": workspace_id, "inviter_id": current_user.id,
+                "email": workspace_invite.email, "role": workspace_invite.role})
+    return {"message": "Invitation sent!"}
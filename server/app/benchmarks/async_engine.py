@@ -0,0 +1,80 @@
+"""
+Benchmark: requests/sec of the sync engine vs the async engine (DATABASE_ASYNC)
+with many concurrent clients on an authenticated, database backed read endpoint.
+
+Each mode runs in its own process, since the engine is picked at import time.
+
+Run with:
+    uv run python -m app.benchmarks.async_engine
+"""
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+from app.core.config import settings
+
+CLIENTS = 200
+DURATION_SECONDS = 10
+TAGS = 500
+USER = {"full_name": "Bench User", "email": "bench@projex.com", "password": "bench-password"}
+
+
+async def client_loop(client, headers: dict, stop: asyncio.Event, latencies: list[float], errors: list[int]) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        response = await client.get(
+            f"{settings.API_V1_STR}/tags/search/", params={"q": "tag-1"}, headers=headers)
+        latencies.append(time.perf_counter() - started)
+        if response.status_code != 200:
+            errors.append(response.status_code)
+
+
+async def run_mode() -> None:
+    from sqlmodel import Session
+    from app.models.tag import Tag
+    from app.benchmarks.utils import benchmark_client, create_benchmark_engine, summarize
+
+    engine = create_benchmark_engine(name="async_engine")
+    with Session(engine) as session:
+        session.add_all(Tag(name=f"tag-{index}") for index in range(TAGS))
+        session.commit()
+
+    async with benchmark_client(engine=engine) as client:
+        await client.post(f"{settings.API_V1_STR}/auth/register", json=USER)
+        response = await client.post(
+            f"{settings.API_V1_STR}/auth/login",
+            data={"username": USER["email"], "password": USER["password"]})
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        stop = asyncio.Event()
+        latencies: list[float] = []
+        errors: list[int] = []
+        tasks = [asyncio.create_task(client_loop(client, headers, stop, latencies, errors))
+                 for _ in range(CLIENTS)]
+        started = time.perf_counter()
+        await asyncio.sleep(DURATION_SECONDS)
+        stop.set()
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+
+    mode = "async" if settings.DATABASE_ASYNC else "sync"
+    print(f"[{mode}] clients={CLIENTS} requests={len(latencies)} errors={len(errors)} "
+          f"throughput={len(latencies) / elapsed:,.0f} req/s")
+    summarize(f"[{mode}] /tags/search/", latencies)
+
+
+def main() -> None:
+    for database_async in ("false", "true"):
+        env = {**os.environ, "DATABASE_ASYNC": database_async}
+        subprocess.run(
+            [sys.executable, "-m", "app.benchmarks.async_engine", "--run"],
+            env=env, check=True)
+
+
+if __name__ == "__main__":
+    if "--run" in sys.argv:
+        asyncio.run(run_mode())
+    else:
+        main()
@@ -0,0 +1,89 @@
+"""
+Benchmark: paging through the projects of a workspace with 200k projects,
+LIMIT/OFFSET against the (created_at, id) keyset cursor, at growing depths.
+
+Run with:
+    uv run python -m app.benchmarks.pagination
+"""
+import uuid
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import Engine, insert
+from sqlmodel import Session, select
+
+from app.models.project import Project
+from app.models.user import User
+from app.models.workspace import Workspace
+from app.services.project_service import get_all_workspace_projects
+from app.benchmarks.utils import create_benchmark_engine, summarize, Timer
+from app.utils.cursor import encode_cursor
+
+PROJECTS = 200_000
+PAGE_SIZE = 20
+DEPTHS = (0, 1_000, 50_000, 199_000)
+SAMPLES = 20
+
+
+def seed(engine: Engine) -> uuid.UUID:
+    started = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    with Session(engine) as session:
+        user = User(full_name="Bench User", email="bench@projex.com", hashed_password="hashed")
+        session.add(user)
+        session.flush()
+        workspace = Workspace(name="Bench", slug="bench", owner_id=user.id)
+        session.add(workspace)
+        session.commit()
+        user_id, workspace_id = user.id, workspace.id
+    with engine.begin() as connection:
+        connection.execute(insert(Project), [
+            {
+                "id": uuid.uuid4(),
+                "name": f"project-{index}",
+                "created_at": started + timedelta(seconds=index),
+                "updated_at": started,
+                "owner_id": user_id,
+                "workspace_id": workspace_id,
+            }
+            for index in range(PROJECTS)
+        ])
+    return workspace_id
+
+
+def offset_page(*, session: Session, workspace_id: uuid.UUID, offset: int) -> list[Project]:
+    """ The OFFSET equivalent: the database still walks every skipped row. """
+    return list(session.exec(
+        select(Project)
+        .where(Project.workspace_id == workspace_id)
+        .order_by(Project.created_at, Project.id)
+        .offset(offset)
+        .limit(PAGE_SIZE)
+    ).all())
+
+
+def main() -> None:
+    engine = create_benchmark_engine(name="pagination")
+    workspace_id = seed(engine)
+    print(f"{PROJECTS:,} projects in one workspace, pages of {PAGE_SIZE}")
+
+    with Session(engine) as session:
+        for depth in DEPTHS:
+            # Cursor of the row just before the page, as the previous page would return it
+            cursor = None
+            if depth:
+                before = offset_page(session=session, workspace_id=workspace_id, offset=depth - 1)[0]
+                cursor = encode_cursor([before.created_at.isoformat(), str(before.id)])
+
+            offset_samples: list[float] = []
+            keyset_samples: list[float] = []
+            for _ in range(SAMPLES):
+                with Timer(offset_samples):
+                    by_offset = offset_page(session=session, workspace_id=workspace_id, offset=depth)
+                with Timer(keyset_samples):
+                    by_cursor, _ = get_all_workspace_projects(
+                        session=session, workspace_id=workspace_id, limit=PAGE_SIZE, cursor=cursor)
+            assert [project.id for project in by_offset] == [project.id for project in by_cursor]
+            summarize(f"offset  depth={depth}", offset_samples)
+            summarize(f"keyset  depth={depth}", keyset_samples)
+
+
+if __name__ == "__main__":
+    main()
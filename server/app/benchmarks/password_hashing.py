@@ -0,0 +1,71 @@
+"""
+Benchmark: `/auth/me` latency while logins saturate the password hashing pool.
+
+Run with:
+    uv run python -m app.benchmarks.password_hashing
+"""
+import asyncio
+import time
+
+from app.core.config import settings
+from app.core.security import shutdown_password_executor
+from app.benchmarks.utils import benchmark_client, create_benchmark_engine, summarize, Timer
+
+USER = {"full_name": "Bench User", "email": "bench@projex.com", "password": "bench-password"}
+LOGIN_CLIENTS = 100
+ME_REQUESTS = 500
+STORM_SECONDS = 10
+RETRY_AFTER_SECONDS = 0.1
+
+
+async def measure_me(client, headers: dict, samples: list[float], count: int) -> None:
+    for _ in range(count):
+        with Timer(samples):
+            response = await client.get(f"{settings.API_V1_STR}/auth/me", headers=headers)
+        assert response.status_code == 200
+
+
+async def login_storm(client, stop: asyncio.Event, results: dict[int, int]) -> None:
+    form = {"username": USER["email"], "password": USER["password"]}
+    while not stop.is_set():
+        response = await client.post(f"{settings.API_V1_STR}/auth/login", data=form)
+        results[response.status_code] = results.get(response.status_code, 0) + 1
+        if response.status_code == 503:
+            await asyncio.sleep(RETRY_AFTER_SECONDS)  # Well behaved clients back off
+
+
+async def main() -> None:
+    engine = create_benchmark_engine(name="password_hashing")
+    async with benchmark_client(engine=engine) as client:
+        await client.post(f"{settings.API_V1_STR}/auth/register", json=USER)
+        response = await client.post(
+            f"{settings.API_V1_STR}/auth/login",
+            data={"username": USER["email"], "password": USER["password"]})
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        idle: list[float] = []
+        await measure_me(client, headers, idle, ME_REQUESTS)
+
+        stop = asyncio.Event()
+        results: dict[int, int] = {}
+        storm = [asyncio.create_task(login_storm(client, stop, results))
+                 for _ in range(LOGIN_CLIENTS)]
+        await asyncio.sleep(1)  # Let the pool fill up
+
+        busy: list[float] = []
+        started = time.perf_counter()
+        while time.perf_counter() - started < STORM_SECONDS and len(busy) < ME_REQUESTS:
+            await measure_me(client, headers, busy, 10)
+        stop.set()
+        await asyncio.gather(*storm)
+
+    shutdown_password_executor()
+    print(f"executor={settings.PASSWORD_HASH_EXECUTOR} workers={settings.PASSWORD_HASH_WORKERS} "
+          f"max_pending={settings.PASSWORD_HASH_MAX_PENDING} login_clients={LOGIN_CLIENTS}")
+    summarize("/auth/me idle", idle)
+    summarize("/auth/me during login storm", busy)
+    print(f"login responses by status: {dict(sorted(results.items()))}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,95 @@
+"""
+Benchmark: tag autocomplete over 1M tags, the old unbounded ILIKE '%q%' against
+the ranked, LIMITed search_tags.
+
+Runs on SQLite by default. Point BENCH_DATABASE_URL at a scratch Postgres
+database (the pg_trgm extension must be available) to measure the trigram indexes:
+    BENCH_DATABASE_URL=postgresql://... uv run python -m app.benchmarks.tag_search
+
+Run with:
+    uv run python -m app.benchmarks.tag_search
+"""
+import os
+import random
+import uuid
+from sqlalchemy import Engine, insert, text
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.models.tag import Tag
+from app.services.tag_service import search_tags
+from app.benchmarks.utils import create_benchmark_engine, summarize, Timer
+
+TAGS = 1_000_000
+BATCH = 50_000
+SEARCHES = 200
+LEGACY_SEARCHES = 20
+WORDS = [
+    "backend", "frontend", "bug", "feature", "design", "mobile", "android", "ios",
+    "flutter", "api", "database", "urgent", "review", "testing", "release", "docs",
+    "infra", "security", "performance", "billing", "onboarding", "analytics",
+]
+# Keystrokes of an autocomplete session, including a typo
+QUERIES = ["b", "ba", "bac", "back", "backend", "backend-api", "fl", "flut", "flutter-mob", "bakend", "rev"]
+
+
+def create_engine_for_benchmark() -> Engine:
+    url = os.environ.get("BENCH_DATABASE_URL")
+    if not url:
+        return create_benchmark_engine(name="tag_search")
+    engine = create_engine(url)
+    with engine.begin() as connection:
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def seed(engine: Engine) -> None:
+    rng = random.Random(42)
+    with engine.begin() as connection:
+        for start in range(0, TAGS, BATCH):
+            connection.execute(insert(Tag), [
+                {"id": uuid.uuid4(), "name": f"{rng.choice(WORDS)}-{rng.choice(WORDS)}-{index}",
+                 "color_hex": "#3B82F6"}
+                for index in range(start, start + BATCH)
+            ])
+        if engine.dialect.name == "postgresql":
+            connection.execute(text("ANALYZE tags"))
+
+
+def legacy_search(*, session: Session, query: str) -> list[Tag]:
+    """ The previous search: unbounded ILIKE '%q%'. """
+    return session.exec(select(Tag).where(Tag.name.ilike(f"%{query}%"))).all()
+
+
+def main() -> None:
+    engine = create_engine_for_benchmark()
+    seed(engine)
+    print(f"{TAGS:,} tags on {engine.dialect.name}")
+
+    with Session(engine) as session:
+        legacy: list[float] = []
+        for index in range(LEGACY_SEARCHES):
+            with Timer(legacy):
+                legacy_search(session=session, query=QUERIES[index % len(QUERIES)])
+        summarize("legacy ILIKE, no limit", legacy)
+
+        ranked: list[float] = []
+        for index in range(SEARCHES):
+            with Timer(ranked):
+                search_tags(session=session, query=QUERIES[index % len(QUERIES)], limit=20)
+        summarize("ranked search, limit=20", ranked)
+
+        per_query = {}
+        for query in QUERIES:
+            samples: list[float] = []
+            for _ in range(5):
+                with Timer(samples):
+                    search_tags(session=session, query=query, limit=20)
+            per_query[query] = samples
+        for query, samples in per_query.items():
+            summarize(f"  q={query!r}", samples)
+
+
+if __name__ == "__main__":
+    main()
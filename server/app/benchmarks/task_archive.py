@@ -0,0 +1,81 @@
+"""
+Benchmark: board summary of a user whose history is mostly archived tasks,
+with the archived rows still in `tasks` and after archive_tasks moved them to
+tasks_archive, plus the archival throughput.
+
+Run with:
+    uv run python -m app.benchmarks.task_archive
+"""
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import func, insert, select
+from sqlmodel import Session
+
+from app.models.comment import Comment
+from app.models.task import Task, TaskPriority, TaskStatus
+from app.models.user import User
+from app.services.archive_service import archive_tasks
+from app.services.board_service import compute_board_summary
+from app.benchmarks.utils import create_benchmark_engine, summarize, Timer
+
+TASKS = 200_000
+# Share of the history archived long ago
+ARCHIVED = 0.9
+BATCH = 20_000
+SUMMARIES = 50
+
+
+def seed(session: Session) -> uuid.UUID:
+    rng = random.Random(42)
+    now = datetime.now(timezone.utc)
+    user = User(full_name="Bench User", email="bench@projex.com", hashed_password="hashed")
+    session.add(user)
+    session.commit()
+    for start in range(0, TASKS, BATCH):
+        rows = []
+        for _ in range(BATCH):
+            archived = rng.random() < ARCHIVED
+            rows.append({
+                "id": uuid.uuid4(), "title": "Task", "is_archived": archived,
+                "archived_at": now - timedelta(days=rng.randint(100, 1000)) if archived else None,
+                "status": rng.choice(list(TaskStatus)), "priority": rng.choice(list(TaskPriority)),
+                "progress_percentage": 0, "owner_id": user.id,
+                "due_date": now + timedelta(days=rng.randint(-30, 30)), "created_at": now, "updated_at": now,
+            })
+        session.execute(insert(Task), rows)
+        session.execute(insert(Comment), [
+            {"id": uuid.uuid4(), "content": "Noted", "is_edited": False, "author_id": user.id,
+             "task_id": row["id"], "created_at": now, "updated_at": now}
+            for row in rows[::4]
+        ])
+        session.commit()
+    return user.id
+
+
+def board(session: Session, user_id: uuid.UUID, name: str) -> None:
+    samples: list[float] = []
+    for _ in range(SUMMARIES):
+        with Timer(samples):
+            compute_board_summary(session=session, owner_id=user_id)
+    rows = session.execute(select(func.count()).select_from(Task)).scalar_one()
+    summarize(f"{name} ({rows:,} rows)", samples)
+
+
+def main() -> None:
+    engine = create_benchmark_engine(name="task_archive")
+    with Session(engine) as session:
+        user_id = seed(session)
+        board(session, user_id, "board, history in tasks")
+
+        started = time.perf_counter()
+        moved = archive_tasks(session=session, older_than_days=90, batch_size=500)
+        elapsed = time.perf_counter() - started
+        print(f"archived {moved:,} tasks (with comments) in {elapsed:.1f}s, {moved / elapsed:,.0f} tasks/s")
+
+        board(session, user_id, "board, history archived")
+
+
+if __name__ == "__main__":
+    main()
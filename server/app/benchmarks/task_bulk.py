@@ -0,0 +1,89 @@
+"""
+Benchmark: creating and re-prioritising 500 tasks one at a time (commit and
+refresh per task, as the other create_* services do) against the bulk task
+services (one transaction, one INSERT, one UPDATE per distinct change).
+
+Run with:
+    uv run python -m app.benchmarks.task_bulk
+"""
+from sqlalchemy import Engine, event
+from sqlmodel import Session
+
+from app.models.task import Task, TaskPriority
+from app.models.user import User
+from app.schemas.task import TaskBulkUpdate, TaskCreate
+from app.services.task_service import bulk_create_tasks, bulk_update_tasks
+from app.benchmarks.utils import create_benchmark_engine, summarize, Timer
+
+TASKS = 500
+ROUNDS = 5
+
+
+def per_item(*, session: Session, tasks: list[TaskCreate], owner_id) -> list:
+    """ A commit and refresh per task, like the other create_* services. """
+    created = []
+    for task in tasks:
+        task_obj = Task.model_validate(task, update={"owner_id": owner_id})
+        session.add(task_obj)
+        session.commit()
+        session.refresh(task_obj)
+        created.append(task_obj)
+    return [task.id for task in created]
+
+
+def per_item_update(*, session: Session, ids: list, owner_id) -> None:
+    for task_id in ids:
+        task = session.get(Task, task_id)
+        task.priority = TaskPriority.URGENT
+        session.add(task)
+        session.commit()
+        session.refresh(task)
+
+
+def bulk(*, session: Session, tasks: list[TaskCreate], owner_id) -> list:
+    results, _ = bulk_create_tasks(session=session, tasks=tasks, owner_id=owner_id)
+    return [result.id for result in results]
+
+
+def bulk_update(*, session: Session, ids: list, owner_id) -> None:
+    bulk_update_tasks(
+        session=session, owner_id=owner_id,
+        tasks=[TaskBulkUpdate(id=task_id, priority=TaskPriority.URGENT) for task_id in ids])
+
+
+def count_statements(engine: Engine) -> list[str]:
+    statements: list[str] = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def main() -> None:
+    engine = create_benchmark_engine(name="task_bulk")
+    with Session(engine) as session:
+        user = User(full_name="Bench User", email="bench@projex.com", hashed_password="hashed")
+        session.add(user)
+        session.commit()
+        owner_id = user.id
+    statements = count_statements(engine)
+    tasks = [TaskCreate(title=f"Task {index}") for index in range(TASKS)]
+    print(f"{TASKS} tasks per call, sqlite")
+
+    for name, create, update in (("per item", per_item, per_item_update), ("bulk", bulk, bulk_update)):
+        create_samples: list[float] = []
+        update_samples: list[float] = []
+        for _ in range(ROUNDS):
+            with Session(engine) as session:
+                statements.clear()
+                with Timer(create_samples):
+                    ids = create(session=session, tasks=tasks, owner_id=owner_id)
+                create_statements = len(statements)
+                statements.clear()
+                with Timer(update_samples):
+                    update(session=session, ids=ids, owner_id=owner_id)
+                update_statements = len(statements)
+        summarize(f"{name} create ({create_statements} stmts)", create_samples)
+        summarize(f"{name} update ({update_statements} stmts)", update_samples)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark: task search over 200k tasks, an ILIKE '%q%' scan of title and
+description against the full-text search_tasks (FTS5 on SQLite, the GIN
+indexed tsvector on Postgres).
+
+Runs on SQLite by default. Point BENCH_DATABASE_URL at a scratch Postgres
+database to measure the tsvector column and its GIN index:
+    BENCH_DATABASE_URL=postgresql://... uv run python -m app.benchmarks.task_search
+
+Run with:
+    uv run python -m app.benchmarks.task_search
+"""
+import os
+import random
+import uuid
+from datetime import datetime, timezone
+from sqlalchemy import Engine, insert, or_, text
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.models.task import Task, TaskPriority, TaskStatus
+from app.models.user import User
+from app.services.task_service import search_tasks
+from app.benchmarks.utils import create_benchmark_engine, summarize, Timer
+
+TASKS = 200_000
+BATCH = 20_000
+SEARCHES = 50
+# Zipf-like vocabulary, a few common words and a long tail like real task text
+VOCABULARY = [f"word{index}" for index in range(20_000)]
+WEIGHTS = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+# Common, mid-frequency, rare, two words, and a typo matching nothing
+QUERIES = ["word3", "word250", "word9000", "word40 word41", "wrod250"]
+
+
+def create_engine_for_benchmark() -> Engine:
+    url = os.environ.get("BENCH_DATABASE_URL")
+    if not url:
+        return create_benchmark_engine(name="task_search")
+    engine = create_engine(url)
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def seed(engine: Engine) -> uuid.UUID:
+    """ Insert the tasks, all owned by one user. Returns the user's id. """
+    rng = random.Random(42)
+    now = datetime.now(timezone.utc)
+    with engine.begin() as connection:
+        owner_id = uuid.uuid4()
+        connection.execute(insert(User), [{
+            "id": owner_id, "full_name": "Bench User", "email": "bench@projex.com",
+            "hashed_password": "hashed", "is_active": True, "is_superuser": False,
+            "created_at": now, "updated_at": now,
+        }])
+        for start in range(0, TASKS, BATCH):
+            connection.execute(insert(Task), [
+                {"id": uuid.uuid4(), "title": " ".join(rng.choices(VOCABULARY, WEIGHTS, k=5)),
+                 "description": " ".join(rng.choices(VOCABULARY, WEIGHTS, k=40)), "is_archived": False,
+                 "status": rng.choice(list(TaskStatus)), "priority": rng.choice(list(TaskPriority)),
+                 "progress_percentage": 0, "owner_id": owner_id, "created_at": now, "updated_at": now}
+                for _ in range(start, start + BATCH)
+            ])
+        if engine.dialect.name == "postgresql":
+            connection.execute(text("ANALYZE tasks"))
+    return owner_id
+
+
+def legacy_search(*, session: Session, query: str) -> list[Task]:
+    """ ILIKE on title and description, first page only. """
+    pattern = f"%{query}%"
+    return session.exec(
+        select(Task).where(or_(Task.title.ilike(pattern), Task.description.ilike(pattern))).limit(20)
+    ).all()
+
+
+def main() -> None:
+    engine = create_engine_for_benchmark()
+    user_id = seed(engine)
+    print(f"{TASKS:,} tasks on {engine.dialect.name}")
+
+    with Session(engine) as session:
+        for name, search in (
+            ("ILIKE title/description", lambda query: legacy_search(session=session, query=query)),
+            ("full-text, ranked, limit=20", lambda query: search_tasks(session=session, query=query, user_id=user_id, limit=20)),
+            ("full-text + status filter", lambda query: search_tasks(
+                session=session, query=query, user_id=user_id, status=TaskStatus.IN_REVIEW, limit=20)),
+        ):
+            samples: list[float] = []
+            for index in range(SEARCHES):
+                with Timer(samples):
+                    search(QUERIES[index % len(QUERIES)])
+            summarize(name, samples)
+        for query in QUERIES:
+            for name, search in (
+                ("ILIKE", lambda: legacy_search(session=session, query=query)),
+                ("full-text", lambda: search_tasks(session=session, query=query, user_id=user_id, limit=20)),
+            ):
+                samples = []
+                for _ in range(5):
+                    with Timer(samples):
+                        search()
+                summarize(f"  {name} q={query!r}", samples)
+
+
+if __name__ == "__main__":
+    main()
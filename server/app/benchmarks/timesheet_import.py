@@ -0,0 +1,57 @@
+"""
+Benchmark: streaming timesheet CSV import, rows/s and peak Python memory
+(tracemalloc) for growing files, to show memory stays flat with file size.
+
+Run with:
+    uv run python -m app.benchmarks.timesheet_import
+"""
+import os
+import tempfile
+import time
+import tracemalloc
+from sqlmodel import Session
+
+from app.models.task import Task
+from app.models.user import User
+from app.services.timesheet_import_service import import_timesheets
+from app.benchmarks.utils import create_benchmark_engine
+
+SIZES = (50_000, 200_000, 400_000)
+TASKS = 50
+
+
+def write_csv(path: str, *, rows: int, email: str, task_ids: list) -> None:
+    with open(path, "w", newline="") as file:
+        file.write("user_email,task_id,work_date,hours,description\n")
+        for index in range(rows):
+            file.write(f"{email},{task_ids[index % TASKS]},2025-{index % 12 + 1:02d}-{index % 28 + 1:02d},1.5,Imported {index}\n")
+
+
+def main() -> None:
+    for rows in SIZES:
+        engine = create_benchmark_engine(name=f"timesheet_import_{rows}")
+        with Session(engine) as session:
+            user = User(full_name="Bench User", email="bench@projex.com", hashed_password="hashed")
+            session.add(user)
+            session.flush()
+            tasks = [Task(title=f"Task {index}", owner_id=user.id) for index in range(TASKS)]
+            session.add_all(tasks)
+            session.commit()
+            email, task_ids = user.email, [task.id for task in tasks]
+
+        path = os.path.join(tempfile.mkdtemp(prefix="projex-"), "timesheets.csv")
+        write_csv(path, rows=rows, email=email, task_ids=task_ids)
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        with open(path, newline="") as lines, Session(engine) as session:
+            report = import_timesheets(session=session, lines=lines)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"rows={rows:<8,} imported={report.imported:<8,} {rows / elapsed:>9,.0f} rows/s "
+              f"peak={peak / 2**20:6.1f} MiB  file={os.path.getsize(path) / 2**20:6.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import os
+import statistics
+import tempfile
+import time
+import fakeredis
+from collections.abc import AsyncIterator, Generator
+from contextlib import asynccontextmanager
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import Engine
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.main import app
+from app.core.config import settings
+from app.core.database import get_db, get_async_db, get_redis
+from app.models import *
+
+
+def create_benchmark_engine(*, name: str = "benchmark") -> Engine:
+    """ Create a fresh file backed SQLite database for a benchmark run. """
+    path = os.path.join(tempfile.mkdtemp(prefix="projex-"), f"{name}.db")
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False},
+    )
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+@asynccontextmanager
+async def benchmark_client(*, engine: Engine) -> AsyncIterator[AsyncClient]:
+    """ In-process client against the app with SQLite and a fake Redis. """
+    fake_redis = fakeredis.FakeStrictRedis()
+
+    def get_db_override() -> Generator[Session, None, None]:
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_db] = get_db_override
+    app.dependency_overrides[get_redis] = lambda: fake_redis
+
+    async_engine = None
+    if settings.DATABASE_ASYNC:
+        async_engine = create_async_engine(
+            engine.url.set(drivername="sqlite+aiosqlite"))
+
+        async def get_async_db_override() -> AsyncIterator[AsyncSession]:
+            async with AsyncSession(async_engine, expire_on_commit=False) as session:
+                yield session
+
+        app.dependency_overrides[get_async_db] = get_async_db_override
+
+    transport = ASGITransport(app=app)
+    try:
+        async with AsyncClient(transport=transport, base_url="http://bench") as client:
+            yield client
+    finally:
+        app.dependency_overrides.clear()
+        if async_engine is not None:
+            await async_engine.dispose()
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """ Return the given percentile (0-100) of the samples. """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(name: str, samples: list[float]) -> None:
+    """ Print p50/p95/p99 latency (ms) of the samples. """
+    print(
+        f"{name:<32} n={len(samples):<6} "
+        f"p50={percentile(samples, 50) * 1000:8.2f}ms "
+        f"p95={percentile(samples, 95) * 1000:8.2f}ms "
+        f"p99={percentile(samples, 99) * 1000:8.2f}ms "
+        f"mean={statistics.fmean(samples) * 1000 if samples else 0:8.2f}ms"
+    )
+
+
+class Timer:
+    """ Small context manager that records elapsed seconds into a list. """
+
+    def __init__(self, samples: list[float]):
+        self.samples = samples
+
+    def __enter__(self) -> "Timer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.samples.append(time.perf_counter() - self.start)
@@ -0,0 +1,76 @@
+"""
+Benchmark: streaming a workspace export of 1M tasks as NDJSON (plain and
+gzipped), rows/s and the process' peak RSS, against materialising the same
+rows with `session.exec(...).all()`.
+
+The streamed export runs first, the RSS high-water mark only grows.
+
+Run with:
+    uv run python -m app.benchmarks.workspace_export
+"""
+import resource
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from sqlalchemy import insert
+from sqlmodel import Session, col, select
+
+from app.models.project import Project
+from app.models.task import Task, TaskPriority, TaskStatus
+from app.models.user import User
+from app.models.workspace import Workspace
+from app.services.export_service import iter_workspace_export
+from app.benchmarks.utils import create_benchmark_engine
+
+ROWS = 1_000_000
+INSERT_BATCH = 5_000
+
+
+def peak_rss_mib() -> float:
+    # ru_maxrss is in KiB on Linux, in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def main() -> None:
+    engine = create_benchmark_engine(name="workspace_export")
+    with Session(engine) as session:
+        user = User(full_name="Bench User", email="bench@projex.com", hashed_password="hashed")
+        workspace = Workspace(name="Bench", slug="bench", owner_id=user.id)
+        project = Project(name="Bench", owner_id=user.id, workspace_id=workspace.id)
+        session.add_all([user, workspace, project])
+        session.commit()
+        user_id, workspace_id, project_id = user.id, workspace.id, project.id
+
+        now = datetime.now(timezone.utc)
+        for start in range(0, ROWS, INSERT_BATCH):
+            session.execute(insert(Task.__table__), [
+                {"id": uuid.uuid4(), "title": f"Task {index}", "description": f"Exported task number {index}",
+                 "is_archived": False, "status": TaskStatus.DRAFT, "priority": TaskPriority.MEDIUM,
+                 "progress_percentage": 0, "owner_id": user_id, "project_id": project_id,
+                 "created_at": now, "updated_at": now}
+                for index in range(start, start + INSERT_BATCH)
+            ])
+            session.commit()
+    print(f"rows={ROWS:,} rss after setup={peak_rss_mib():7.1f} MiB")
+
+    for compress in (False, True):
+        with Session(engine) as session:
+            started = time.perf_counter()
+            size = sum(len(chunk) for chunk in iter_workspace_export(
+                session=session, workspace_id=workspace_id, resource="tasks", compress=compress))
+            elapsed = time.perf_counter() - started
+        print(f"stream  gzip={compress!s:<5} {ROWS / elapsed:>9,.0f} rows/s  "
+              f"out={size / 2**20:7.1f} MiB  peak rss={peak_rss_mib():7.1f} MiB")
+
+    with Session(engine) as session:
+        started = time.perf_counter()
+        tasks = session.exec(select(Task).where(col(Task.project_id) == project_id)).all()
+        elapsed = time.perf_counter() - started
+        print(f".all()               {len(tasks) / elapsed:>9,.0f} rows/s  "
+              f"{'':>16}  peak rss={peak_rss_mib():7.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
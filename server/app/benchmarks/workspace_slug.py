@@ -0,0 +1,108 @@
+"""
+Benchmark: slug allocation for a name that already has 10k colliding workspaces
+(every user gets "<Name>'s Workspace"), the old per-collision loop against the
+single query allocator, plus concurrent creations racing for the same slug.
+
+Run with:
+    uv run python -m app.benchmarks.workspace_slug
+"""
+import threading
+from sqlalchemy import Engine, event
+from sqlmodel import Session, select
+
+from app.models.user import User
+from app.models.workspace import Workspace
+from app.schemas.workspace import WorkspaceCreate
+from app.services.workspace_service import create_workspace_service
+from app.utils.text import slugify
+from app.utils.workspace_slug import generate_unique_workspace_slug
+from app.benchmarks.utils import create_benchmark_engine, summarize, Timer
+
+NAME = "John's Workspace"
+COLLISIONS = 10_000
+ALLOCATIONS = 200
+LEGACY_ALLOCATIONS = 5
+RACE_THREADS = 8
+RACE_CREATES_PER_THREAD = 25
+
+
+def legacy_generate_slug(*, session: Session, base_name: str) -> str:
+    """ The previous allocator: one SELECT per taken slug. """
+    base_slug = slugify(base_name)
+    slug = base_slug
+    counter = 1
+    while session.exec(select(Workspace).where(Workspace.slug == slug)).first():
+        slug = f"{base_slug}-{counter}"
+        counter += 1
+    return slug
+
+
+def seed(engine: Engine) -> User:
+    with Session(engine) as session:
+        owner = User(full_name="Bench Owner", email="owner@projex.com", hashed_password="x")
+        session.add(owner)
+        session.commit()
+        base_slug = slugify(NAME)
+        session.add_all(
+            Workspace(name=NAME, slug=base_slug if index == 0 else f"{base_slug}-{index}", owner_id=owner.id)
+            for index in range(COLLISIONS)
+        )
+        session.commit()
+        session.refresh(owner)
+        return owner
+
+
+def measure(engine: Engine, label: str, generate, allocations: int) -> None:
+    queries = []
+    counter = lambda *args: queries.append(1)
+    event.listen(engine, "before_cursor_execute", counter)
+    samples: list[float] = []
+    with Session(engine) as session:
+        for _ in range(allocations):
+            with Timer(samples):
+                generate(session=session, base_name=NAME)
+    event.remove(engine, "before_cursor_execute", counter)
+    summarize(label, samples)
+    print(f"{'':<32} queries/allocation={len(queries) / allocations:,.0f}")
+
+
+def race(engine: Engine, owner: User) -> None:
+    errors: list[Exception] = []
+
+    def worker() -> None:
+        for _ in range(RACE_CREATES_PER_THREAD):
+            try:
+                with Session(engine) as session:
+                    create_workspace_service(
+                        session=session, workspace_create=WorkspaceCreate(name=NAME), user_id=owner.id)
+            except Exception as exc:
+                errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(RACE_THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with Session(engine) as session:
+        slugs = session.exec(select(Workspace.slug)).all()
+    # SQLite can refuse a read -> write lock upgrade under contention ("database is
+    # locked"), those are not slug conflicts. Slug conflicts are retried and never surface.
+    error_types: dict[str, int] = {}
+    for error in errors:
+        error_types[type(error).__name__] = error_types.get(type(error).__name__, 0) + 1
+    print(f"race: threads={RACE_THREADS} creates={RACE_THREADS * RACE_CREATES_PER_THREAD} "
+          f"errors={error_types} workspaces={len(slugs)} unique_slugs={len(set(slugs))}")
+
+
+def main() -> None:
+    engine = create_benchmark_engine(name="workspace_slug")
+    owner = seed(engine)
+    print(f"{COLLISIONS:,} workspaces named {NAME!r}")
+    measure(engine, "legacy loop", legacy_generate_slug, LEGACY_ALLOCATIONS)
+    measure(engine, "single query", generate_unique_workspace_slug, ALLOCATIONS)
+    race(engine, owner)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""
+Move tasks archived for more than N days, with their comments, timesheets,
+rollups and tag links, to the *_archive tables in batches. Run it nightly.
+
+Run with:
+    uv run python -m app.commands.archive_tasks [--older-than-days 90] [--batch-size 500]
+"""
+import argparse
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.database import engine
+from app.services.archive_service import archive_tasks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Move long archived tasks to the archive tables")
+    parser.add_argument("--older-than-days", type=int, default=settings.TASK_ARCHIVE_AFTER_DAYS,
+                        help="Days since the task was archived")
+    parser.add_argument("--batch-size", type=int, default=settings.TASK_ARCHIVE_BATCH_SIZE,
+                        help="Tasks per transaction")
+    args = parser.parse_args()
+    with Session(engine) as session:
+        moved = archive_tasks(session=session, older_than_days=args.older_than_days, batch_size=args.batch_size)
+    print(f"✅ Moved {moved} tasks to the archive.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""
+Import timesheets from a CSV file (header: user_email,task_id,work_date,hours,description),
+streamed in chunks, through COPY on Postgres.
+
+Run with:
+    uv run python -m app.commands.import_timesheets path/to/timesheets.csv [--chunk-size 5000]
+"""
+import argparse
+from sqlmodel import Session
+
+from app.core.database import engine
+from app.services.timesheet_import_service import import_timesheets
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import timesheets from CSV")
+    parser.add_argument("path", help="CSV file to import")
+    parser.add_argument("--chunk-size", type=int, default=None, help="Lines per transaction")
+    args = parser.parse_args()
+    with open(args.path, encoding="utf-8-sig", newline="") as lines, Session(engine) as session:
+        report = import_timesheets(session=session, lines=lines, chunk_size=args.chunk_size)
+    for error in report.errors:
+        print(f"line {error.line}: {error.detail}")
+    print(f"✅ Imported {report.imported} timesheets, rejected {report.rejected}.")
+
+
+if __name__ == "__main__":
+    main()
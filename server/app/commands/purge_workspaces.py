@@ -0,0 +1,29 @@
+"""
+Purge the workspaces marked deleted: finishes the purges the API started in the
+background and a crash or a restart interrupted. Safe to run at any time.
+
+Run with:
+    uv run python -m app.commands.purge_workspaces [--batch-size 1000]
+"""
+import argparse
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.database import engine
+from app.services.workspace_purge_service import purge_deleted_workspaces
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Remove the rows of deleted workspaces")
+    parser.add_argument("--batch-size", type=int, default=settings.WORKSPACE_PURGE_BATCH_SIZE,
+                        help="Rows deleted per transaction")
+    args = parser.parse_args()
+    with Session(engine) as session:
+        purged = purge_deleted_workspaces(
+            session=session, batch_size=args.batch_size,
+            on_progress=lambda table, deleted: print(f"  {table}: {deleted} deleted"))
+    print(f"✅ Purged {purged} deleted workspaces.")
+
+
+if __name__ == "__main__":
+    main()
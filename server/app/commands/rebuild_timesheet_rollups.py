@@ -0,0 +1,25 @@
+"""
+Recompute the timesheet rollups and Task.actual_hours from the raw timesheets,
+in batches (after the rollup migration, or to repair drift).
+
+Run with:
+    uv run python -m app.commands.rebuild_timesheet_rollups [--batch-size 500]
+"""
+import argparse
+from sqlmodel import Session
+
+from app.core.database import engine
+from app.services.timesheet_service import rebuild_timesheet_rollups
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild timesheet rollups")
+    parser.add_argument("--batch-size", type=int, default=500, help="Users (then tasks) per transaction")
+    args = parser.parse_args()
+    with Session(engine) as session:
+        written = rebuild_timesheet_rollups(session=session, batch_size=args.batch_size)
+    print(f"✅ Rebuilt {written} timesheet rollups.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+Create the monthly timesheet partitions ahead of time and detach the ones past
+retention. Run it daily (Postgres, it does nothing on SQLite).
+
+Run with:
+    uv run python -m app.commands.timesheet_partitions [--months-ahead 3] [--retain-months 0]
+"""
+import argparse
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.database import engine
+from app.services.timesheet_partition_service import create_timesheet_partitions, detach_timesheet_partitions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Maintain the monthly timesheet partitions")
+    parser.add_argument("--months-ahead", type=int, default=settings.TIMESHEET_PARTITION_MONTHS_AHEAD,
+                        help="Months to create past the current one")
+    parser.add_argument("--retain-months", type=int, default=settings.TIMESHEET_PARTITION_RETAIN_MONTHS,
+                        help="Months to keep attached, 0 keeps every partition")
+    args = parser.parse_args()
+    with Session(engine) as session:
+        created = create_timesheet_partitions(session=session, months_ahead=args.months_ahead)
+        detached = []
+        if args.retain_months > 0:
+            detached = detach_timesheet_partitions(session=session, retain_months=args.retain_months)
+    print(f"✅ Created {len(created)} and detached {len(detached)} timesheet partitions.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Run the background jobs queued in Redis (default workspaces, invitations,
+workspace purges). Start as many processes as needed, SIGINT/SIGTERM stops
+claiming and waits for the running jobs.
+
+Run with:
+    uv run python -m app.commands.worker [--concurrency 4]
+"""
+import argparse
+import logging
+import signal
+import threading
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.database import engine, redis_client
+from app.services.job_service import Worker
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the background job worker")
+    parser.add_argument("--concurrency", type=int, default=settings.JOB_CONCURRENCY,
+                        help="Jobs run at once by this process")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+    worker = Worker(redis=redis_client, session_factory=lambda: Session(engine), concurrency=args.concurrency)
+    print(f"✅ Worker started, {worker.concurrency} jobs at a time.")
+    worker.run(stop)
+    print("✅ Worker stopped.")
+
+
+if __name__ == "__main__":
+    main()
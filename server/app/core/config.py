@@ -1,6 +1,15 @@
+from typing import Literal
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+def to_async_database_url(url: str) -> str:
+    """ Swap the driver of a database url for the async one. """
+    scheme, _, rest = url.partition("://")
+    dialect = scheme.split("+")[0]
+    driver = "aiosqlite" if dialect == "sqlite" else "asyncpg"
+    return f"{dialect}+{driver}://{rest}"
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file="./.env",
@@ -23,10 +32,76 @@ class Settings(BaseSettings):
     TOKEN_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30  # 30 minutes
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7  # 7 days
+    ACCESS_TOKEN_CACHE_ENABLED: bool = True  # Cache verified access tokens
+    ACCESS_TOKEN_CACHE_SIZE: int = 10_000
+
+    # Pagination (list endpoints)
+    PAGE_DEFAULT_LIMIT: int = 20
+    PAGE_MAX_LIMIT: int = 100
+
+    # Principal Cache (current user lookups)
+    PRINCIPAL_CACHE_ENABLED: bool = True
+    PRINCIPAL_CACHE_SIZE: int = 10_000
+    PRINCIPAL_CACHE_LOCAL_TTL_SECONDS: int = 5  # Per process, bounds cross-worker staleness
+    PRINCIPAL_CACHE_REDIS_TTL_SECONDS: int = 300
+
+    # Tag Catalog (in-process tag autocomplete)
+    TAG_CATALOG_ENABLED: bool = True
+    TAG_CATALOG_MAX_AGE_SECONDS: int = 300  # Reload even without a change message
+
+    # Board Summary (task counts per user or project)
+    BOARD_SUMMARY_CACHE_SECONDS: int = 60  # Bounds how late newly overdue tasks show up
+
+    # Bulk Task API
+    TASK_BULK_MAX_ITEMS: int = 500
+
+    # Timesheet Import
+    TIMESHEET_IMPORT_CHUNK_SIZE: int = 5000  # Lines checked, loaded and committed together
+
+    # Task Archive (cold storage of long archived tasks)
+    TASK_ARCHIVE_AFTER_DAYS: int = 90  # Days archived before moving to the *_archive tables
+    TASK_ARCHIVE_BATCH_SIZE: int = 500  # Tasks moved per transaction
+
+    # Workspace Purge (rows of deleted workspaces, removed in the background)
+    WORKSPACE_PURGE_BATCH_SIZE: int = 1000  # Rows deleted per transaction
+
+    # Timesheet Partitions (monthly on work_date, Postgres only)
+    TIMESHEET_PARTITION_MONTHS_AHEAD: int = 3  # Monthly partitions created past the current month
+    TIMESHEET_PARTITION_RETAIN_MONTHS: int = 0  # Months kept attached, 0 keeps every partition
+
+    # Background Jobs (Redis queue, run by `make worker`)
+    JOB_CONCURRENCY: int = 4  # Jobs run at once per worker process
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0  # Wait when no job is due
+    JOB_VISIBILITY_TIMEOUT_SECONDS: float = 300  # A job not extended for this long is run again
+    JOB_MAX_ATTEMPTS: int = 5  # Then the job is parked in jobs:dead
+    JOB_RETRY_BASE_DELAY_SECONDS: float = 5  # Doubled after every failed attempt
+    JOB_RETRY_MAX_DELAY_SECONDS: float = 3600
+    JOB_IDEMPOTENCY_TTL_SECONDS: int = 86400  # How long an idempotency key dedupes enqueues
+    JOB_REDIS_MAX_BACKOFF_SECONDS: float = 30  # Longest wait between tries while Redis is down
+
+    # Password Hashing
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 32  # Queued jobs before returning 503
 
     # Database
     DATABASE_URL: str
-    
+    DATABASE_ASYNC: bool = False  # Use the async engine (asyncpg / aiosqlite)
+    DATABASE_POOL_SIZE: int = 5  # Per worker process
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30  # Seconds to wait for a free connection
+    DATABASE_POOL_RECYCLE: int = 1800  # Seconds, -1 to never recycle
+    DATABASE_POOL_PRE_PING: bool = True
+    DATABASE_STATEMENT_TIMEOUT_MS: int = 0  # 0 disables (Postgres only)
+    DATABASE_IDLE_IN_TRANSACTION_TIMEOUT_MS: int = 0  # 0 disables (Postgres only)
+    DATABASE_REPLICA_URLS: list[str] = []  # JSON list, GET routes read from these
+    DATABASE_REPLICA_STICKY_SECONDS: int = 10  # Reads stay on the primary after a write
+
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        """ DATABASE_URL with its driver swapped for the async one. """
+        return to_async_database_url(self.DATABASE_URL)
+
     # Redis
     REDIS_URL: str
 
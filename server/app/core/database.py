@@ -1,15 +1,51 @@
+import random
 from fastapi import Depends
+from fastapi.concurrency import run_in_threadpool
 from sqlmodel import create_engine, Session
-from typing import Annotated
-from collections.abc import Generator
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from typing import Annotated, Any, Callable, TypeVar
+from collections.abc import AsyncGenerator, Generator
 from redis import Redis
 
-from app.core.config import settings
+from app.core.config import settings, to_async_database_url
+from app.core.pool import InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool
+
+T = TypeVar("T")
+
+
+def _engine_options(*, url: str, is_async: bool = False) -> dict[str, Any]:
+    """ Pool and per-session settings for the engine (SQLite keeps its own pool). """
+    if url.startswith("sqlite"):
+        return {}
+    options: dict[str, Any] = {
+        "poolclass": InstrumentedAsyncAdaptedQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+    }
+    server_settings = {}
+    if settings.DATABASE_STATEMENT_TIMEOUT_MS:
+        server_settings["statement_timeout"] = str(settings.DATABASE_STATEMENT_TIMEOUT_MS)
+    if settings.DATABASE_IDLE_IN_TRANSACTION_TIMEOUT_MS:
+        server_settings["idle_in_transaction_session_timeout"] = str(
+            settings.DATABASE_IDLE_IN_TRANSACTION_TIMEOUT_MS)
+    if server_settings:
+        if is_async:
+            options["connect_args"] = {"server_settings": server_settings}
+        else:
+            options["connect_args"] = {"options": " ".join(
+                f"-c {name}={value}" for name, value in server_settings.items())}
+    return options
+
 
 # -----------------
 # --- Database ----
 # -----------------
-engine = create_engine(settings.DATABASE_URL)
+engine = create_engine(settings.DATABASE_URL, **_engine_options(url=settings.DATABASE_URL))
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -20,6 +56,80 @@ def get_db() -> Generator[Session, None, None]:
 SessionDep = Annotated[Session, Depends(get_db)]
 
 
+# -----------------------
+# --- Async Database ----
+# -----------------------
+# Only built when DATABASE_ASYNC is on, so the async driver is optional otherwise.
+async_engine: AsyncEngine | None = (
+    create_async_engine(
+        settings.ASYNC_DATABASE_URL,
+        **_engine_options(url=settings.ASYNC_DATABASE_URL, is_async=True),
+    ) if settings.DATABASE_ASYNC else None
+)
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_db)]
+
+# Session used by the routes, picked by DATABASE_ASYNC
+DbSessionDep = AsyncSessionDep if settings.DATABASE_ASYNC else SessionDep
+
+
+async def run_in_session(session: Session | AsyncSession, func: Callable[..., T], /, **kwargs: Any) -> T:
+    """ Run a service function (written against a sync Session) without blocking the event loop.
+
+    On the async engine it runs through `AsyncSession.run_sync`, so the database I/O is
+    awaited and no threadpool worker is used. On the sync engine it runs in the threadpool.
+    """
+    if isinstance(session, AsyncSession):
+        return await session.run_sync(lambda sync_session: func(session=sync_session, **kwargs))
+    return await run_in_threadpool(func, session=session, **kwargs)
+
+
+# ------------------------
+# --- Read Replicas ------
+# ------------------------
+replica_engines: list[Engine] = [
+    create_engine(url, **_engine_options(url=url)) for url in settings.DATABASE_REPLICA_URLS
+]
+async_replica_engines: list[AsyncEngine] = [
+    create_async_engine(
+        to_async_database_url(url),
+        **_engine_options(url=to_async_database_url(url), is_async=True),
+    ) for url in settings.DATABASE_REPLICA_URLS
+] if settings.DATABASE_ASYNC else []
+
+
+class RoutingSession(Session):
+    """ Session that sends plain reads to a replica and everything else to the primary.
+
+    Once the session writes (flush, DML or SELECT ... FOR UPDATE) it stays on the
+    primary, so it always reads its own writes.
+    """
+
+    def __init__(self, *args: Any, replica: Engine | None = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.replica = replica
+        self.on_primary = replica is None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if not self.on_primary:
+            if (not self._flushing and getattr(clause, "is_select", False)
+                    and getattr(clause, "_for_update_arg", None) is None):
+                return self.replica
+            self.on_primary = True
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+def pick_replica(engines: list[T]) -> T | None:
+    """ Pick a replica at random, None when there are none. """
+    return random.choice(engines) if engines else None
+
+
 # -----------------
 # --- Redis -------
 # -----------------
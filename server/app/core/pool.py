@@ -0,0 +1,91 @@
+import bisect
+import threading
+import time
+from typing import Any
+from sqlalchemy import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# Upper bounds (ms) of the checkout wait histogram buckets, the last one is +Inf
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class PoolMetrics:
+    """ Thread safe counters and wait time histogram for connection checkouts. """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def record(self, *, wait_ms: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_total_ms += wait_ms
+            self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+            self.wait_buckets[bisect.bisect_left(WAIT_BUCKETS_MS, wait_ms)] += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            buckets = {f"le_{bound}ms": count for bound, count in zip(WAIT_BUCKETS_MS, self.wait_buckets)}
+            buckets["le_inf"] = self.wait_buckets[-1]
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_total_ms": round(self.wait_total_ms, 3),
+                "wait_max_ms": round(self.wait_max_ms, 3),
+                "wait_histogram": buckets,
+            }
+
+
+class _InstrumentedPoolMixin:
+    """ Times how long callers wait to get a connection out of the pool. """
+
+    @property
+    def metrics(self) -> PoolMetrics:
+        if not hasattr(self, "_metrics"):
+            self._metrics = PoolMetrics()
+        return self._metrics
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.metrics.record(
+                wait_ms=(time.perf_counter() - started) * 1000, timed_out=True)
+            raise
+        self.metrics.record(wait_ms=(time.perf_counter() - started) * 1000)
+        return connection
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def get_pool_stats(*, engine: Engine) -> dict[str, Any]:
+    """ Return the live state and checkout metrics of the engine's pool. """
+    pool: Pool = engine.pool
+    stats: dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "max_overflow": pool._max_overflow,
+            "timeout": pool.timeout(),
+        })
+    if isinstance(pool, _InstrumentedPoolMixin):
+        stats.update(pool.metrics.snapshot())
+    return stats
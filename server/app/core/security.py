@@ -1,10 +1,15 @@
+import asyncio
+import hashlib
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from jose import jwt, JWTError
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Callable
 from passlib.context import CryptContext
 
 from app.core.config import settings
-from app.exceptions.auth import InvalidTokenException
+from app.exceptions.auth import InvalidTokenException, PasswordHasherBusyException
+from app.utils.cache import ExpiringLRUCache
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -23,6 +28,79 @@ def verify_password(*, plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+# -----------------------------
+# Password Hashing Executor
+# -----------------------------
+# bcrypt is CPU bound, so it gets its own bounded pool instead of the shared
+# AnyIO threadpool that every sync route and dependency runs on.
+_password_executor: Executor | None = None
+_password_jobs_in_flight = 0
+
+
+def _hash_password_job(password: str) -> str:
+    return get_password_hash(password=password)
+
+
+def _verify_password_job(plain_password: str, hashed_password: str) -> bool:
+    return verify_password(plain_password=plain_password, hashed_password=hashed_password)
+
+
+def get_password_executor() -> Executor:
+    """ Return the dedicated password hashing executor, creating it on first use. """
+    global _password_executor
+    if _password_executor is None:
+        if settings.PASSWORD_HASH_EXECUTOR == "process":
+            _password_executor = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS)
+        else:
+            _password_executor = ThreadPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+                thread_name_prefix="password-hasher")
+    return _password_executor
+
+
+def shutdown_password_executor() -> None:
+    """ Shutdown the password hashing executor (if it was started). """
+    global _password_executor
+    if _password_executor is not None:
+        _password_executor.shutdown(wait=False, cancel_futures=True)
+        _password_executor = None
+
+
+def get_password_jobs_in_flight() -> int:
+    """ Return the number of hashing jobs running or waiting in the pool. """
+    return _password_jobs_in_flight
+
+
+def check_password_hasher_capacity() -> None:
+    """ Fail fast with 503 when the hashing pool and its queue are full. """
+    capacity = settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_MAX_PENDING
+    if _password_jobs_in_flight >= capacity:
+        raise PasswordHasherBusyException()
+
+
+async def _run_password_job(func: Callable[..., Any], *args: Any) -> Any:
+    """ Run a hashing job on the dedicated pool, rejecting it if the queue is full. """
+    global _password_jobs_in_flight
+    check_password_hasher_capacity()
+    _password_jobs_in_flight += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_password_executor(), func, *args)
+    finally:
+        _password_jobs_in_flight -= 1
+
+
+async def get_password_hash_async(*, password: str) -> str:
+    """ Hash the password on the dedicated password hashing pool. """
+    return await _run_password_job(_hash_password_job, password)
+
+
+async def verify_password_async(*, plain_password: str, hashed_password: str) -> bool:
+    """ Verify the password on the dedicated password hashing pool. """
+    return await _run_password_job(_verify_password_job, plain_password, hashed_password)
+
+
 # -----------------------------
 # Token Utilities
 # -----------------------------
@@ -33,34 +111,57 @@ def create_access_token(*, subject: str | Any, expire_delta: timedelta = timedel
     return jwt.encode(payload, settings.TOKEN_SECRET_KEY, algorithm=settings.TOKEN_ALGORITHM)
 
 
-def create_refresh_token(*, subject: str | Any, expire_delta: timedelta = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)) -> str:
-    """ Create refresh token with 7 days expiry as default. """
+def create_refresh_token(*, subject: str | Any, session_id: str | None = None, expire_delta: timedelta = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)) -> str:
+    """ Create refresh token with 7 days expiry as default. The session id (device) is kept in `sid`. """
     expire = datetime.now(timezone.utc) + expire_delta
-    payload = {"exp": expire, "sub": str(subject), "type": "refresh"}
+    payload = {
+        "exp": expire,
+        "sub": str(subject),
+        "type": "refresh",
+        "sid": session_id or uuid.uuid4().hex,
+        "jti": uuid.uuid4().hex,
+    }
     return jwt.encode(payload, settings.TOKEN_SECRET_KEY, algorithm=settings.TOKEN_ALGORITHM)
 
 
+# Verified access tokens, keyed by token hash and kept until the token's own exp
+access_token_cache = ExpiringLRUCache(max_size=settings.ACCESS_TOKEN_CACHE_SIZE)
+
+
 def decode_access_token(*, token: str) -> str | Any:
     """ Decode access token and return subject (user_id/email). """
+    cache_key = None
+    if settings.ACCESS_TOKEN_CACHE_ENABLED:
+        cache_key = hashlib.sha256(token.encode()).digest()
+        subject = access_token_cache.get(cache_key)
+        if subject is not None:
+            return subject
     try:
         payload = jwt.decode(token, settings.TOKEN_SECRET_KEY, algorithms=[
                              settings.TOKEN_ALGORITHM])
-        return payload['sub']
     except JWTError:
         raise InvalidTokenException()
+    if cache_key is not None and isinstance(payload.get("exp"), (int, float)):
+        access_token_cache.set(cache_key, payload['sub'], expires_at=payload["exp"])
+    return payload['sub']
 
 
-def decode_refresh_token(*, token: str) -> str | Any:
-    """ Decode refresh token and return subject (user_id/email). """
+def decode_refresh_token_payload(*, token: str) -> dict[str, Any]:
+    """ Decode refresh token and return its payload (sub, sid, ...). """
     try:
         payload = jwt.decode(
             token,
             settings.TOKEN_SECRET_KEY,
             algorithms=[settings.TOKEN_ALGORITHM]
         )
-        # Ensure the token type is refresh
-        if payload.get("type") != "refresh":
-            raise InvalidTokenException()
-        return payload["sub"]
     except JWTError:
         raise InvalidTokenException()
+    # Ensure the token type is refresh
+    if payload.get("type") != "refresh" or "sid" not in payload:
+        raise InvalidTokenException()
+    return payload
+
+
+def decode_refresh_token(*, token: str) -> str | Any:
+    """ Decode refresh token and return subject (user_id/email). """
+    return decode_refresh_token_payload(token=token)["sub"]
@@ -8,3 +8,11 @@ class InvalidTokenException(AppException):
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=detail
         )
+
+
+class PasswordHasherBusyException(AppException):
+    def __init__(self, detail: str = "Server is busy, please try again shortly."):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail
+        )
@@ -0,0 +1,10 @@
+from fastapi import status
+from app.exceptions.base import AppException
+
+
+class CommentNotFoundException(AppException):
+    def __init__(self, detail: str = "Comment not found!"):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=detail
+        )
@@ -0,0 +1,10 @@
+from fastapi import status
+from app.exceptions.base import AppException
+
+
+class InvalidCursorException(AppException):
+    def __init__(self, detail: str = "Invalid pagination cursor!"):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail
+        )
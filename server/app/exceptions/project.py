@@ -0,0 +1,18 @@
+from fastapi import status
+from app.exceptions.base import AppException
+
+
+class ProjectAlreadyExistException(AppException):
+    def __init__(self, detail: str = "Project with this name already exists in this workspace!"):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=detail
+        )
+
+
+class ProjectNotFoundException(AppException):
+    def __init__(self, detail: str = "Project not found!"):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=detail
+        )
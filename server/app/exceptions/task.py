@@ -0,0 +1,18 @@
+from fastapi import status
+from app.exceptions.base import AppException
+
+
+class TaskBulkLimitException(AppException):
+    def __init__(self, detail: str = "Too many tasks in one bulk request!"):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail
+        )
+
+
+class TaskNotFoundException(AppException):
+    def __init__(self, detail: str = "Task not found!"):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=detail
+        )
@@ -0,0 +1,18 @@
+from fastapi import status
+from app.exceptions.base import AppException
+
+
+class TimesheetNotFoundException(AppException):
+    def __init__(self, detail: str = "Timesheet not found!"):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=detail
+        )
+
+
+class TimesheetImportException(AppException):
+    def __init__(self, detail: str = "Invalid timesheet import file!"):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail
+        )
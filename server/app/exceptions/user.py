@@ -40,3 +40,11 @@ class UserAlreadyExistException(AppException):
             status_code=status.HTTP_409_CONFLICT,
             detail=detail
         )
+
+
+class NotSuperUserException(AppException):
+    def __init__(self, detail: str = "The user doesn't have enough privileges"):
+        super().__init__(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=detail
+        )
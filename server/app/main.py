@@ -1,13 +1,25 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from app.core.config import settings
+from app.core.security import shutdown_password_executor
+from app.services.tag_catalog_service import stop_tag_catalog_listener
 from app.exceptions.handler import register_exception_handlers
 from app.api.v1 import api_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    shutdown_password_executor()
+    stop_tag_catalog_listener()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description=settings.PROJECT_NAME,
     version=settings.PROJECT_VERSION,
+    lifespan=lifespan,
 )
 register_exception_handlers(app=app)
 
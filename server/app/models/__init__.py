@@ -2,9 +2,16 @@ from app.models.user import User
 from app.models.workspace import Workspace, WorkspaceMember
 from app.models.project import Project, ProjectMember
 from app.models.task import Task
-from app.models.timesheet import Timesheet
+from app.models.timesheet import Timesheet, TimesheetRollup
 from app.models.tag import Tag, TaskTag
 from app.models.comment import Comment
+from app.models.archive import (
+    comments_archive,
+    task_tags_archive,
+    tasks_archive,
+    timesheet_rollups_archive,
+    timesheets_archive,
+)
 
 __all__ = [
     "User",
@@ -12,9 +19,15 @@ __all__ = [
     "WorkspaceMember",
     "Task",
     "Timesheet",
+    "TimesheetRollup",
     "Project",
     "ProjectMember",
     "Tag",
     "TaskTag",
     "Comment",
+    "tasks_archive",
+    "comments_archive",
+    "timesheets_archive",
+    "timesheet_rollups_archive",
+    "task_tags_archive",
 ]
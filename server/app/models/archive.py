@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Index, Table
+from sqlmodel import SQLModel
+
+from app.models.comment import Comment
+from app.models.tag import TaskTag
+from app.models.task import Task
+from app.models.timesheet import Timesheet, TimesheetRollup
+
+
+def _archive_of(source: Table, *indexes: str) -> Table:
+    """ `<source>_archive` with the same columns, without foreign keys (the rows outlive what they point to). """
+    name = f"{source.name}_archive"
+    return Table(
+        name,
+        SQLModel.metadata,
+        *(Column(column.name, column.type, primary_key=column.primary_key, nullable=column.nullable)
+          for column in source.columns),
+        *(Index(f"ix_{name}_{column}", column) for column in indexes),
+    )
+
+
+# Cold storage of long archived tasks and of the rows hanging off them (see archive_service)
+tasks_archive = _archive_of(Task.__table__, "project_id", "owner_id")
+comments_archive = _archive_of(Comment.__table__, "task_id")
+timesheets_archive = _archive_of(Timesheet.__table__, "task_id")
+timesheet_rollups_archive = _archive_of(TimesheetRollup.__table__, "task_id")
+task_tags_archive = _archive_of(TaskTag.__table__)
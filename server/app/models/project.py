@@ -1,4 +1,5 @@
 import uuid
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
 from datetime import datetime, timezone
 from typing import List, Optional, TYPE_CHECKING
@@ -28,6 +29,12 @@ class ProjectMember(SQLModel, table=True):
 
 class Project(SQLModel, table=True):
     __tablename__ = "projects"
+    __table_args__ = (
+        # Keyset pagination inside a workspace, with and without a status filter
+        # (see project_service.get_all_workspace_projects)
+        Index("ix_projects_workspace_id_created_at_id", "workspace_id", "created_at", "id"),
+        Index("ix_projects_workspace_id_status_created_at_id", "workspace_id", "status", "created_at", "id"),
+    )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     name: str = Field(nullable=False, max_length=255)
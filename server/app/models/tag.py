@@ -1,4 +1,5 @@
 import uuid
+from sqlalchemy import Index, text
 from sqlmodel import Field, SQLModel, Relationship
 from typing import Optional, TYPE_CHECKING
 
@@ -16,6 +17,14 @@ class TaskTag(SQLModel, table=True):
 
 class Tag(SQLModel, table=True):
     __tablename__ = "tags"
+    __table_args__ = (
+        # Autocomplete (see tag_service.search_tags): lower(name) for exact and prefix
+        # matches ("C" collated on Postgres so LIKE 'q%' can use it), trigrams for the rest
+        Index("ix_tags_name_lower_c", text('lower(name) COLLATE "C"')).ddl_if(dialect="postgresql"),
+        Index("ix_tags_name_lower", text("lower(name)")).ddl_if(dialect="sqlite"),
+        Index("ix_tags_name_trgm", text("lower(name) gin_trgm_ops"),
+              postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     name: str = Field(unique=True, index=True, max_length=50)
@@ -1,4 +1,5 @@
 import uuid
+from sqlalchemy import DDL, Index, event, text
 from sqlmodel import SQLModel, Field, Relationship
 from datetime import datetime, timezone
 from typing import List, Optional, TYPE_CHECKING
@@ -30,15 +31,29 @@ class TaskStatus(str, Enum):
 
 class Task(SQLModel, table=True):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Only the live (not archived) tasks, the rows boards and lists read, covering
+        # the board summary. SQLite only picks a partial index when the query repeats
+        # its predicate as written, `not_(Task.is_archived)` compiles to `is_archived = 0` there.
+        Index("ix_tasks_open_owner_id_status_priority_due_date", "owner_id", "status", "priority", "due_date",
+              postgresql_where=text("NOT is_archived"), sqlite_where=text("is_archived = 0")),
+        Index("ix_tasks_open_project_id_status_priority_due_date", "project_id", "status", "priority", "due_date",
+              postgresql_where=text("NOT is_archived"), sqlite_where=text("is_archived = 0")),
+        # Archived tasks by age, for archive_service.archive_tasks
+        Index("ix_tasks_archived_at", "archived_at",
+              postgresql_where=text("is_archived"), sqlite_where=text("is_archived = 1")),
+    )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     title: str = Field(max_length=300, index=True)
     description: Optional[str] = None
     is_archived: bool = Field(default=False)
+    # Set when archived, the task moves to tasks_archive some days later
+    archived_at: Optional[datetime] = None
 
     # Enum fields
-    status: TaskStatus = Field(default=TaskStatus.DRAFT, index=True)
-    priority: TaskPriority = Field(default=TaskPriority.MEDIUM, index=True)
+    status: TaskStatus = Field(default=TaskStatus.DRAFT)
+    priority: TaskPriority = Field(default=TaskPriority.MEDIUM)
     
     # Task progress
     estimated_hours: Optional[float] = Field(default=None, ge=0)
@@ -55,6 +70,10 @@ class Task(SQLModel, table=True):
     owner_id: uuid.UUID = Field(foreign_key="users.id", index=True)
     owner: "User" = Relationship(back_populates="tasks")
 
+    # Project of the task (optional) - Many2one
+    project_id: Optional[uuid.UUID] = Field(
+        default=None, foreign_key="projects.id", index=True)
+
     # Timesheets - One2many
     timesheets: list["Timesheet"] = Relationship(back_populates="task")
 
@@ -64,3 +83,41 @@ class Task(SQLModel, table=True):
     # Tags - Many2many
     tags: List["Tag"] = Relationship(
         back_populates="tasks", link_model=TaskTag)
+
+
+# Full-text search (see task_service.search_tasks), outside the mapped columns:
+# on Postgres a generated tsvector (title weighted A, description B) with a GIN
+# index, on SQLite an FTS5 table over tasks kept in step by triggers. The FTS5
+# rows are keyed by tasks.search_rowid, an integer stored on insert: the
+# implicit rowid of a table without an INTEGER PRIMARY KEY can change on VACUUM.
+TASK_SEARCH_DDL = {
+    "postgresql": [
+        "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')) STORED",
+        "CREATE INDEX IF NOT EXISTS ix_tasks_search_vector ON tasks USING gin (search_vector)",
+    ],
+    "sqlite": [
+        "ALTER TABLE tasks ADD COLUMN search_rowid INTEGER",
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_tasks_search_rowid ON tasks (search_rowid)",
+        "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5("
+        "title, description, content='tasks', content_rowid='search_rowid', tokenize='porter unicode61')",
+        "CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN "
+        "UPDATE tasks SET search_rowid = (SELECT coalesce(max(search_rowid), 0) + 1 FROM tasks) "
+        "WHERE rowid = new.rowid; "
+        "INSERT INTO tasks_fts (rowid, title, description) "
+        "SELECT search_rowid, title, description FROM tasks WHERE rowid = new.rowid; END",
+        "CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN "
+        "INSERT INTO tasks_fts (tasks_fts, rowid, title, description) "
+        "VALUES ('delete', old.search_rowid, old.title, old.description); END",
+        "CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN "
+        "INSERT INTO tasks_fts (tasks_fts, rowid, title, description) "
+        "VALUES ('delete', old.search_rowid, old.title, old.description); "
+        "INSERT INTO tasks_fts (rowid, title, description) VALUES (new.search_rowid, new.title, new.description); END",
+    ],
+}
+
+for _dialect, _statements in TASK_SEARCH_DDL.items():
+    for _statement in _statements:
+        event.listen(Task.__table__, "after_create", DDL(_statement).execute_if(dialect=_dialect))
+event.listen(Task.__table__, "before_drop", DDL("DROP TABLE IF EXISTS tasks_fts").execute_if(dialect="sqlite"))
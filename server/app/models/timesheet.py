@@ -1,6 +1,6 @@
 import uuid
 from sqlmodel import Field, SQLModel, Relationship
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -27,3 +27,16 @@ class Timesheet(SQLModel, table=True):
     # Task - Many2one
     task_id: uuid.UUID = Field(foreign_key="tasks.id", index=True)
     task: "Task" = Relationship(back_populates="timesheets")
+
+
+class TimesheetRollup(SQLModel, table=True):
+    """ Hours per user, task and ISO week, kept in step with `timesheets` (see timesheet_service). """
+    __tablename__ = "timesheet_rollups"
+
+    user_id: uuid.UUID = Field(foreign_key="users.id", primary_key=True)
+    task_id: uuid.UUID = Field(foreign_key="tasks.id", primary_key=True, index=True)
+    # Monday of the ISO week
+    week_start: date = Field(primary_key=True)
+    hours: float = Field(default=0)
+    # Timesheets in the rollup, the row is removed when it reaches 0
+    entries: int = Field(default=0)
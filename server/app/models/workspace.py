@@ -1,4 +1,5 @@
 import uuid
+from sqlalchemy import Index, text
 from sqlmodel import Field, SQLModel, Relationship
 from datetime import datetime, timezone, timedelta
 from typing import Optional, List, TYPE_CHECKING
@@ -27,9 +28,19 @@ class WorkspaceMember(SQLModel, table=True):
     joined_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc))
 
+    # Member user, read only (memberships are written through Workspace.members)
+    user: "User" = Relationship(sa_relationship_kwargs={"viewonly": True})
+
 
 class Workspace(SQLModel, table=True):
     __tablename__ = "workspaces"
+    __table_args__ = (
+        # Keyset pagination of a user's workspaces (see workspace_service.get_user_workspaces)
+        Index("ix_workspaces_owner_id_created_at_id", "owner_id", "created_at", "id"),
+        # Workspaces waiting for purge_workspace, only the few deleted ones are indexed
+        Index("ix_workspaces_deleted_at", "deleted_at",
+              postgresql_where=text("deleted_at IS NOT NULL"), sqlite_where=text("deleted_at IS NOT NULL")),
+    )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     name: str = Field(nullable=False, max_length=100)
@@ -41,6 +52,8 @@ class Workspace(SQLModel, table=True):
         default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc))
+    # Set on delete, the workspace is hidden until purge_workspace removes it
+    deleted_at: Optional[datetime] = None
 
     # Owner (workspace creator) - Many2one
     owner_id: uuid.UUID = Field(
@@ -56,6 +69,11 @@ class Workspace(SQLModel, table=True):
         link_model=WorkspaceMember
     )
 
+    # Member rows with their role, read only - One2many
+    memberships: List[WorkspaceMember] = Relationship(
+        sa_relationship_kwargs={"viewonly": True}
+    )
+
     # Invitations - One2Many
     invitations: List["WorkspaceInvitation"] = Relationship()
 
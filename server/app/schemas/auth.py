@@ -37,6 +37,25 @@ class CurrentUserResponse(UserResponse):
     pass
 
 
+class UserPrincipal(BaseModel):
+    """ Identity of the authenticated user, as served by the principal cache. """
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    id: uuid.UUID
+    full_name: str
+    email: str
+    image_url: Optional[str] = None
+    is_active: bool
+    is_superuser: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+class UserUpdate(BaseModel):
+    full_name: Optional[str] = None
+    image_url: Optional[str] = None
+
+
 class RefreshTokenSchema(BaseModel):
     refresh_token: str
 
@@ -48,3 +67,10 @@ class RefreshTokenResponse(BaseModel):
 
 class LogoutSchema(BaseModel):
     refresh_token: str
+
+
+class RefreshSessionResponse(BaseModel):
+    session_id: str
+    device: Optional[str] = None
+    created_at: datetime
+    expires_at: datetime
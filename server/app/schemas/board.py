@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+from typing import List
+
+from app.models.task import TaskPriority, TaskStatus
+
+
+class BoardCell(BaseModel):
+    status: TaskStatus
+    priority: TaskPriority
+    count: int
+    # Past due_date and not done or cancelled
+    overdue: int
+
+
+class BoardSummaryResponse(BaseModel):
+    # Every status x priority pair, zero counts included
+    cells: List[BoardCell]
+    total: int
+    overdue: int
@@ -1,16 +1,32 @@
 import uuid
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
+from datetime import datetime
+from typing import Optional
 
 
-class CommentBase(BaseModel):
-    content: str
-    author_id: uuid.UUID
-    task_id: uuid.UUID
+class CommentCreate(BaseModel):
+    content: str = Field(min_length=1)
+
 
+class CommentUpdate(BaseModel):
+    content: str = Field(min_length=1)
 
-class CommentCreate(CommentBase):
-    pass
 
+class CommentAuthor(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
 
-class CommentResponse(CommentBase):
     id: uuid.UUID
+    full_name: str
+    image_url: Optional[str] = None
+
+
+class CommentResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    task_id: uuid.UUID
+    content: str
+    is_edited: bool
+    created_at: datetime
+    updated_at: datetime
+    author: CommentAuthor
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class PageParams(BaseModel):
+    limit: int
+    cursor: Optional[str] = None
+
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    # Pass back as `cursor` for the next page, None on the last page
+    next_cursor: Optional[str] = None
@@ -20,6 +20,8 @@ class ProjectCreate(ProjectBase):
 
 
 class ProjectMember(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: uuid.UUID
     full_name: str
 
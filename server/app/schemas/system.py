@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+from typing import Any, Dict
+
+
+class DbPoolStatsResponse(BaseModel):
+    pid: int
+    engines: Dict[str, Dict[str, Any]]
@@ -0,0 +1,61 @@
+import uuid
+from pydantic import BaseModel, ConfigDict, Field
+from datetime import datetime
+from typing import List, Literal, Optional
+
+from app.models.task import TaskPriority, TaskStatus
+
+
+class TaskBase(BaseModel):
+    title: str = Field(max_length=300)
+    description: Optional[str] = None
+    status: TaskStatus = TaskStatus.DRAFT
+    priority: TaskPriority = TaskPriority.MEDIUM
+    estimated_hours: Optional[float] = Field(default=None, ge=0)
+    due_date: Optional[datetime] = None
+    project_id: Optional[uuid.UUID] = None
+
+
+class TaskCreate(TaskBase):
+    pass
+
+
+class TaskResponse(TaskBase):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    owner_id: uuid.UUID
+    is_archived: bool
+    actual_hours: Optional[float] = None
+    progress_percentage: int
+    completed_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class TaskBulkUpdate(BaseModel):
+    # Fields left out are not changed
+    id: uuid.UUID
+    status: Optional[TaskStatus] = None
+    priority: Optional[TaskPriority] = None
+    is_archived: Optional[bool] = None
+
+
+class TaskBulkCreateRequest(BaseModel):
+    tasks: List[TaskCreate]
+
+
+class TaskBulkUpdateRequest(BaseModel):
+    tasks: List[TaskBulkUpdate]
+
+
+class TaskBulkItemResult(BaseModel):
+    # Position of the item in the request
+    index: int
+    id: Optional[uuid.UUID] = None
+    result: Literal["created", "updated", "not_found"]
+    detail: Optional[str] = None
+
+
+class TaskBulkResponse(BaseModel):
+    results: List[TaskBulkItemResult]
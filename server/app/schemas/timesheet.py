@@ -0,0 +1,52 @@
+import uuid
+from pydantic import BaseModel, ConfigDict, Field
+from datetime import date, datetime
+from typing import List, Optional
+
+
+class TimesheetCreate(BaseModel):
+    task_id: uuid.UUID
+    description: str = Field(max_length=255)
+    hours: float = Field(gt=0)
+    # Now if left out
+    work_date: Optional[datetime] = None
+
+
+class TimesheetUpdate(BaseModel):
+    task_id: Optional[uuid.UUID] = None
+    description: Optional[str] = Field(default=None, max_length=255)
+    hours: Optional[float] = Field(default=None, gt=0)
+    work_date: Optional[datetime] = None
+
+
+class TimesheetResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    task_id: uuid.UUID
+    user_id: uuid.UUID
+    description: str
+    hours: float
+    work_date: datetime
+
+
+class TimesheetRollupResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    task_id: uuid.UUID
+    week_start: date
+    hours: float
+    entries: int
+
+
+class TimesheetImportError(BaseModel):
+    # Line in the file, the header is line 1
+    line: int
+    detail: str
+
+
+class TimesheetImportResponse(BaseModel):
+    imported: int = 0
+    rejected: int = 0
+    # The first rejected lines only
+    errors: List[TimesheetImportError] = []
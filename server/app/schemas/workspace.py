@@ -1,5 +1,5 @@
 import uuid
-from pydantic import BaseModel, ConfigDict
+from pydantic import AliasPath, BaseModel, ConfigDict, Field
 from typing import Optional, List
 from app.models.workspace import WorkspaceRole
 
@@ -19,8 +19,11 @@ class WorkspaceUpdate(BaseModel):
 
 
 class WorkspaceMembers(BaseModel):
-    id: uuid.UUID
-    name: str
+    model_config = ConfigDict(from_attributes=True)
+
+    # Read from a WorkspaceMember row and its user
+    id: uuid.UUID = Field(validation_alias="user_id")
+    name: str = Field(validation_alias=AliasPath("user", "full_name"))
     role: WorkspaceRole
 
 
@@ -30,7 +33,7 @@ class WorkspaceResponse(WorkspaceBase):
     id: uuid.UUID
     slug: str
     owner_id: uuid.UUID
-    members: List[WorkspaceMembers] = []
+    members: List[WorkspaceMembers] = Field(default=[], validation_alias="memberships")
 
 # ------- Invite User to Workspace ----
 
@@ -1,5 +1,6 @@
 from sqlmodel import Session
-from app.core.database import engine
+from app.core.database import engine, redis_client
+from app.services.tag_catalog_service import publish_tags_changed
 from app.seed.user import seed_default_first_superuser
 from app.seed.tag import seed_default_tags
 
@@ -7,6 +8,7 @@ from app.seed.tag import seed_default_tags
 def seed_default_datas(*, session: Session):
     seed_default_first_superuser(session=session)
     seed_default_tags(session=session)
+    publish_tags_changed(redis=redis_client)
     print("✅ All Default datas seeded successfully.")
 
 
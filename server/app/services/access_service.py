@@ -0,0 +1,63 @@
+import uuid
+from sqlalchemy import ColumnElement, Select, or_
+from sqlmodel import Session, col, select
+
+from app.models.project import Project, ProjectMember
+from app.models.task import Task
+from app.models.workspace import Workspace, WorkspaceMember
+
+
+def accessible_workspace_ids(*, user_id: uuid.UUID) -> Select:
+    """ Ids of the live workspaces the user owns or is a member of, as a subquery. """
+    return (
+        select(Workspace.id)
+        .where(
+            col(Workspace.deleted_at).is_(None),
+            or_(
+                Workspace.owner_id == user_id,
+                col(Workspace.id).in_(select(WorkspaceMember.workspace_id).where(WorkspaceMember.user_id == user_id)),
+            ),
+        )
+    )
+
+
+def accessible_project_ids(*, user_id: uuid.UUID) -> Select:
+    """ Ids of the projects in the user's workspaces, and of the projects of live
+    workspaces the user is a member of, as a subquery. """
+    return (
+        select(Project.id)
+        .join(Workspace, Workspace.id == Project.workspace_id)
+        .where(
+            col(Workspace.deleted_at).is_(None),
+            or_(
+                col(Project.workspace_id).in_(accessible_workspace_ids(user_id=user_id)),
+                col(Project.id).in_(select(ProjectMember.project_id).where(ProjectMember.user_id == user_id)),
+            ),
+        )
+    )
+
+
+def can_access_workspace(*, session: Session, workspace_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+    """ Check if the workspace exists, is not deleted and the user owns it or is a member. """
+    return session.exec(
+        accessible_workspace_ids(user_id=user_id).where(Workspace.id == workspace_id)
+    ).first() is not None
+
+
+def can_access_project(*, session: Session, project_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+    """ Check if the project exists and the user can see it through its workspace or a project membership. """
+    return session.exec(
+        accessible_project_ids(user_id=user_id).where(Project.id == project_id)
+    ).first() is not None
+
+
+def accessible_tasks(*, user_id: uuid.UUID) -> ColumnElement[bool]:
+    """ Condition on Task matching the tasks the user owns and the tasks of the projects they can see. """
+    return or_(Task.owner_id == user_id, col(Task.project_id).in_(accessible_project_ids(user_id=user_id)))
+
+
+def can_access_task(*, session: Session, task_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+    """ Check if the task exists and the user owns it or can see its project. """
+    return session.exec(
+        select(Task.id).where(Task.id == task_id, accessible_tasks(user_id=user_id))
+    ).first() is not None
@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import Table, delete, insert
+from sqlmodel import Session, col, select
+from typing import Optional
+
+from app.core.config import settings
+from app.models.archive import (
+    comments_archive,
+    task_tags_archive,
+    tasks_archive,
+    timesheet_rollups_archive,
+    timesheets_archive,
+)
+from app.models.comment import Comment
+from app.models.tag import TaskTag
+from app.models.task import Task
+from app.models.timesheet import Timesheet, TimesheetRollup
+
+# Rows pointing at a task, moved before the task itself (live table, archive table)
+_TASK_CHILDREN: list[tuple[Table, Table]] = [
+    (Comment.__table__, comments_archive),
+    (Timesheet.__table__, timesheets_archive),
+    (TimesheetRollup.__table__, timesheet_rollups_archive),
+    (TaskTag.__table__, task_tags_archive),
+]
+
+
+def _move(*, session: Session, source: Table, archive: Table, where) -> None:
+    """ Copy the matching rows into the archive table and delete them, as two set-based statements. """
+    # Named columns, the live table may have more (the search_vector on Postgres)
+    columns = [column.name for column in archive.columns]
+    session.execute(insert(archive).from_select(columns, source.select().with_only_columns(*(source.c[name] for name in columns)).where(where)))
+    session.execute(delete(source).where(where))
+
+
+def archive_tasks(*, session: Session, older_than_days: Optional[int] = None, batch_size: Optional[int] = None) -> int:
+    """ Move tasks archived more than `older_than_days` ago to tasks_archive, with their
+    comments, timesheets, rollups and tag links, `batch_size` tasks per transaction.
+
+    The oldest archived tasks go first, picked through the small partial
+    ix_tasks_archived_at index, so every batch is a few set-based statements and
+    the live tables only keep the working set. Safe to stop and run again.
+    Returns the number of tasks moved.
+    """
+    older_than_days = settings.TASK_ARCHIVE_AFTER_DAYS if older_than_days is None else older_than_days
+    batch_size = batch_size or settings.TASK_ARCHIVE_BATCH_SIZE
+    cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+    moved = 0
+    while True:
+        task_ids = list(session.exec(
+            select(Task.id)
+            .where(col(Task.is_archived), col(Task.archived_at) < cutoff)
+            .order_by(Task.archived_at)
+            .limit(batch_size)
+            # Postgres: a task being un-archived right now waits for this batch (or is skipped)
+            .with_for_update(skip_locked=True)
+        ).all())
+        if not task_ids:
+            return moved
+        for source, archive in _TASK_CHILDREN:
+            _move(session=session, source=source, archive=archive, where=source.c.task_id.in_(task_ids))
+        _move(session=session, source=Task.__table__, archive=tasks_archive, where=Task.__table__.c.id.in_(task_ids))
+        session.commit()
+        moved += len(task_ids)
+
@@ -0,0 +1,135 @@
+import uuid
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from pydantic import BaseModel, ValidationError
+from redis import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import and_, case, func, not_
+from sqlmodel import Session, col, select
+
+from app.core.config import settings
+from app.models.task import Task, TaskPriority, TaskStatus
+from app.schemas.board import BoardCell, BoardSummaryResponse
+
+# Tasks in these statuses are never overdue
+CLOSED_STATUSES = (TaskStatus.DONE, TaskStatus.CANCELLED)
+
+
+# -----------------------------
+# Cached summaries
+# -----------------------------
+# Per scope ("user" or "project") we keep:
+#   board_version:{scope}:{id}  int   bumped (INCR) on every task write in the scope
+#   board_summary:{scope}:{id}  json  {"version": ..., "summary": ...}, kept while the version matches
+# Both are read with one MGET.
+class _CacheEntry(BaseModel):
+    version: int
+    summary: BoardSummaryResponse
+
+
+def _version_key(scope: str, scope_id: uuid.UUID) -> str:
+    return f"board_version:{scope}:{scope_id}"
+
+
+def _summary_key(scope: str, scope_id: uuid.UUID) -> str:
+    return f"board_summary:{scope}:{scope_id}"
+
+
+def _cached_summary(*, redis: Redis, scope: str, scope_id: uuid.UUID) -> tuple[BoardSummaryResponse | None, int | None]:
+    """ The cached summary if still current, and the scope's version (None when Redis is down). """
+    try:
+        version, cached = redis.mget(_version_key(scope, scope_id), _summary_key(scope, scope_id))
+    except RedisError:
+        return None, None
+    version = int(version or 0)
+    if cached is None:
+        return None, version
+    try:
+        entry = _CacheEntry.model_validate_json(cached)
+    except ValidationError:
+        return None, version
+    return (entry.summary if entry.version == version else None), version
+
+
+def _store_summary(*, redis: Redis, scope: str, scope_id: uuid.UUID, version: int, summary: BoardSummaryResponse) -> None:
+    entry = _CacheEntry(version=version, summary=summary)
+    try:
+        redis.set(_summary_key(scope, scope_id), entry.model_dump_json(),
+                  ex=settings.BOARD_SUMMARY_CACHE_SECONDS)
+    except RedisError:
+        pass
+
+
+def compute_board_summary(*, session: Session, owner_id: uuid.UUID | None = None, project_id: uuid.UUID | None = None) -> BoardSummaryResponse:
+    """ Task counts by status and priority (archived tasks left out), in one GROUP BY. """
+    overdue = and_(col(Task.due_date) < datetime.now(timezone.utc), col(Task.status).not_in(CLOSED_STATUSES))
+    statement = (
+        select(Task.status, Task.priority, func.count(), func.coalesce(func.sum(case((overdue, 1), else_=0)), 0))
+        # Written as the predicate of the partial ix_tasks_open_* indexes, so they are used
+        .where(not_(col(Task.is_archived)))
+        .group_by(Task.status, Task.priority)
+    )
+    if owner_id is not None:
+        statement = statement.where(Task.owner_id == owner_id)
+    if project_id is not None:
+        statement = statement.where(Task.project_id == project_id)
+    counts = {(status, priority): (count, late) for status, priority, count, late in session.exec(statement).all()}
+
+    cells = []
+    for status in TaskStatus:
+        for priority in TaskPriority:
+            count, late = counts.get((status, priority), (0, 0))
+            cells.append(BoardCell(status=status, priority=priority, count=count, overdue=late))
+    return BoardSummaryResponse(
+        cells=cells,
+        total=sum(cell.count for cell in cells),
+        overdue=sum(cell.overdue for cell in cells),
+    )
+
+
+def _scope(owner_id: uuid.UUID | None, project_id: uuid.UUID | None) -> tuple[str, uuid.UUID]:
+    return ("project", project_id) if project_id is not None else ("user", owner_id)
+
+
+def get_cached_board_summary(*, redis: Redis, owner_id: uuid.UUID | None = None, project_id: uuid.UUID | None = None) -> tuple[BoardSummaryResponse | None, int | None]:
+    """ The cached summary of the scope if no task in it changed, and the scope's version
+    to store a fresh one under (None when Redis is down). No database access. """
+    scope, scope_id = _scope(owner_id, project_id)
+    return _cached_summary(redis=redis, scope=scope, scope_id=scope_id)
+
+
+def store_board_summary(*, redis: Redis, version: int, summary: BoardSummaryResponse, owner_id: uuid.UUID | None = None, project_id: uuid.UUID | None = None) -> None:
+    """ Cache a summary computed after `get_cached_board_summary` returned `version`. """
+    scope, scope_id = _scope(owner_id, project_id)
+    _store_summary(redis=redis, scope=scope, scope_id=scope_id, version=version, summary=summary)
+
+
+def get_board_summary(*, session: Session, redis: Redis, owner_id: uuid.UUID | None = None, project_id: uuid.UUID | None = None) -> BoardSummaryResponse:
+    """ Board summary of a user's tasks or of a project, from Redis while no task in it changed.
+
+    Cached entries also expire after BOARD_SUMMARY_CACHE_SECONDS, since tasks become
+    overdue without being written.
+    """
+    # The version is read before the query, a write made meanwhile bumps it past the stored one
+    summary, version = get_cached_board_summary(redis=redis, owner_id=owner_id, project_id=project_id)
+    if summary is not None:
+        return summary
+    summary = compute_board_summary(session=session, owner_id=owner_id, project_id=project_id)
+    if version is not None:
+        store_board_summary(redis=redis, version=version, summary=summary, owner_id=owner_id, project_id=project_id)
+    return summary
+
+
+def invalidate_board_summaries(*, redis: Redis, owner_ids: Iterable[uuid.UUID] = (), project_ids: Iterable[uuid.UUID] = ()) -> None:
+    """ Bump the version of every scope the written tasks belong to (after the commit). """
+    keys = {_version_key("user", owner_id) for owner_id in owner_ids}
+    keys |= {_version_key("project", project_id) for project_id in project_ids if project_id is not None}
+    if not keys:
+        return
+    try:
+        pipe = redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.incr(key)
+        pipe.execute()
+    except RedisError:
+        pass
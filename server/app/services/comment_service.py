@@ -0,0 +1,55 @@
+import uuid
+from datetime import datetime, timezone
+from sqlalchemy.orm import joinedload
+from sqlmodel import Session, select
+from typing import List, Optional
+
+from app.models.comment import Comment
+from app.schemas.comment import CommentCreate, CommentUpdate
+from app.utils.pagination import keyset_paginate
+
+# Many-to-one, so joined into the page query itself (LIMIT still applies to comments)
+_AUTHOR_LOADER = joinedload(Comment.author, innerjoin=True)
+
+
+def get_comment_by_id(*, session: Session, comment_id: uuid.UUID) -> Comment | None:
+    """ Get Comment by comment_id, with its author loaded for the response. """
+    return session.get(Comment, comment_id, options=[_AUTHOR_LOADER], populate_existing=True)
+
+
+def get_task_comments(*, session: Session, task_id: uuid.UUID, limit: int = 20, cursor: Optional[str] = None) -> tuple[List[Comment], Optional[str]]:
+    """ A page of the task's comments, newest first, authors joined in.
+
+    One range scan of ix_comments_task_id_created_at_id, already in page
+    order, so nothing is sorted however many comments the task has.
+    """
+    return keyset_paginate(
+        session=session,
+        statement=select(Comment).where(Comment.task_id == task_id).options(_AUTHOR_LOADER),
+        created_at=Comment.created_at,
+        id=Comment.id,
+        limit=limit,
+        cursor=cursor,
+        descending=True,
+    )
+
+
+def create_comment(*, session: Session, task_id: uuid.UUID, comment_create: CommentCreate, author_id: uuid.UUID) -> Comment:
+    """ Comment on a task as the logged in user. """
+    comment = Comment.model_validate(comment_create, update={"task_id": task_id, "author_id": author_id})
+    session.add(comment)
+    session.commit()
+    return get_comment_by_id(session=session, comment_id=comment.id)
+
+
+def update_comment(*, session: Session, task_id: uuid.UUID, comment_id: uuid.UUID, comment_update: CommentUpdate, author_id: uuid.UUID) -> Comment | None:
+    """ Edit a comment (only by its author), marking it as edited. """
+    comment = get_comment_by_id(session=session, comment_id=comment_id)
+    if comment is None or comment.task_id != task_id or comment.author_id != author_id:
+        return None
+    comment.content = comment_update.content
+    comment.is_edited = True
+    comment.updated_at = datetime.now(timezone.utc)
+    session.add(comment)
+    session.commit()
+    return get_comment_by_id(session=session, comment_id=comment_id)
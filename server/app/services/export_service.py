@@ -0,0 +1,142 @@
+import csv
+import io
+import json
+import uuid
+import zlib
+from collections.abc import Iterator
+from datetime import date, datetime
+from enum import Enum
+from sqlalchemy import Select, select
+from sqlmodel import Session
+from typing import Any, Literal
+
+from app.models.archive import comments_archive, tasks_archive, timesheets_archive
+from app.models.comment import Comment
+from app.models.project import Project
+from app.models.task import Task
+from app.models.timesheet import Timesheet
+
+ExportFormat = Literal["ndjson", "csv"]
+ExportResource = Literal["projects", "tasks", "comments", "timesheets"]
+EXPORT_RESOURCES: tuple[ExportResource, ...] = ("projects", "tasks", "comments", "timesheets")
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_YIELD_PER = 2000
+# Bytes gathered before a chunk is sent
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+
+def _export_statement(resource: ExportResource, workspace_id: uuid.UUID, archived: bool = False) -> Select:
+    """ Plain column select of one resource of the workspace, no ORM objects are built.
+
+    With `archived`, the rows moved to the *_archive tables instead (no projects there).
+    """
+    projects = Project.__table__
+    tasks = tasks_archive if archived else Task.__table__
+    project_ids = select(projects.c.id).where(projects.c.workspace_id == workspace_id)
+    task_ids = select(tasks.c.id).where(tasks.c.project_id.in_(project_ids))
+    if resource == "projects":
+        return select(projects).where(projects.c.workspace_id == workspace_id)
+    if resource == "tasks":
+        return select(tasks).where(tasks.c.project_id.in_(project_ids))
+    # Unordered on purpose, sorting millions of rows would only slow the first byte down
+    if resource == "comments":
+        table = comments_archive if archived else Comment.__table__
+    else:
+        table = timesheets_archive if archived else Timesheet.__table__
+    return select(table).where(table.c.task_id.in_(task_ids))
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _stream_rows(*, session: Session, resource: ExportResource, workspace_id: uuid.UUID, include_archived: bool) -> Iterator[tuple[list[str], Any]]:
+    # Live rows, then the archived ones (same columns), projects are never archived
+    sources = (False, True) if include_archived and resource != "projects" else (False,)
+    for archived in sources:
+        # stream_results: a server-side cursor on Postgres, so only one batch is in memory
+        result = session.connection().execution_options(yield_per=EXPORT_YIELD_PER).execute(
+            _export_statement(resource, workspace_id, archived))
+        columns = list(result.keys())
+        for row in result:
+            yield columns, row
+
+
+def _ndjson_lines(*, session: Session, resources: tuple[ExportResource, ...], workspace_id: uuid.UUID, include_archived: bool) -> Iterator[str]:
+    for resource in resources:
+        kind = resource[:-1]
+        for columns, row in _stream_rows(
+                session=session, resource=resource, workspace_id=workspace_id, include_archived=include_archived):
+            record = {"type": kind, **{column: _plain(value) for column, value in zip(columns, row)}}
+            yield json.dumps(record, separators=(",", ":")) + "\n"
+
+
+def _csv_lines(*, session: Session, resource: ExportResource, workspace_id: uuid.UUID, include_archived: bool) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    header_written = False
+    for columns, row in _stream_rows(
+            session=session, resource=resource, workspace_id=workspace_id, include_archived=include_archived):
+        if not header_written:
+            writer.writerow(columns)
+            header_written = True
+        writer.writerow([_plain(value) for value in row])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if not header_written:
+        yield ",".join(_export_statement(resource, workspace_id).selected_columns.keys()) + "\r\n"
+
+
+def iter_workspace_export(
+    *,
+    session: Session,
+    workspace_id: uuid.UUID,
+    export_format: ExportFormat = "ndjson",
+    resource: ExportResource | None = None,
+    compress: bool = False,
+    include_archived: bool = False,
+) -> Iterator[bytes]:
+    """ Stream a workspace export as bytes, chunk by chunk.
+
+    NDJSON holds one object per line with a "type" (project, task, comment,
+    timesheet), all resources unless one is asked for. CSV holds one resource
+    (projects when not given). Rows go straight from the cursor to text, and
+    with `compress` through a streaming gzip, so memory does not grow with the
+    workspace. `include_archived` adds the tasks (and their rows) moved to the
+    archive tables after each resource's live rows.
+    """
+    if export_format == "csv":
+        lines = _csv_lines(
+            session=session, resource=resource or "projects", workspace_id=workspace_id,
+            include_archived=include_archived)
+    else:
+        resources = (resource,) if resource else EXPORT_RESOURCES
+        lines = _ndjson_lines(
+            session=session, resources=resources, workspace_id=workspace_id, include_archived=include_archived)
+
+    compressor = zlib.compressobj(wbits=31) if compress else None
+    pending: list[bytes] = []
+    size = 0
+    for line in lines:
+        data = line.encode()
+        pending.append(data)
+        size += len(data)
+        if size >= EXPORT_CHUNK_BYTES:
+            chunk = b"".join(pending)
+            pending, size = [], 0
+            chunk = compressor.compress(chunk) if compressor else chunk
+            if chunk:
+                yield chunk
+    chunk = b"".join(pending)
+    if compressor:
+        chunk = compressor.compress(chunk) + compressor.flush()
+    if chunk:
+        yield chunk
@@ -0,0 +1,307 @@
+import json
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AbstractContextManager
+from redis import Redis
+from redis.exceptions import RedisError
+from sqlmodel import Session
+from typing import Any, Callable, NamedTuple, Optional
+
+from app.core.config import settings
+from app.models.workspace import WorkspaceRole
+from app.services import workspace_purge_service, workspace_service
+
+logger = logging.getLogger(__name__)
+
+
+# -----------------------------
+# Queue
+# -----------------------------
+# In Redis:
+#   jobs:queue               zset  job_id scored by the time it may run (unix seconds)
+#   jobs:running             zset  job_id scored by its visibility deadline
+#   jobs:dead                list  job_ids out of attempts (their hash is kept)
+#   jobs:job:{job_id}        hash  name, kwargs (json), attempts, max_attempts, token, error
+#   jobs:idempotency:{key}   str   job_id enqueued with the key, expires
+# A claim moves the job from queue to running under a fresh token. Finishing,
+# failing or extending a job checks the token, so a worker whose job was
+# recovered after its deadline cannot touch it anymore. The scripts address
+# the job hashes by id, so the queue needs a single Redis (no cluster).
+QUEUE_KEY = "jobs:queue"
+RUNNING_KEY = "jobs:running"
+DEAD_KEY = "jobs:dead"
+JOB_KEY_PREFIX = "jobs:job:"
+
+ENQUEUE_JOB_SCRIPT = """
+if ARGV[6] ~= '0' then
+    local existing = redis.call('GET', KEYS[3])
+    if existing then
+        return existing
+    end
+    redis.call('SET', KEYS[3], ARGV[1], 'EX', ARGV[6])
+end
+redis.call('HSET', KEYS[2], 'name', ARGV[2], 'kwargs', ARGV[3], 'attempts', 0, 'max_attempts', ARGV[4])
+redis.call('ZADD', KEYS[1], ARGV[5], ARGV[1])
+return ARGV[1]
+"""
+
+# Oldest due job of the queue, moved to running until now + visibility timeout
+CLAIM_JOB_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, 1)
+if #due == 0 then
+    return false
+end
+local job_id = due[1]
+local job = ARGV[4] .. job_id
+redis.call('ZREM', KEYS[1], job_id)
+redis.call('ZADD', KEYS[2], tonumber(ARGV[1]) + tonumber(ARGV[3]), job_id)
+redis.call('HSET', job, 'token', ARGV[2])
+local attempts = redis.call('HINCRBY', job, 'attempts', 1)
+return {job_id, redis.call('HGET', job, 'name'), redis.call('HGET', job, 'kwargs'),
+        attempts, redis.call('HGET', job, 'max_attempts')}
+"""
+
+# ARGV[3]: 'done' removes the job, 'dead' parks it, a number requeues it at that time
+RELEASE_JOB_SCRIPT = """
+if redis.call('HGET', KEYS[2], 'token') ~= ARGV[1] then
+    return 0
+end
+redis.call('ZREM', KEYS[1], ARGV[2])
+if ARGV[3] == 'done' then
+    redis.call('DEL', KEYS[2])
+    return 1
+end
+redis.call('HSET', KEYS[2], 'error', ARGV[4])
+redis.call('HDEL', KEYS[2], 'token')
+if ARGV[3] == 'dead' then
+    redis.call('RPUSH', KEYS[4], ARGV[2])
+else
+    redis.call('ZADD', KEYS[3], ARGV[3], ARGV[2])
+end
+return 1
+"""
+
+EXTEND_JOB_SCRIPT = """
+if redis.call('HGET', KEYS[2], 'token') ~= ARGV[1] then
+    return 0
+end
+return redis.call('ZADD', KEYS[1], 'XX', 'CH', ARGV[3], ARGV[2])
+"""
+
+# Jobs past their visibility deadline (their worker died or hung) go back to
+# the queue, or to the dead list when that was their last attempt
+RECOVER_JOBS_SCRIPT = """
+local stuck = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+for _, job_id in ipairs(stuck) do
+    local job = ARGV[2] .. job_id
+    redis.call('ZREM', KEYS[1], job_id)
+    redis.call('HDEL', job, 'token')
+    redis.call('HSET', job, 'error', 'visibility timeout')
+    local attempts = tonumber(redis.call('HGET', job, 'attempts') or '0')
+    if attempts >= tonumber(redis.call('HGET', job, 'max_attempts') or '1') then
+        redis.call('RPUSH', KEYS[3], job_id)
+    else
+        redis.call('ZADD', KEYS[2], ARGV[1], job_id)
+    end
+end
+return #stuck
+"""
+
+
+class Job(NamedTuple):
+    """ A claimed job, `token` proves the claim. """
+    id: str
+    name: str
+    kwargs: dict[str, Any]
+    attempts: int
+    max_attempts: int
+    token: str
+
+
+def enqueue_job(*, redis: Redis, name: str, kwargs: Optional[dict[str, Any]] = None, idempotency_key: Optional[str] = None,
+                delay_seconds: float = 0, max_attempts: Optional[int] = None) -> str:
+    """ Queue job `name` to run with `kwargs` (JSON) in `delay_seconds`. With an
+    idempotency key, enqueuing again while the key lives returns the first job's id. """
+    if name not in JOBS:
+        raise ValueError(f"Unknown job {name!r}")
+    enqueue = redis.register_script(ENQUEUE_JOB_SCRIPT)
+    job_id = uuid.uuid4().hex
+    queued = enqueue(
+        keys=[QUEUE_KEY, JOB_KEY_PREFIX + job_id, f"jobs:idempotency:{idempotency_key or ''}"],
+        args=[
+            job_id,
+            name,
+            json.dumps(kwargs or {}, default=str),
+            max_attempts or settings.JOB_MAX_ATTEMPTS,
+            time.time() + delay_seconds,
+            settings.JOB_IDEMPOTENCY_TTL_SECONDS if idempotency_key else 0,
+        ],
+    )
+    return queued.decode() if isinstance(queued, bytes) else queued
+
+
+def claim_job(*, redis: Redis, visibility_timeout: Optional[float] = None) -> Job | None:
+    """ Claim the oldest due job for `visibility_timeout` seconds, None when nothing is due. """
+    claim = redis.register_script(CLAIM_JOB_SCRIPT)
+    token = uuid.uuid4().hex
+    claimed = claim(
+        keys=[QUEUE_KEY, RUNNING_KEY],
+        args=[time.time(), token, visibility_timeout or settings.JOB_VISIBILITY_TIMEOUT_SECONDS, JOB_KEY_PREFIX],
+    )
+    if not claimed:
+        return None
+    job_id, name, kwargs, attempts, max_attempts = claimed
+    return Job(job_id.decode(), name.decode(), json.loads(kwargs), int(attempts), int(max_attempts), token)
+
+
+def _release(*, redis: Redis, job: Job, outcome: str, error: str = "") -> bool:
+    release = redis.register_script(RELEASE_JOB_SCRIPT)
+    return bool(release(
+        keys=[RUNNING_KEY, JOB_KEY_PREFIX + job.id, QUEUE_KEY, DEAD_KEY],
+        args=[job.token, job.id, outcome, error],
+    ))
+
+
+def complete_job(*, redis: Redis, job: Job) -> bool:
+    """ Remove a finished job. False if the claim was lost (the job was recovered). """
+    return _release(redis=redis, job=job, outcome="done")
+
+
+def retry_delay(attempts: int) -> float:
+    """ Exponential backoff after the `attempts`-th failed attempt, capped. """
+    return min(settings.JOB_RETRY_BASE_DELAY_SECONDS * 2 ** (attempts - 1), settings.JOB_RETRY_MAX_DELAY_SECONDS)
+
+
+def fail_job(*, redis: Redis, job: Job, error: str) -> bool:
+    """ Requeue a failed job after its backoff, or park it in jobs:dead after its
+    last attempt. False if the claim was lost (the job was recovered). """
+    if job.attempts >= job.max_attempts:
+        return _release(redis=redis, job=job, outcome="dead", error=error)
+    return _release(redis=redis, job=job, outcome=str(time.time() + retry_delay(job.attempts)), error=error)
+
+
+def extend_job(*, redis: Redis, job: Job, visibility_timeout: Optional[float] = None) -> bool:
+    """ Push the visibility deadline of a running job. False if the claim was lost. """
+    extend = redis.register_script(EXTEND_JOB_SCRIPT)
+    deadline = time.time() + (visibility_timeout or settings.JOB_VISIBILITY_TIMEOUT_SECONDS)
+    return bool(extend(keys=[RUNNING_KEY, JOB_KEY_PREFIX + job.id], args=[job.token, job.id, deadline]))
+
+
+def recover_stuck_jobs(*, redis: Redis) -> int:
+    """ Requeue the running jobs past their visibility deadline. Returns how many. """
+    recover = redis.register_script(RECOVER_JOBS_SCRIPT)
+    return recover(keys=[RUNNING_KEY, QUEUE_KEY, DEAD_KEY], args=[time.time(), JOB_KEY_PREFIX])
+
+
+# -----------------------------
+# Jobs
+# -----------------------------
+# Called with a fresh session and the job's kwargs as they came out of JSON
+def _create_default_workspace(*, session: Session, user_id: str, user_name: str) -> None:
+    workspace_service.create_default_workspace_for_user(
+        session=session, user_id=uuid.UUID(user_id), user_name=user_name)
+
+
+def _invite_user(*, session: Session, workspace_id: str, inviter_id: str, email: str, role: str) -> None:
+    workspace_service.invite_user_to_workspace(
+        session=session, workspace_id=uuid.UUID(workspace_id), inviter_id=uuid.UUID(inviter_id),
+        email=email, role=WorkspaceRole(role))
+
+
+def _purge_workspace(*, session: Session, workspace_id: str) -> None:
+    workspace_purge_service.purge_workspace(session=session, workspace_id=uuid.UUID(workspace_id))
+
+
+JOBS: dict[str, Callable[..., None]] = {
+    "create_default_workspace": _create_default_workspace,
+    "invite_user": _invite_user,
+    "purge_workspace": _purge_workspace,
+}
+
+
+# -----------------------------
+# Worker
+# -----------------------------
+class Worker:
+    """ Runs queued jobs, `concurrency` at a time on a thread pool.
+
+    While a job runs its visibility deadline is extended, a job whose worker
+    died is picked up again once the deadline passes (by any worker). Jobs are
+    retried with backoff until max_attempts, then parked in jobs:dead.
+    """
+
+    def __init__(self, *, redis: Redis, session_factory: Callable[[], AbstractContextManager[Session]],
+                 concurrency: Optional[int] = None, poll_interval: Optional[float] = None,
+                 visibility_timeout: Optional[float] = None):
+        self.redis = redis
+        self.session_factory = session_factory
+        self.concurrency = concurrency or settings.JOB_CONCURRENCY
+        self.poll_interval = poll_interval or settings.JOB_POLL_INTERVAL_SECONDS
+        self.visibility_timeout = visibility_timeout or settings.JOB_VISIBILITY_TIMEOUT_SECONDS
+
+    def run_job(self, job: Job) -> bool:
+        """ Run one claimed job and complete or fail it. Returns whether it succeeded. """
+        try:
+            with self.session_factory() as session:
+                try:
+                    JOBS[job.name](session=session, **job.kwargs)
+                except Exception:
+                    session.rollback()
+                    raise
+        except Exception as exc:
+            logger.exception("Job %s (%s) failed, attempt %d of %d", job.id, job.name, job.attempts, job.max_attempts)
+            self._release(fail_job, job=job, error=repr(exc))
+            return False
+        self._release(complete_job, job=job)
+        return True
+
+    def _release(self, release: Callable[..., bool], **kwargs: Any) -> None:
+        """ Complete or fail a job. Without Redis the job stays claimed, it is
+        run again once its visibility deadline passes (jobs are at least once). """
+        try:
+            release(redis=self.redis, **kwargs)
+        except RedisError:
+            logger.exception("Could not release job %s, it will run again", kwargs["job"].id)
+
+    def drain(self) -> int:
+        """ Run the due jobs one by one until none is left. Returns how many ran. """
+        ran = 0
+        while (job := claim_job(redis=self.redis, visibility_timeout=self.visibility_timeout)) is not None:
+            self.run_job(job)
+            ran += 1
+        return ran
+
+    def run(self, stop: threading.Event) -> None:
+        """ Claim and run jobs until `stop` is set, then wait for the running ones. """
+        running: dict[Future, Job] = {}
+        # Deadlines are extended and stuck jobs recovered a few times per timeout
+        upkeep_interval = self.visibility_timeout / 3
+        last_upkeep = 0.0
+        # Wait before the next Redis call while Redis is failing, doubled up to a cap
+        redis_backoff = 0.0
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="job") as pool:
+            while not stop.is_set():
+                for future in [future for future in running if future.done()]:
+                    del running[future]
+                try:
+                    if time.monotonic() - last_upkeep >= upkeep_interval:
+                        for job in running.values():
+                            extend_job(redis=self.redis, job=job, visibility_timeout=self.visibility_timeout)
+                        recover_stuck_jobs(redis=self.redis)
+                        last_upkeep = time.monotonic()
+                    job = None
+                    if len(running) < self.concurrency:
+                        job = claim_job(redis=self.redis, visibility_timeout=self.visibility_timeout)
+                except RedisError:
+                    redis_backoff = min(max(redis_backoff * 2, self.poll_interval), settings.JOB_REDIS_MAX_BACKOFF_SECONDS)
+                    logger.exception("Redis unavailable, retrying in %.1fs", redis_backoff)
+                    stop.wait(redis_backoff)
+                    continue
+                redis_backoff = 0.0
+                if job is not None:
+                    running[pool.submit(self.run_job, job)] = job
+                else:
+                    stop.wait(self.poll_interval)
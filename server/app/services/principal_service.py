@@ -0,0 +1,117 @@
+import time
+import uuid
+from redis import Redis
+from redis.exceptions import RedisError
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.models.user import User
+from app.schemas.auth import UserPrincipal
+from app.utils.cache import ExpiringLRUCache
+
+# Tier 1: per process, short TTL so other workers pick up changes quickly
+local_principal_cache = ExpiringLRUCache(max_size=settings.PRINCIPAL_CACHE_SIZE)
+
+
+def _principal_key(user_id: uuid.UUID) -> str:
+    return f"principal:{user_id}"
+
+
+def _principal_to_redis(principal: UserPrincipal) -> dict[str, str]:
+    return {
+        "id": str(principal.id),
+        "full_name": principal.full_name,
+        "email": principal.email,
+        "image_url": principal.image_url or "",
+        "is_active": "1" if principal.is_active else "0",
+        "is_superuser": "1" if principal.is_superuser else "0",
+        "created_at": principal.created_at.isoformat(),
+        "updated_at": principal.updated_at.isoformat(),
+    }
+
+
+def _principal_from_redis(data: dict[bytes, bytes]) -> UserPrincipal:
+    fields = {key.decode(): value.decode() for key, value in data.items()}
+    return UserPrincipal(
+        id=fields["id"],
+        full_name=fields["full_name"],
+        email=fields["email"],
+        image_url=fields["image_url"] or None,
+        is_active=fields["is_active"] == "1",
+        is_superuser=fields["is_superuser"] == "1",
+        created_at=fields["created_at"],
+        updated_at=fields["updated_at"],
+    )
+
+
+def get_principal_from_redis(*, redis: Redis, user_id: uuid.UUID) -> UserPrincipal | None:
+    """ Tier 2: shared Redis hash. Redis errors are treated as a miss. """
+    try:
+        data = redis.hgetall(_principal_key(user_id))
+    except RedisError:
+        return None
+    return _principal_from_redis(data) if data else None
+
+
+def store_principal_in_redis(*, redis: Redis, principal: UserPrincipal) -> None:
+    key = _principal_key(principal.id)
+    try:
+        pipe = redis.pipeline()
+        pipe.hset(key, mapping=_principal_to_redis(principal))
+        pipe.expire(key, settings.PRINCIPAL_CACHE_REDIS_TTL_SECONDS)
+        pipe.execute()
+    except RedisError:
+        pass
+
+
+def get_cached_principal(*, redis: Redis, user_id: uuid.UUID) -> UserPrincipal | None:
+    """ Return the user's principal from the local cache, then Redis (a Redis hit fills the
+    local cache). None on a miss or when the cache is disabled. No database access. """
+    if not settings.PRINCIPAL_CACHE_ENABLED:
+        return None
+    principal = local_principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+    principal = get_principal_from_redis(redis=redis, user_id=user_id)
+    if principal is not None:
+        _cache_locally(principal)
+    return principal
+
+
+def load_principal(*, session: Session, user_id: uuid.UUID) -> UserPrincipal | None:
+    """ Load the user's principal from the database, without touching the caches. """
+    user = session.get(User, user_id)
+    return UserPrincipal.model_validate(user) if user else None
+
+
+def cache_principal(*, redis: Redis, principal: UserPrincipal) -> None:
+    """ Fill Redis and the local cache with a principal loaded from the database. """
+    if not settings.PRINCIPAL_CACHE_ENABLED:
+        return
+    store_principal_in_redis(redis=redis, principal=principal)
+    _cache_locally(principal)
+
+
+def get_principal(*, session: Session, redis: Redis, user_id: uuid.UUID) -> UserPrincipal | None:
+    """ Return the user's principal from the local cache, then Redis, then the database. """
+    principal = get_cached_principal(redis=redis, user_id=user_id)
+    if principal is None:
+        principal = load_principal(session=session, user_id=user_id)
+        if principal is not None:
+            cache_principal(redis=redis, principal=principal)
+    return principal
+
+
+def _cache_locally(principal: UserPrincipal) -> None:
+    local_principal_cache.set(
+        principal.id, principal,
+        expires_at=time.time() + settings.PRINCIPAL_CACHE_LOCAL_TTL_SECONDS)
+
+
+def invalidate_principal(*, redis: Redis, user_id: uuid.UUID) -> None:
+    """ Drop the cached principal after the user is updated or deactivated. """
+    local_principal_cache.delete(user_id)
+    try:
+        redis.delete(_principal_key(user_id))
+    except RedisError:
+        pass
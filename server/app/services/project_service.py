@@ -1,9 +1,14 @@
 import uuid
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
-from typing import List
+from typing import List, Optional
 
-from app.models.project import Project
+from app.models.project import Project, ProjectStatus
 from app.schemas.project import ProjectCreate
+from app.utils.pagination import keyset_paginate
+
+# Members of any number of projects in one extra query
+_MEMBERS_LOADER = selectinload(Project.members)
 
 
 def create_project_service(*, session: Session, project_create: ProjectCreate, user_id: uuid.UUID) -> Project:
@@ -14,13 +19,17 @@ def create_project_service(*, session: Session, project_create: ProjectCreate, u
     )
     session.add(project_obj)
     session.commit()
-    session.refresh(project_obj)
-    return project_obj
+    return get_project_details_by_id(session=session, project_id=project_obj.id)
 
 
 def get_project_details_by_id(*, session: Session, project_id: uuid.UUID) -> Project | None:
-    """ Get Project details by project_id """
-    return session.get(Project, project_id)
+    """ Get Project details by project_id, with members loaded for the response. """
+    return session.get(
+        Project,
+        project_id,
+        options=[_MEMBERS_LOADER],
+        populate_existing=True,
+    )
 
 
 def check_project_name_exists_for_workspace(*, session: Session, workspace_id: uuid.UUID, project_name: str) -> bool:
@@ -35,8 +44,23 @@ def check_project_name_exists_for_workspace(*, session: Session, workspace_id: u
     return True if project else False
 
 
-def get_all_workspace_projects(*, session: Session, workspace_id: uuid.UUID) -> List[Project]:
-    """ Get all projects in the given workspace id. """
-    return session.exec(
-        select(Project).where(Project.workspace_id == workspace_id)
+def get_all_workspace_projects(
+    *,
+    session: Session,
+    workspace_id: uuid.UUID,
+    status: Optional[ProjectStatus] = None,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+) -> tuple[List[Project], Optional[str]]:
+    """ Get a page of the projects in the given workspace id, optionally only those in `status`. """
+    statement = select(Project).where(Project.workspace_id == workspace_id)
+    if status is not None:
+        statement = statement.where(Project.status == status)
+    return keyset_paginate(
+        session=session,
+        statement=statement.options(_MEMBERS_LOADER),
+        created_at=Project.created_at,
+        id=Project.id,
+        limit=limit,
+        cursor=cursor,
     )
@@ -1,20 +1,187 @@
+import hashlib
+import json
+import time
 import uuid
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 from redis import Redis
+from redis.exceptions import RedisError
 
 
-def store_refresh_token_in_redis(*, redis: Redis, user_id: uuid.UUID, token: str, expiry_days: int = 7) -> None:
-    redis.setex(
-        f"refresh_token:{user_id}",
-        timedelta(days=expiry_days),
-        token
+# -----------------------------
+# Refresh Sessions (one per device)
+# -----------------------------
+# Per user we keep:
+#   refresh_sessions:{user_id}      hash  session_id -> "<sha256(token)>:<meta json>"
+#                                         "_gen"     -> generation the entries belong to
+#   refresh_sessions_exp:{user_id}  zset  session_id scored by expiry (unix seconds)
+#   refresh_generation:{user_id}    int   bumped to revoke every session at once
+# All writes go through Lua scripts so each call is a single round trip.
+GENERATION_FIELD = "_gen"
+
+STORE_REFRESH_SESSION_SCRIPT = """
+local gen = redis.call('GET', KEYS[3]) or '0'
+if redis.call('HGET', KEYS[1], '_gen') ~= gen then
+    redis.call('DEL', KEYS[1], KEYS[2])
+    redis.call('HSET', KEYS[1], '_gen', gen)
+end
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[3])
+if #expired > 0 then
+    redis.call('HDEL', KEYS[1], unpack(expired))
+    redis.call('ZREM', KEYS[2], unpack(expired))
+end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+redis.call('ZADD', KEYS[2], ARGV[4], ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+redis.call('EXPIRE', KEYS[2], ARGV[5])
+return 1
+"""
+
+# Compare the stored token hash with the presented one and swap in the new
+# hash with a fresh expiry, atomically.
+ROTATE_REFRESH_SESSION_SCRIPT = """
+local gen = redis.call('GET', KEYS[3]) or '0'
+if redis.call('HGET', KEYS[1], '_gen') ~= gen then
+    return 0
+end
+local current = redis.call('HGET', KEYS[1], ARGV[1])
+if not current or string.sub(current, 1, 64) ~= ARGV[2] then
+    return 0
+end
+local expires_at = redis.call('ZSCORE', KEYS[2], ARGV[1])
+if not expires_at or tonumber(expires_at) <= tonumber(ARGV[4]) then
+    return 0
+end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[3] .. string.sub(current, 65))
+redis.call('ZADD', KEYS[2], ARGV[5], ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[6])
+redis.call('EXPIRE', KEYS[2], ARGV[6])
+return 1
+"""
+
+refresh_rotation_stats = {
+    "rotations": 0,
+    "rejected": 0,
+    "total_seconds": 0.0,
+    "max_seconds": 0.0,
+}
+
+
+def _session_keys(user_id: uuid.UUID) -> list[str]:
+    return [
+        f"refresh_sessions:{user_id}",
+        f"refresh_sessions_exp:{user_id}",
+        f"refresh_generation:{user_id}",
+    ]
+
+
+def _hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def store_refresh_session(*, redis: Redis, user_id: uuid.UUID, session_id: str, token: str, device: str | None = None, expiry_days: int = 7) -> None:
+    """ Store a refresh session for one device, pruning the user's expired sessions. """
+    now = datetime.now(timezone.utc)
+    expiry = timedelta(days=expiry_days)
+    meta = json.dumps({"device": device, "created_at": now.isoformat()})
+    store = redis.register_script(STORE_REFRESH_SESSION_SCRIPT)
+    store(
+        keys=_session_keys(user_id),
+        args=[
+            session_id,
+            f"{_hash_token(token)}:{meta}",
+            now.timestamp(),
+            (now + expiry).timestamp(),
+            int(expiry.total_seconds()),
+        ],
+    )
+
+
+def rotate_refresh_token(*, redis: Redis, user_id: uuid.UUID, session_id: str, old_token: str, new_token: str, expiry_days: int = 7) -> bool:
+    """ Replace old_token with new_token if old_token is still the session's token. """
+    now = time.time()
+    expiry = timedelta(days=expiry_days)
+    rotate = redis.register_script(ROTATE_REFRESH_SESSION_SCRIPT)
+    started = time.perf_counter()
+    rotated = rotate(
+        keys=_session_keys(user_id),
+        args=[
+            session_id,
+            _hash_token(old_token),
+            _hash_token(new_token),
+            now,
+            now + expiry.total_seconds(),
+            int(expiry.total_seconds()),
+        ],
     )
+    elapsed = time.perf_counter() - started
+
+    refresh_rotation_stats["rotations" if rotated else "rejected"] += 1
+    refresh_rotation_stats["total_seconds"] += elapsed
+    refresh_rotation_stats["max_seconds"] = max(
+        refresh_rotation_stats["max_seconds"], elapsed)
+    return bool(rotated)
+
+
+def revoke_refresh_session(*, redis: Redis, user_id: uuid.UUID, session_id: str) -> None:
+    """ Revoke a single device session. """
+    sessions_key, expiry_key, _ = _session_keys(user_id)
+    pipe = redis.pipeline()
+    pipe.hdel(sessions_key, session_id)
+    pipe.zrem(expiry_key, session_id)
+    pipe.execute()
+
+
+def revoke_all_refresh_sessions(*, redis: Redis, user_id: uuid.UUID) -> None:
+    """ Revoke every session of the user with a single generation bump. """
+    redis.incr(f"refresh_generation:{user_id}")
+
+
+def list_refresh_sessions(*, redis: Redis, user_id: uuid.UUID) -> list[dict]:
+    """ Return the user's live sessions, newest expiry first. """
+    sessions_key, expiry_key, generation_key = _session_keys(user_id)
+    pipe = redis.pipeline(transaction=False)
+    pipe.hgetall(sessions_key)
+    pipe.zrangebyscore(expiry_key, time.time(), "+inf", withscores=True)
+    pipe.get(generation_key)
+    entries, expiries, generation = pipe.execute()
+
+    entries = {key.decode(): value.decode() for key, value in entries.items()}
+    if entries.pop(GENERATION_FIELD, None) != (generation or b"0").decode():
+        return []
+
+    sessions = []
+    for session_id, expires_at in reversed(expiries):
+        session_id = session_id.decode()
+        if session_id not in entries:
+            continue
+        meta = json.loads(entries[session_id][65:])
+        sessions.append({
+            "session_id": session_id,
+            "device": meta["device"],
+            "created_at": datetime.fromisoformat(meta["created_at"]),
+            "expires_at": datetime.fromtimestamp(expires_at, timezone.utc),
+        })
+    return sessions
+
+
+# -----------------------------
+# Read Replicas (sticky primary after a write)
+# -----------------------------
+def _sticky_primary_key(user_id: uuid.UUID) -> str:
+    return f"db_sticky_primary:{user_id}"
 
 
-def get_refresh_token_from_redis(*, redis: Redis, user_id: uuid.UUID) -> str | None:
-    token = redis.get(f"refresh_token:{user_id}")
-    return token.decode() if token else None
+def mark_primary_sticky(*, redis: Redis, user_id: uuid.UUID, seconds: int) -> None:
+    """ Keep the user's reads on the primary for the next few seconds. """
+    try:
+        redis.set(_sticky_primary_key(user_id), 1, ex=seconds)
+    except RedisError:
+        pass
 
 
-def delete_refresh_token_from_Redis(*, redis: Redis, user_id: uuid.UUID) -> None:
-    redis.delete(f"refresh_token:{user_id}")
+def is_primary_sticky(*, redis: Redis, user_id: uuid.UUID) -> bool:
+    """ Whether the user wrote recently. Errs on the primary if Redis is down. """
+    try:
+        return bool(redis.exists(_sticky_primary_key(user_id)))
+    except RedisError:
+        return True
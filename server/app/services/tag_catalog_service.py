@@ -0,0 +1,233 @@
+import bisect
+import threading
+import time
+from redis import Redis
+from redis.client import PubSubWorkerThread
+from redis.exceptions import RedisError
+from sqlmodel import Session, select
+from typing import List, Optional
+
+from app.core.config import settings
+from app.models.tag import Tag
+from app.schemas.tag import TagResponse
+from app.services.tag_service import EXACT_MATCH, PREFIX_MATCH, SIMILAR_MATCH, SEARCH_CURSOR_TYPES
+from app.utils.cursor import decode_cursor, encode_cursor
+from app.utils.text import trigram_similarity, trigrams
+from app.utils.trie import PrefixTrie
+
+# Bumped (INCR) and published on every tag change, workers reload when they see a newer one
+TAGS_VERSION_KEY = "tags:version"
+TAGS_CHANGED_CHANNEL = "tags:changed"
+# pg_trgm's default similarity_threshold, so fuzzy matches agree with Postgres
+SIMILARITY_THRESHOLD = 0.3
+
+
+class TagCatalog:
+    """ Snapshot of every tag, indexed for autocomplete and the exact name check. """
+
+    def __init__(self, *, tags: List[TagResponse], version: int | None):
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.tags = sorted(tags, key=lambda tag: tag.name)
+        self.names = [tag.name for tag in self.tags]
+        self.by_name = {tag.name: tag for tag in self.tags}
+        self.trie: PrefixTrie[TagResponse] = PrefixTrie()
+        self.entries = []
+        for tag in self.tags:
+            key = tag.name.casefold()
+            self.trie.insert(key, tag)
+            self.entries.append((key, trigrams(key), tag))
+
+    def get_by_name(self, name: str) -> TagResponse | None:
+        return self.by_name.get(name)
+
+    def search(self, *, query: Optional[str] = None, limit: int = 20, cursor: Optional[str] = None) -> tuple[List[TagResponse], Optional[str]]:
+        """ Same ranking and cursors as `tag_service.search_tags`, without the database. """
+        query = (query or "").strip().casefold()
+        if not query:
+            start = bisect.bisect_right(self.names, decode_cursor(cursor, types=(str,))[0]) if cursor else 0
+            tags = self.tags[start:start + limit]
+            has_next = start + limit < len(self.tags)
+            return tags, encode_cursor([tags[-1].name]) if has_next else None
+
+        after = decode_cursor(cursor, types=SEARCH_CURSOR_TYPES) if cursor else [EXACT_MATCH, 0.0, "", ""]
+        after_rank, after_score, after_key, after_name = after
+        # Rank, score, key and tag of each match, one more than the limit to detect a next page
+        matches: list[tuple[int, float, str, TagResponse]] = []
+
+        if after_rank <= EXACT_MATCH:
+            matches += [
+                (EXACT_MATCH, 0.0, query, tag) for tag in self.trie.get(query)
+                if not cursor or tag.name > after_name
+            ][:limit + 1]
+
+        if after_rank <= PREFIX_MATCH and len(matches) <= limit:
+            for key, tag in self.trie.iter_prefix(query):
+                if key == query or (after_rank == PREFIX_MATCH and (key, tag.name) <= (after_key, after_name)):
+                    continue
+                matches.append((PREFIX_MATCH, 0.0, key, tag))
+                if len(matches) > limit:
+                    break
+
+        if len(matches) <= limit:
+            query_trigrams = trigrams(query)
+            similar = []
+            for key, key_trigrams, tag in self.entries:
+                if key.startswith(query):
+                    continue
+                score = trigram_similarity(key_trigrams, query_trigrams)
+                if query not in key and score < SIMILARITY_THRESHOLD:
+                    continue
+                if after_rank == SIMILAR_MATCH and (score > after_score or (score == after_score and tag.name <= after_name)):
+                    continue
+                similar.append((SIMILAR_MATCH, score, key, tag))
+            similar.sort(key=lambda match: (-match[1], match[3].name))
+            matches += similar[:limit + 1 - len(matches)]
+
+        tags = [tag for _, _, _, tag in matches[:limit]]
+        if len(matches) <= limit:
+            return tags, None
+        rank, score, key, tag = matches[limit - 1]
+        return tags, encode_cursor([rank, score, key, tag.name])
+
+
+# -----------------------------
+# Per worker catalog
+# -----------------------------
+_catalog: TagCatalog | None = None
+_latest_version = 0
+_listener: PubSubWorkerThread | None = None
+_listener_redis: Redis | None = None
+# Monotonic time before which a failed subscription is not retried
+_listener_retry_at = 0.0
+_lock = threading.Lock()
+
+
+def _on_tags_changed(message: dict) -> None:
+    global _latest_version
+    try:
+        version = int(message["data"])
+    except (TypeError, ValueError):
+        return
+    _latest_version = max(_latest_version, version)
+
+
+def _ensure_listener(redis: Redis) -> bool:
+    """ Subscribe this worker to tag changes, returns False when Redis is unavailable.
+
+    After a failure the subscription is retried at most every TAG_CATALOG_MAX_AGE_SECONDS.
+    """
+    global _listener, _listener_redis, _listener_retry_at
+    if _listener is not None and _listener_redis is redis and _listener.is_alive():
+        return True
+    stop_tag_catalog_listener()
+    if time.monotonic() < _listener_retry_at:
+        return False
+    try:
+        pubsub = redis.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{TAGS_CHANGED_CHANNEL: _on_tags_changed})
+        _listener = pubsub.run_in_thread(sleep_time=1, daemon=True)
+    except RedisError:
+        _listener_retry_at = time.monotonic() + settings.TAG_CATALOG_MAX_AGE_SECONDS
+        return False
+    _listener_redis = redis
+    return True
+
+
+def _read_version(redis: Redis) -> int | None:
+    try:
+        return int(redis.get(TAGS_VERSION_KEY) or 0)
+    except RedisError:
+        return None
+
+
+def _is_fresh(catalog: TagCatalog | None) -> bool:
+    """ Younger than TAG_CATALOG_MAX_AGE_SECONDS and, when loaded with a version, not outdated.
+
+    A catalog loaded without Redis (no version) is fresh for its whole max age.
+    """
+    return (
+        catalog is not None
+        and (catalog.version is None or catalog.version >= _latest_version)
+        and time.monotonic() - catalog.loaded_at < settings.TAG_CATALOG_MAX_AGE_SECONDS
+    )
+
+
+def _is_listening() -> bool:
+    return _listener is not None and _listener.is_alive()
+
+
+def get_cached_tag_catalog() -> TagCatalog | None:
+    """ This worker's catalog if it can be used as is, None when it has to be reloaded. No I/O. """
+    catalog = _catalog
+    if _is_fresh(catalog) and (catalog.version is None or _is_listening()):
+        return catalog
+    return None
+
+
+def read_tag_catalog_version(*, redis: Redis) -> int | None:
+    """ Subscribe this worker to tag changes and read the current version, before a reload.
+
+    None when Redis is unavailable, the reloaded catalog is then used for its whole max age.
+    """
+    global _latest_version
+    with _lock:
+        listening = _ensure_listener(redis)
+    # Read the version first, a change committed while loading bumps it again
+    version = _read_version(redis) if listening else None
+    if version is not None:
+        _latest_version = max(_latest_version, version)
+    return version
+
+
+def load_tag_catalog(*, session: Session, version: int | None) -> TagCatalog:
+    """ Load every tag from the database as this worker's catalog, stamped with `version`. """
+    global _catalog
+    tags = session.exec(select(Tag)).all()
+    catalog = TagCatalog(
+        tags=[TagResponse.model_validate(tag, from_attributes=True) for tag in tags],
+        version=version,
+    )
+    _catalog = catalog
+    return catalog
+
+
+def get_tag_catalog(*, session: Session, redis: Redis) -> TagCatalog:
+    """ Return this worker's tag catalog, (re)loading it from the database when stale.
+
+    Fresh means no newer version was published since it was loaded. Without
+    Redis the catalog is still used, but reloaded every TAG_CATALOG_MAX_AGE_SECONDS.
+    """
+    catalog = get_cached_tag_catalog()
+    if catalog is None:
+        catalog = load_tag_catalog(session=session, version=read_tag_catalog_version(redis=redis))
+    return catalog
+
+
+def publish_tags_changed(*, redis: Redis) -> None:
+    """ Tell every worker (this one included) to reload its catalog. """
+    global _catalog
+    _catalog = None
+    try:
+        version = redis.incr(TAGS_VERSION_KEY)
+        redis.publish(TAGS_CHANGED_CHANNEL, version)
+    except RedisError:
+        pass
+
+
+def stop_tag_catalog_listener() -> None:
+    """ Stop listening for tag changes (on shutdown). """
+    global _listener, _listener_redis
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+        _listener_redis = None
+
+
+def reset_tag_catalog() -> None:
+    """ Drop the catalog and stop the listener. """
+    global _catalog, _latest_version, _listener_retry_at
+    stop_tag_catalog_listener()
+    _catalog = None
+    _latest_version = 0
+    _listener_retry_at = 0.0
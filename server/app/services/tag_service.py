@@ -1,11 +1,20 @@
 import uuid
+from sqlalchemy import and_, func, literal, not_, or_, tuple_
 from sqlmodel import Session, select
-from typing import Optional, List
+from typing import Any, Optional, List
 
 from app.models.tag import Tag
 from app.schemas.tag import (
     TagCreate
 )
+from app.utils.cursor import decode_cursor, encode_cursor
+
+# Search ranks, lower ranks are returned first
+EXACT_MATCH = 0
+PREFIX_MATCH = 1
+SIMILAR_MATCH = 2
+# Search cursor: rank, similarity, sort key, name of the last tag returned
+SEARCH_CURSOR_TYPES = (int, (int, float), str, str)
 
 
 def create_new_tag(*, session: Session, tag_create: TagCreate) -> Tag:
@@ -30,9 +39,79 @@ def get_tag_by_name(*, session: Session, tag_name: uuid.UUID) -> Tag | None:
     return tag
 
 
-def search_tags(*, session: Session, query: Optional[str] = None) -> List[Tag]:
-    stmt = select(Tag)
-    if query:
-        stmt = stmt.where(Tag.name.ilike(f"%{query}%"))
-    tags = session.exec(stmt).all()
-    return tags
+def _escape_like(value: str) -> str:
+    return value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
+def search_tags(*, session: Session, query: Optional[str] = None, limit: int = 20, cursor: Optional[str] = None) -> tuple[List[Tag], Optional[str]]:
+    """ Ranked autocomplete search: exact match, then prefix matches, then similar names.
+
+    Every rank is its own LIMITed query an index can serve (a lower(name) btree
+    for exact and prefix matches, pg_trgm on Postgres for the rest), so a page is
+    at most three short queries. SQLite has no trigram support, it scans names in
+    order for substring matches and ranks them by name.
+    Returns the page and the cursor of the next one (None on the last page).
+    """
+    query = (query or "").strip().lower()
+    if not query:
+        return _list_tags(session=session, limit=limit, cursor=cursor)
+
+    postgres = session.get_bind().dialect.name == "postgresql"
+    lowered = func.lower(Tag.name)
+    sort_key = lowered.collate("C") if postgres else lowered
+    prefix = f"{_escape_like(query)}%"
+    # Postgres needs LIKE for the index, SQLite compares bytes so a range works
+    starts_with = (
+        sort_key.like(prefix, escape="/") if postgres
+        else and_(lowered >= query, lowered < f"{query}{chr(0x10FFFF)}")
+    )
+    score = func.similarity(lowered, query) if postgres else literal(0.0)
+    after = decode_cursor(cursor, types=SEARCH_CURSOR_TYPES) if cursor else [EXACT_MATCH, 0.0, "", ""]
+    after_rank, after_score, after_key, after_name = after
+
+    substring = lowered.like(f"%{prefix}", escape="/")
+    exact = select(Tag, sort_key, literal(0.0)).where(lowered == query).order_by(Tag.name)
+    prefixed = (
+        select(Tag, sort_key, literal(0.0))
+        .where(starts_with, lowered != query)
+        .order_by(sort_key, Tag.name)
+    )
+    similar = (
+        select(Tag, sort_key, score)
+        .where(or_(substring, lowered.op("%")(query)) if postgres else substring)
+        .where(not_(starts_with))
+        .order_by(*((score.desc(), Tag.name) if postgres else (Tag.name,)))
+    )
+    # Resume inside the rank the cursor points into
+    if after_rank == EXACT_MATCH and cursor:
+        exact = exact.where(Tag.name > after_name)
+    elif after_rank == PREFIX_MATCH:
+        prefixed = prefixed.where(tuple_(sort_key, Tag.name) > tuple_(after_key, after_name))
+    elif after_rank == SIMILAR_MATCH:
+        similar = similar.where(
+            or_(score < after_score, and_(score == after_score, Tag.name > after_name)))
+    tiers = [(EXACT_MATCH, exact), (PREFIX_MATCH, prefixed), (SIMILAR_MATCH, similar)]
+
+    # One extra row tells whether there is a next page
+    tags: List[Tag] = []
+    positions: list[list[Any]] = []
+    for rank, statement in tiers:
+        if rank < after_rank or len(tags) > limit:
+            continue
+        for tag, key, tag_score in session.exec(statement.limit(limit + 1 - len(tags))).all():
+            tags.append(tag)
+            positions.append([rank, tag_score, key, tag.name])
+    if len(tags) <= limit:
+        return tags, None
+    return tags[:limit], encode_cursor(positions[limit - 1])
+
+
+def _list_tags(*, session: Session, limit: int, cursor: Optional[str]) -> tuple[List[Tag], Optional[str]]:
+    """ All tags by name, for an empty search. """
+    stmt = select(Tag).order_by(Tag.name).limit(limit + 1)
+    if cursor:
+        stmt = stmt.where(Tag.name > decode_cursor(cursor, types=(str,))[0])
+    tags = list(session.exec(stmt).all())
+    if len(tags) <= limit:
+        return tags, None
+    return tags[:limit], encode_cursor([tags[limit - 1].name])
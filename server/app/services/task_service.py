@@ -0,0 +1,174 @@
+import re
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone
+from sqlalchemy import Float, and_, case, cast, column, func, insert, literal_column, or_, table, update
+from sqlmodel import Session, col, select
+from typing import List, Optional
+
+from app.exceptions.pagination import InvalidCursorException
+from app.models.project import Project
+from app.models.task import Task, TaskPriority, TaskStatus
+from app.schemas.task import TaskBulkItemResult, TaskBulkUpdate, TaskCreate
+from app.services.access_service import accessible_project_ids, accessible_tasks
+from app.utils.cursor import decode_cursor, encode_cursor
+
+# Search cursor: rank and id of the last task returned
+SEARCH_CURSOR_TYPES = ((int, float), str)
+# FTS5 (SQLite) column weights, the title counts like tsvector weight A against B
+_FTS_TITLE_WEIGHT = 10.0
+_FTS_DESCRIPTION_WEIGHT = 4.0
+_tasks_fts = table("tasks_fts", column("rowid"))
+
+
+def get_task_by_id(*, session: Session, task_id: uuid.UUID) -> Task | None:
+    """ Get Task by task_id """
+    return session.get(Task, task_id)
+
+
+def bulk_create_tasks(*, session: Session, tasks: List[TaskCreate], owner_id: uuid.UUID) -> tuple[List[TaskBulkItemResult], set[uuid.UUID]]:
+    """ Create the tasks owned by the user in one transaction.
+
+    Projects are checked in one query and the rows go in as one batched
+    multi-row INSERT, instead of a commit and refresh per task. Ids are made
+    here, so nothing has to be read back. Tasks of a project the user cannot
+    see (see access_service) are skipped as not found. Returns a result per
+    task and the projects written to.
+    """
+    project_ids = {task.project_id for task in tasks if task.project_id is not None}
+    known_projects = set(session.exec(
+        accessible_project_ids(user_id=owner_id).where(col(Project.id).in_(project_ids))
+    ).all()) if project_ids else set()
+
+    results: List[TaskBulkItemResult] = []
+    rows = []
+    for index, task in enumerate(tasks):
+        if task.project_id is not None and task.project_id not in known_projects:
+            results.append(TaskBulkItemResult(index=index, result="not_found", detail="Project not found!"))
+            continue
+        task_obj = Task.model_validate(task, update={"owner_id": owner_id})
+        rows.append(task_obj.model_dump())
+        results.append(TaskBulkItemResult(index=index, id=task_obj.id, result="created"))
+
+    if rows:
+        session.execute(insert(Task), rows)
+    session.commit()
+    return results, {task.project_id for task in tasks if task.project_id in known_projects}
+
+
+def bulk_update_tasks(*, session: Session, tasks: List[TaskBulkUpdate], owner_id: uuid.UUID) -> tuple[List[TaskBulkItemResult], set[uuid.UUID]]:
+    """ Change status, priority or archive flag of the user's tasks in one transaction.
+
+    Items asking for the same change share one UPDATE ... WHERE id IN (...)
+    RETURNING, so re-prioritising hundreds of tasks is a handful of statements.
+    Tasks that do not exist or are not owned by the user are reported as not found.
+    Returns a result per task and the projects written to.
+    """
+    now = datetime.now(timezone.utc)
+    by_change: dict[tuple, list[uuid.UUID]] = defaultdict(list)
+    for task in tasks:
+        change = tuple(sorted(task.model_dump(exclude={"id"}, exclude_none=True).items()))
+        by_change[change].append(task.id)
+
+    updated: set[uuid.UUID] = set()
+    project_ids: set[uuid.UUID] = set()
+    for change, ids in by_change.items():
+        values = dict(change)
+        if not values:
+            # Nothing to change, still report whether the tasks exist
+            statement = select(Task.id, Task.project_id).where(col(Task.id).in_(ids), Task.owner_id == owner_id)
+        else:
+            values["updated_at"] = now
+            # Stamped only on the change, a task already done or archived keeps its time
+            if "status" in values:
+                values["completed_at"] = (
+                    case((Task.status == TaskStatus.DONE, Task.completed_at), else_=now)
+                    if values["status"] == TaskStatus.DONE else None)
+            if "is_archived" in values:
+                # Starts the countdown to the archive tables (see archive_service)
+                values["archived_at"] = (
+                    case((col(Task.is_archived), Task.archived_at), else_=now)
+                    if values["is_archived"] else None)
+            statement = (
+                update(Task)
+                .where(col(Task.id).in_(ids), Task.owner_id == owner_id)
+                .values(**values)
+                .returning(Task.id, Task.project_id)
+                .execution_options(synchronize_session=False)
+            )
+        for task_id, project_id in session.execute(statement).all():
+            updated.add(task_id)
+            if project_id is not None:
+                project_ids.add(project_id)
+    session.commit()
+
+    results = [
+        TaskBulkItemResult(index=index, id=task.id, result="updated") if task.id in updated
+        else TaskBulkItemResult(index=index, id=task.id, result="not_found", detail="Task not found!")
+        for index, task in enumerate(tasks)
+    ]
+    return results, project_ids
+
+
+def _search_match(*, session: Session, query: str):
+    """ Match condition, rank (higher is better) and join target of a search, per dialect. """
+    if session.get_bind().dialect.name == "postgresql":
+        search_vector = literal_column("tasks.search_vector")
+        ts_query = func.websearch_to_tsquery("english", query)
+        # Double precision, a real would not come back equal from the cursor
+        rank = cast(func.ts_rank(search_vector, ts_query), Float)
+        return search_vector.op("@@")(ts_query), rank, None
+    # Every word as an FTS5 string, so user input is never read as query syntax
+    fts_query = " ".join(f'"{word}"' for word in re.findall(r"\w+", query))
+    rank = -func.bm25(literal_column("tasks_fts"), _FTS_TITLE_WEIGHT, _FTS_DESCRIPTION_WEIGHT)
+    return literal_column("tasks_fts").op("MATCH")(fts_query), rank, _tasks_fts
+
+
+def search_tasks(
+    *,
+    session: Session,
+    query: str,
+    user_id: uuid.UUID,
+    status: Optional[TaskStatus] = None,
+    priority: Optional[TaskPriority] = None,
+    owner_id: Optional[uuid.UUID] = None,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+) -> tuple[List[Task], Optional[str]]:
+    """ Full-text search over the titles and descriptions of the tasks `user_id`
+    can see (see access_service.accessible_tasks), best matches first.
+
+    Postgres matches the GIN indexed `search_vector` with websearch_to_tsquery
+    and orders by ts_rank, SQLite matches the tasks_fts FTS5 table and orders by
+    bm25, title matches weighing more than description matches in both. Ties
+    are broken by id, and the cursor resumes after the last (rank, id) seen.
+    Returns the page and the cursor of the next one (None on the last page).
+    """
+    if not re.search(r"\w", query):
+        return [], None
+    match, rank, fts = _search_match(session=session, query=query)
+    statement = select(Task, rank)
+    if fts is not None:
+        statement = statement.join(fts, fts.c.rowid == literal_column("tasks.search_rowid"))
+    statement = statement.where(match, accessible_tasks(user_id=user_id))
+    if status is not None:
+        statement = statement.where(Task.status == status)
+    if priority is not None:
+        statement = statement.where(Task.priority == priority)
+    if owner_id is not None:
+        statement = statement.where(Task.owner_id == owner_id)
+    if cursor:
+        after_rank, after_id = decode_cursor(cursor, types=SEARCH_CURSOR_TYPES)
+        try:
+            after_id = uuid.UUID(after_id)
+        except ValueError:
+            raise InvalidCursorException()
+        statement = statement.where(or_(rank < after_rank, and_(rank == after_rank, Task.id > after_id)))
+
+    # One extra row tells whether there is a next page
+    rows = session.exec(statement.order_by(rank.desc(), Task.id).limit(limit + 1)).all()
+    tasks = [task for task, _ in rows[:limit]]
+    if len(rows) <= limit:
+        return tasks, None
+    last_task, last_rank = rows[limit - 1]
+    return tasks, encode_cursor([last_rank, str(last_task.id)])
@@ -0,0 +1,155 @@
+import csv
+import io
+import math
+import uuid
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
+from itertools import islice
+from sqlalchemy import insert, text
+from sqlmodel import Session, col, select
+
+from app.core.config import settings
+from app.exceptions.timesheet import TimesheetImportException
+from app.models.task import Task
+from app.models.timesheet import Timesheet
+from app.models.user import User
+from app.schemas.timesheet import TimesheetImportError, TimesheetImportResponse
+from app.services.timesheet_service import TimesheetDelta, apply_timesheet_deltas
+
+# Header of an import file, one timesheet per line
+IMPORT_COLUMNS = ("user_email", "task_id", "work_date", "hours", "description")
+# Errors reported back, the rest are only counted
+MAX_REPORTED_ERRORS = 100
+
+_COPY_COLUMNS = ("id", "description", "hours", "work_date", "created_at", "updated_at", "user_id", "task_id")
+_STAGING_TABLE = "timesheets_import"
+
+
+def _parse_work_date(value: str) -> datetime:
+    work_date = datetime.fromisoformat(value)
+    # Dates without an offset are taken as UTC, the others converted to it: COPY
+    # writes the text into a column without time zone, which drops the offset
+    return work_date.astimezone(timezone.utc) if work_date.tzinfo else work_date.replace(tzinfo=timezone.utc)
+
+
+def _parse_chunk(lines: list[tuple[int, dict]]) -> tuple[list[tuple[int, dict]], list[TimesheetImportError]]:
+    """ Check the values of each line on their own, before the database lookups. """
+    parsed, errors = [], []
+    for line, row in lines:
+        try:
+            hours = float(row["hours"])
+            if not (hours > 0 and math.isfinite(hours)):
+                raise ValueError("hours must be a number greater than 0")
+            description = (row["description"] or "").strip()
+            if not description or len(description) > 255:
+                raise ValueError("description must be 1 to 255 characters")
+            parsed.append((line, {
+                "user_email": (row["user_email"] or "").strip(),
+                "task_id": uuid.UUID(row["task_id"]),
+                "work_date": _parse_work_date(row["work_date"]),
+                "hours": hours,
+                "description": description,
+            }))
+        except (KeyError, TypeError, ValueError) as exception:
+            errors.append(TimesheetImportError(line=line, detail=str(exception)))
+    return parsed, errors
+
+
+def _resolve_chunk(*, session: Session, parsed: list[tuple[int, dict]]) -> tuple[list[dict], list[TimesheetImportError]]:
+    """ Look up the chunk's users and tasks in one query each and build the rows to load. """
+    emails = {row["user_email"] for _, row in parsed}
+    task_ids = {row["task_id"] for _, row in parsed}
+    users = dict(session.exec(select(User.email, User.id).where(col(User.email).in_(emails))).all())
+    tasks = set(session.exec(select(Task.id).where(col(Task.id).in_(task_ids))).all())
+
+    now = datetime.now(timezone.utc)
+    rows, errors = [], []
+    for line, row in parsed:
+        user_id = users.get(row["user_email"])
+        if user_id is None:
+            errors.append(TimesheetImportError(line=line, detail=f"unknown user {row['user_email']!r}"))
+        elif row["task_id"] not in tasks:
+            errors.append(TimesheetImportError(line=line, detail=f"unknown task {row['task_id']}"))
+        else:
+            rows.append({
+                "id": uuid.uuid4(),
+                "description": row["description"],
+                "hours": row["hours"],
+                "work_date": row["work_date"],
+                "created_at": now,
+                "updated_at": now,
+                "user_id": user_id,
+                "task_id": row["task_id"],
+            })
+    return rows, errors
+
+
+def _copy_rows(*, session: Session, rows: list[dict]) -> None:
+    """ Postgres: COPY the rows into a staging table, then merge them in with one INSERT ... SELECT. """
+    columns = ", ".join(_COPY_COLUMNS)
+    session.execute(text(
+        f"CREATE TEMP TABLE IF NOT EXISTS {_STAGING_TABLE} "
+        f"(LIKE timesheets INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+    ))
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([
+            value.isoformat() if isinstance(value, datetime) else value
+            for value in (row[column] for column in _COPY_COLUMNS)
+        ])
+    buffer.seek(0)
+    cursor = session.connection().connection.dbapi_connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {_STAGING_TABLE} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+    finally:
+        cursor.close()
+    session.execute(text(
+        f"INSERT INTO timesheets ({columns}) SELECT {columns} FROM {_STAGING_TABLE}"
+    ))
+
+
+def _load_rows(*, session: Session, rows: list[dict]) -> None:
+    if session.get_bind().dialect.driver == "psycopg2":
+        _copy_rows(session=session, rows=rows)
+    else:
+        # SQLite (and other drivers): one executemany
+        session.execute(insert(Timesheet.__table__), rows)
+    apply_timesheet_deltas(session=session, deltas=[
+        TimesheetDelta(row["user_id"], row["task_id"], row["work_date"], row["hours"], 1) for row in rows
+    ])
+
+
+def _numbered_rows(lines: Iterable[str]) -> Iterator[tuple[int, dict]]:
+    reader = csv.DictReader(lines)
+    missing = set(IMPORT_COLUMNS) - set(reader.fieldnames or ())
+    if missing:
+        raise TimesheetImportException(detail=f"Missing columns: {', '.join(sorted(missing))}")
+    for row in reader:
+        # Line of the row in the file, the header is line 1
+        yield reader.line_num, row
+
+
+def import_timesheets(*, session: Session, lines: Iterable[str], chunk_size: int | None = None) -> TimesheetImportResponse:
+    """ Import timesheets from CSV lines (header: user_email,task_id,work_date,hours,description).
+
+    The lines are read `chunk_size` at a time, so memory stays flat however big
+    the file is. Each chunk is checked, its users and tasks are looked up in one
+    query each, the valid rows are loaded (COPY on Postgres, executemany
+    elsewhere) with their rollups, and the chunk is committed. Invalid lines are
+    skipped and reported.
+    """
+    chunk_size = chunk_size or settings.TIMESHEET_IMPORT_CHUNK_SIZE
+    report = TimesheetImportResponse()
+    rows_iter = _numbered_rows(lines)
+    while chunk := list(islice(rows_iter, chunk_size)):
+        parsed, errors = _parse_chunk(chunk)
+        rows, lookup_errors = _resolve_chunk(session=session, parsed=parsed)
+        errors = sorted(errors + lookup_errors, key=lambda error: error.line)
+        if rows:
+            _load_rows(session=session, rows=rows)
+            session.commit()
+        report.imported += len(rows)
+        report.rejected += len(errors)
+        report.errors += errors[:MAX_REPORTED_ERRORS - len(report.errors)]
+    return report
@@ -0,0 +1,94 @@
+import re
+from datetime import date
+from sqlalchemy import text
+from sqlmodel import Session
+from typing import List, NamedTuple, Optional
+
+# Partitioned parent table and the partition catching dates no month covers
+PARENT_TABLE = "timesheets"
+DEFAULT_PARTITION = "timesheets_default"
+_MONTH_NAME = re.compile(rf"^{PARENT_TABLE}_y(\d{{4}})m(\d{{2}})$")
+
+
+class MonthPartition(NamedTuple):
+    """ One month of timesheets, [start, end) on work_date (UTC). """
+    name: str
+    start: date
+    end: date
+
+
+def month_start(day: date, months: int = 0) -> date:
+    """ First day of the month `months` after (or before, if negative) the month of `day`. """
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_partition(day: date) -> MonthPartition:
+    """ The partition holding `day`, named timesheets_yYYYYmMM. """
+    start = month_start(day)
+    return MonthPartition(f"{PARENT_TABLE}_y{start.year:04d}m{start.month:02d}", start, month_start(start, 1))
+
+
+def _is_partitioned(session: Session) -> bool:
+    if session.get_bind().dialect.name != "postgresql":
+        return False
+    return bool(session.execute(text(
+        "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table)"
+    ), {"table": PARENT_TABLE}).first())
+
+
+def _attached_partitions(session: Session) -> List[str]:
+    return list(session.execute(text(
+        "SELECT child.relname FROM pg_inherits "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "WHERE pg_inherits.inhparent = to_regclass(:table)"
+    ), {"table": PARENT_TABLE}).scalars().all())
+
+
+def create_timesheet_partitions(*, session: Session, months_ahead: int = 3, today: Optional[date] = None) -> List[str]:
+    """ Create the monthly partitions from this month to `months_ahead` months ahead.
+
+    Run ahead of time so new timesheets never land in the default partition (a
+    month cannot be created while the default partition holds rows of it).
+    Existing partitions are left alone. Returns the partitions created, none
+    when timesheets is not partitioned (SQLite).
+    """
+    if not _is_partitioned(session):
+        return []
+    today = today or date.today()
+    existing = set(_attached_partitions(session))
+    created = []
+    for offset in range(months_ahead + 1):
+        partition = month_partition(month_start(today, offset))
+        if partition.name in existing:
+            continue
+        session.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {partition.name} PARTITION OF {PARENT_TABLE} "
+            f"FOR VALUES FROM ('{partition.start.isoformat()}') TO ('{partition.end.isoformat()}')"
+        ))
+        created.append(partition.name)
+    session.commit()
+    return created
+
+
+def detach_timesheet_partitions(*, session: Session, retain_months: int, today: Optional[date] = None) -> List[str]:
+    """ Detach the monthly partitions ending more than `retain_months` months ago.
+
+    A detached partition stays as a plain table (to archive, then drop), it is
+    only no longer read through timesheets. Rollups keep the hours it held, but
+    rebuild_timesheet_rollups would no longer count them. Each partition is
+    detached in its own short transaction. Returns the partitions detached.
+    """
+    if not _is_partitioned(session):
+        return []
+    cutoff = month_start(today or date.today(), -retain_months)
+    detached = []
+    for name in sorted(_attached_partitions(session)):
+        # Only monthly partitions, never the default one
+        match = _MONTH_NAME.match(name)
+        if match is None or month_partition(date(int(match[1]), int(match[2]), 1)).end > cutoff:
+            continue
+        session.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+        session.commit()
+        detached.append(name)
+    return detached
@@ -0,0 +1,225 @@
+import uuid
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta, timezone
+from sqlalchemy import Date, bindparam, cast, delete, func, insert, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, col, select
+from typing import List, NamedTuple, Optional
+
+from app.models.archive import timesheet_rollups_archive
+from app.models.task import Task
+from app.models.timesheet import Timesheet, TimesheetRollup
+from app.models.user import User
+from app.schemas.timesheet import TimesheetCreate, TimesheetUpdate
+
+
+class TimesheetDelta(NamedTuple):
+    """ A timesheet added to (or, with negative hours and entries, removed from) the rollups. """
+    user_id: uuid.UUID
+    task_id: uuid.UUID
+    work_date: date | datetime
+    hours: float
+    entries: int
+
+
+def week_start(work_date: date | datetime) -> date:
+    """ Monday of the ISO week of `work_date` (in UTC, like the stored work dates). """
+    if isinstance(work_date, datetime):
+        day = (work_date.astimezone(timezone.utc) if work_date.tzinfo else work_date).date()
+    else:
+        day = work_date
+    return day - timedelta(days=day.weekday())
+
+
+def _added(timesheet: Timesheet) -> TimesheetDelta:
+    return TimesheetDelta(timesheet.user_id, timesheet.task_id, timesheet.work_date, timesheet.hours, 1)
+
+
+def _removed(timesheet: Timesheet) -> TimesheetDelta:
+    return TimesheetDelta(timesheet.user_id, timesheet.task_id, timesheet.work_date, -timesheet.hours, -1)
+
+
+# -----------------------------
+# Rollups
+# -----------------------------
+def apply_timesheet_deltas(*, session: Session, deltas: Iterable[TimesheetDelta]) -> None:
+    """ Add timesheet changes to the rollups and to Task.actual_hours, in the caller's transaction.
+
+    Every rollup is an upsert adding to the stored values (hours = hours + delta),
+    so concurrent writers never overwrite each other. Rollups left without
+    timesheets are removed.
+    """
+    rollups: dict[tuple, list] = defaultdict(lambda: [0.0, 0])
+    task_hours: dict[uuid.UUID, float] = defaultdict(float)
+    for delta in deltas:
+        rollup = rollups[(delta.user_id, delta.task_id, week_start(delta.work_date))]
+        rollup[0] += delta.hours
+        rollup[1] += delta.entries
+        task_hours[delta.task_id] += delta.hours
+
+    rows = [
+        {"user_id": user_id, "task_id": task_id, "week_start": week, "hours": hours, "entries": entries}
+        for (user_id, task_id, week), (hours, entries) in rollups.items()
+        if hours or entries
+    ]
+    if rows:
+        table = TimesheetRollup.__table__
+        dialect = postgresql if session.get_bind().dialect.name == "postgresql" else sqlite
+        statement = dialect.insert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.user_id, table.c.task_id, table.c.week_start],
+            set_={
+                "hours": table.c.hours + statement.excluded.hours,
+                "entries": table.c.entries + statement.excluded.entries,
+            },
+        )
+        session.execute(statement, rows)
+        session.execute(delete(table).where(
+            table.c.entries <= 0, table.c.user_id.in_({row["user_id"] for row in rows})))
+
+    task_rows = [{"b_task_id": task_id, "b_hours": hours} for task_id, hours in task_hours.items() if hours]
+    if task_rows:
+        tasks = Task.__table__
+        session.execute(
+            update(tasks)
+            .where(tasks.c.id == bindparam("b_task_id"))
+            .values(actual_hours=func.coalesce(tasks.c.actual_hours, 0) + bindparam("b_hours")),
+            task_rows,
+        )
+
+
+def _week_start_sql(session: Session):
+    """ `week_start` computed by the database, for the rebuild. """
+    if session.get_bind().dialect.name == "postgresql":
+        return cast(func.date_trunc("week", Timesheet.work_date), Date)
+    # Next Sunday (or the day itself), then back to its Monday
+    return func.date(Timesheet.work_date, "weekday 0", "-6 days")
+
+
+def rebuild_timesheet_rollups(*, session: Session, batch_size: int = 500) -> int:
+    """ Recompute every rollup and Task.actual_hours from the raw timesheets.
+
+    Runs `batch_size` users (then tasks) per transaction, so no transaction
+    holds more than one batch. A timesheet written while its batch is being
+    rebuilt can be counted twice, run it when writes are quiet (or run it again).
+    Returns the number of rollups written.
+    """
+    rollups = TimesheetRollup.__table__
+    week = _week_start_sql(session)
+    written = 0
+
+    after: Optional[uuid.UUID] = None
+    while True:
+        statement = select(User.id).order_by(User.id).limit(batch_size)
+        if after is not None:
+            statement = statement.where(User.id > after)
+        user_ids = list(session.exec(statement).all())
+        if not user_ids:
+            break
+        session.execute(delete(rollups).where(rollups.c.user_id.in_(user_ids)))
+        result = session.execute(insert(rollups).from_select(
+            ["user_id", "task_id", "week_start", "hours", "entries"],
+            select(Timesheet.user_id, Timesheet.task_id, week, func.sum(Timesheet.hours), func.count())
+            .where(col(Timesheet.user_id).in_(user_ids))
+            .group_by(Timesheet.user_id, Timesheet.task_id, week),
+        ))
+        written += result.rowcount
+        session.commit()
+        after = user_ids[-1]
+
+    task_total = (
+        select(func.sum(Timesheet.hours))
+        .where(Timesheet.task_id == Task.id)
+        .correlate(Task)
+        .scalar_subquery()
+    )
+    after = None
+    while True:
+        statement = select(Task.id).order_by(Task.id).limit(batch_size)
+        if after is not None:
+            statement = statement.where(Task.id > after)
+        task_ids = list(session.exec(statement).all())
+        if not task_ids:
+            break
+        session.execute(
+            update(Task).where(col(Task.id).in_(task_ids)).values(actual_hours=task_total)
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+        after = task_ids[-1]
+    return written
+
+
+def get_user_week_rollups(*, session: Session, user_id: uuid.UUID, week: date, include_archived: bool = False) -> List[TimesheetRollup]:
+    """ Hours per task the user logged in the ISO week of `week`.
+
+    Tasks moved to the archive tables are left out unless `include_archived`.
+    """
+    rollups = list(session.exec(
+        select(TimesheetRollup)
+        .where(TimesheetRollup.user_id == user_id, TimesheetRollup.week_start == week_start(week))
+        .order_by(TimesheetRollup.task_id)
+    ).all())
+    if include_archived:
+        archived = session.execute(
+            timesheet_rollups_archive.select()
+            .where(timesheet_rollups_archive.c.user_id == user_id,
+                   timesheet_rollups_archive.c.week_start == week_start(week))
+        ).all()
+        rollups = sorted([*rollups, *archived], key=lambda rollup: rollup.task_id)
+    return rollups
+
+
+# -----------------------------
+# Timesheets
+# -----------------------------
+def create_timesheet(*, session: Session, timesheet_create: TimesheetCreate, user_id: uuid.UUID) -> Timesheet:
+    """ Log time on a task, with the rollups updated in the same transaction. """
+    timesheet = Timesheet.model_validate(
+        timesheet_create.model_dump(exclude_none=True),
+        update={"user_id": user_id},
+    )
+    session.add(timesheet)
+    session.flush()
+    apply_timesheet_deltas(session=session, deltas=[_added(timesheet)])
+    session.commit()
+    session.refresh(timesheet)
+    return timesheet
+
+
+def _get_user_timesheet_for_update(*, session: Session, timesheet_id: uuid.UUID, user_id: uuid.UUID) -> Timesheet | None:
+    # Locked, two concurrent edits would otherwise both take the old values out of the rollups
+    return session.exec(
+        select(Timesheet)
+        .where(Timesheet.id == timesheet_id, Timesheet.user_id == user_id)
+        .with_for_update()
+    ).first()
+
+
+def update_timesheet(*, session: Session, timesheet_id: uuid.UUID, timesheet_update: TimesheetUpdate, user_id: uuid.UUID) -> Timesheet | None:
+    """ Edit one of the user's timesheets, moving its hours between rollups if needed. """
+    timesheet = _get_user_timesheet_for_update(session=session, timesheet_id=timesheet_id, user_id=user_id)
+    if timesheet is None:
+        return None
+    before = _removed(timesheet)
+    for field, value in timesheet_update.model_dump(exclude_none=True).items():
+        setattr(timesheet, field, value)
+    timesheet.updated_at = datetime.now(timezone.utc)
+    session.add(timesheet)
+    session.flush()
+    apply_timesheet_deltas(session=session, deltas=[before, _added(timesheet)])
+    session.commit()
+    session.refresh(timesheet)
+    return timesheet
+
+
+def delete_timesheet(*, session: Session, timesheet_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+    """ Delete one of the user's timesheets and take it out of the rollups. """
+    timesheet = _get_user_timesheet_for_update(session=session, timesheet_id=timesheet_id, user_id=user_id)
+    if timesheet is None:
+        return False
+    apply_timesheet_deltas(session=session, deltas=[_removed(timesheet)])
+    session.delete(timesheet)
+    session.commit()
+    return True
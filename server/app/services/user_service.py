@@ -1,8 +1,19 @@
+from datetime import datetime, timezone
+from redis import Redis
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.security import get_password_hash, verify_password
+from app.core.database import run_in_session
+from app.core.security import (
+    get_password_hash,
+    verify_password,
+    get_password_hash_async,
+    verify_password_async,
+    check_password_hasher_capacity,
+)
 from app.models.user import User
-from app.schemas.auth import UserCreate
+from app.schemas.auth import UserCreate, UserUpdate
+from app.services import principal_service
 
 
 def get_user_by_email(*, session: Session, email: str) -> User | None:
@@ -11,11 +22,13 @@ def get_user_by_email(*, session: Session, email: str) -> User | None:
     return user
 
 
-def create_new_user(*, session: Session, user_create: UserCreate) -> User:
+def create_new_user(*, session: Session, user_create: UserCreate, hashed_password: str | None = None) -> User:
+    if hashed_password is None:
+        hashed_password = get_password_hash(password=user_create.password)
     user_obj = User.model_validate(
         user_create,
         update={
-            "hashed_password": get_password_hash(password=user_create.password),
+            "hashed_password": hashed_password,
             "image_url": f"https://api.dicebear.com/9.x/adventurer/svg?seed={user_create.full_name}"
         }
     )
@@ -30,3 +43,55 @@ def authenticate_user(*, session: Session, email: str, password: str) -> User:
     if user and not verify_password(plain_password=password, hashed_password=user.hashed_password):
         return None
     return user
+
+
+def update_user(*, session: Session, redis: Redis, user: User, user_update: UserUpdate) -> User:
+    """ Update user profile fields and drop the cached principal. """
+    for field, value in user_update.model_dump(exclude_unset=True).items():
+        setattr(user, field, value)
+    user.updated_at = datetime.now(timezone.utc)
+    session.add(user)
+    session.commit()
+    session.refresh(user)
+    principal_service.invalidate_principal(redis=redis, user_id=user.id)
+    return user
+
+
+def deactivate_user(*, session: Session, redis: Redis, user: User) -> User:
+    """ Deactivate the user and drop the cached principal. """
+    user.is_active = False
+    user.updated_at = datetime.now(timezone.utc)
+    session.add(user)
+    session.commit()
+    session.refresh(user)
+    principal_service.invalidate_principal(redis=redis, user_id=user.id)
+    return user
+
+
+def get_user_by_email_detached(*, session: Session, email: str) -> User | None:
+    """ Get user by email and hand the connection back to the pool in the same call,
+    so it is not held while the request waits on the password hasher.
+
+    The user is expunged and only the read transaction ends, the request's
+    session stays open for the writes that follow. Call it before writing. """
+    user = get_user_by_email(session=session, email=email)
+    if user is not None:
+        session.expunge(user)
+    session.rollback()
+    return user
+
+
+# ---------- Async variants (hashing on the dedicated pool) ----------
+async def create_new_user_async(*, session: Session | AsyncSession, user_create: UserCreate) -> User:
+    hashed_password = await get_password_hash_async(password=user_create.password)
+    return await run_in_session(
+        session, create_new_user, user_create=user_create, hashed_password=hashed_password)
+
+
+async def authenticate_user_async(*, session: Session | AsyncSession, email: str, password: str) -> User:
+    # Reject before touching the database when the hasher is saturated
+    check_password_hasher_capacity()
+    user = await run_in_session(session, get_user_by_email_detached, email=email)
+    if user and not await verify_password_async(plain_password=password, hashed_password=user.hashed_password):
+        return None
+    return user
@@ -0,0 +1,113 @@
+import uuid
+from sqlalchemy import Column, Table, delete
+from sqlmodel import Session, col, select
+from typing import Callable, Optional
+
+from app.core.config import settings
+from app.models.archive import (
+    comments_archive,
+    task_tags_archive,
+    tasks_archive,
+    timesheet_rollups_archive,
+    timesheets_archive,
+)
+from app.models.comment import Comment
+from app.models.project import Project, ProjectMember
+from app.models.tag import TaskTag
+from app.models.task import Task
+from app.models.timesheet import Timesheet, TimesheetRollup
+from app.models.workspace import Workspace, WorkspaceInvitation, WorkspaceMember
+
+# Called after every batch with the table and the rows just deleted from it
+ProgressCallback = Callable[[str, int], None]
+
+# Task tables and the rows pointing at their tasks, deleted before the tasks
+_TASK_TABLES: list[tuple[Table, list[Table]]] = [
+    (Task.__table__, [Comment.__table__, Timesheet.__table__, TimesheetRollup.__table__, TaskTag.__table__]),
+    (tasks_archive, [comments_archive, timesheets_archive, timesheet_rollups_archive, task_tags_archive]),
+]
+
+
+def _count(progress: dict[str, int], on_progress: Optional[ProgressCallback], table: str, deleted: int) -> None:
+    progress[table] = progress.get(table, 0) + deleted
+    if on_progress:
+        on_progress(table, deleted)
+
+
+def _delete_in_batches(*, session: Session, key: Column, where, batch_size: int,
+                       progress: dict[str, int], on_progress: Optional[ProgressCallback]) -> None:
+    """ DELETE ... WHERE key IN (SELECT key ... WHERE where LIMIT batch_size), one transaction per batch. """
+    while True:
+        deleted = session.execute(
+            delete(key.table).where(where, key.in_(select(key).where(where).limit(batch_size)))
+        ).rowcount
+        session.commit()
+        if not deleted:
+            return
+        _count(progress, on_progress, key.table.name, deleted)
+
+
+def _delete_with_children(*, session: Session, table: Table, children: list[Table], key: str, where,
+                          batch_size: int, progress: dict[str, int], on_progress: Optional[ProgressCallback]) -> None:
+    """ Delete `batch_size` matching rows of `table` at a time, the child rows pointing
+    at them (through their `key` column) first, one transaction per batch. """
+    while True:
+        ids = list(session.exec(select(table.c.id).where(where).limit(batch_size)).all())
+        if not ids:
+            return
+        deleted = {child.name: session.execute(delete(child).where(child.c[key].in_(ids))).rowcount
+                   for child in children}
+        deleted[table.name] = session.execute(delete(table).where(table.c.id.in_(ids))).rowcount
+        session.commit()
+        for name, rows in deleted.items():
+            _count(progress, on_progress, name, rows)
+
+
+def purge_workspace(*, session: Session, workspace_id: uuid.UUID, batch_size: Optional[int] = None,
+                    on_progress: Optional[ProgressCallback] = None) -> dict[str, int]:
+    """ Remove a deleted workspace and everything in it: tasks of its projects
+    (live and archived, with their comments, timesheets, rollups and tag links),
+    projects with their members, workspace members and invitations, then the
+    workspace itself.
+
+    Every batch is a few set-based DELETEs of at most `batch_size` rows committed
+    on its own, so no transaction stays open for the whole workspace. Progress is
+    only the rows left, an interrupted purge picks up where it stopped when run
+    again. Returns the rows deleted per table.
+    """
+    batch_size = batch_size or settings.WORKSPACE_PURGE_BATCH_SIZE
+    progress: dict[str, int] = {}
+    workspace = session.get(Workspace, workspace_id)
+    if workspace is None or workspace.deleted_at is None:
+        return progress
+    projects = Project.__table__
+    project_ids = select(projects.c.id).where(projects.c.workspace_id == workspace_id)
+
+    for tasks, children in _TASK_TABLES:
+        _delete_with_children(session=session, table=tasks, children=children, key="task_id",
+                              where=tasks.c.project_id.in_(project_ids), batch_size=batch_size,
+                              progress=progress, on_progress=on_progress)
+    _delete_with_children(session=session, table=projects, children=[ProjectMember.__table__],
+                          key="project_id", where=projects.c.workspace_id == workspace_id,
+                          batch_size=batch_size, progress=progress, on_progress=on_progress)
+    members, invitations, workspaces = WorkspaceMember.__table__, WorkspaceInvitation.__table__, Workspace.__table__
+    for key, where in (
+        (members.c.user_id, members.c.workspace_id == workspace_id),
+        (invitations.c.id, invitations.c.workspace_id == workspace_id),
+        (workspaces.c.id, workspaces.c.id == workspace_id),
+    ):
+        _delete_in_batches(session=session, key=key, where=where, batch_size=batch_size,
+                           progress=progress, on_progress=on_progress)
+    return progress
+
+
+def purge_deleted_workspaces(*, session: Session, batch_size: Optional[int] = None,
+                             on_progress: Optional[ProgressCallback] = None) -> int:
+    """ Purge every workspace marked deleted, finishing purges a crash or a
+    restart interrupted. Returns the number of workspaces purged. """
+    workspace_ids = session.exec(
+        select(Workspace.id).where(col(Workspace.deleted_at).is_not(None)).order_by(Workspace.deleted_at)
+    ).all()
+    for workspace_id in workspace_ids:
+        purge_workspace(session=session, workspace_id=workspace_id, batch_size=batch_size, on_progress=on_progress)
+    return len(workspace_ids)
@@ -1,11 +1,43 @@
 import uuid
-from sqlmodel import Session, select
-from typing import List
-
-from app.models.workspace import Workspace, WorkspaceMember
+from datetime import datetime, timezone
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import or_
+from sqlalchemy.orm import joinedload, selectinload
+from sqlmodel import Session, col, select
+from typing import List, Optional
+
+from app.models.user import User
+from app.models.workspace import (
+    Workspace,
+    WorkspaceInvitation,
+    WorkspaceInvitationStatus,
+    WorkspaceMember,
+    WorkspaceRole,
+)
 from app.schemas.workspace import WorkspaceCreate
+from app.utils.pagination import keyset_paginate
 from app.utils.workspace_slug import generate_unique_workspace_slug
 
+# Members with their role and user, in one extra query for any number of workspaces
+_MEMBERSHIPS_LOADER = selectinload(Workspace.memberships).joinedload(WorkspaceMember.user)
+
+# Attempts to flush a workspace when concurrent requests race for the same slug
+SLUG_ATTEMPTS = 5
+
+
+def _flush_with_unique_slug(*, session: Session, workspace: Workspace, slug: str, base_name: str) -> None:
+    """ Flush the workspace with `slug`, taking the next free one if a concurrent request won it. """
+    for attempt in range(SLUG_ATTEMPTS):
+        try:
+            with session.begin_nested():
+                workspace.slug = slug
+                session.add(workspace)
+            return
+        except IntegrityError:
+            if attempt == SLUG_ATTEMPTS - 1:
+                raise
+            slug = generate_unique_workspace_slug(session=session, base_name=base_name)
+
 
 def create_workspace_service(*, session: Session, workspace_create: WorkspaceCreate, user_id: uuid.UUID) -> Workspace:
     """ Create new workspace with owner as loggedin user. """
@@ -18,15 +50,23 @@ def create_workspace_service(*, session: Session, workspace_create: WorkspaceCre
             "slug": slug
         }
     )
-    session.add(workspace_obj)
+    _flush_with_unique_slug(
+        session=session, workspace=workspace_obj, slug=slug, base_name=workspace_create.name)
     session.commit()
-    session.refresh(workspace_obj)
-    return workspace_obj
+    return get_workspace_service(session=session, workspace_id=workspace_obj.id)
 
 
 def get_workspace_service(*, session: Session, workspace_id: uuid.UUID) -> Workspace | None:
-    """ Get Workspace details by workspace id. """
-    return session.get(Workspace, workspace_id)
+    """ Get Workspace details by workspace id, with members loaded for the response (None once deleted). """
+    workspace = session.get(
+        Workspace,
+        workspace_id,
+        options=[_MEMBERSHIPS_LOADER],
+        populate_existing=True,
+    )
+    if workspace is None or workspace.deleted_at is not None:
+        return None
+    return workspace
 
 
 def check_workspace_exists_for_user(*, session: Session, user_id: uuid.UUID, workspace_name: str) -> bool:
@@ -35,7 +75,8 @@ def check_workspace_exists_for_user(*, session: Session, user_id: uuid.UUID, wor
         select(Workspace)
         .where(
             Workspace.name == workspace_name,
-            Workspace.owner_id == user_id
+            Workspace.owner_id == user_id,
+            col(Workspace.deleted_at).is_(None),
         )
     ).first()
     if owned_workspace:
@@ -48,31 +89,28 @@ def check_workspace_exists_for_user(*, session: Session, user_id: uuid.UUID, wor
         .where(
             Workspace.name == workspace_name,
             WorkspaceMember.user_id == user_id,
+            col(Workspace.deleted_at).is_(None),
         )
     ).first()
 
     return member_workspace is not None
 
 
-def get_user_workspaces(*, session: Session, user_id: uuid.UUID) -> List[Workspace]:
-    """ Get all workspaces owned by user or user is a member of the workspace """
-    owned_workspaces = session.exec(
-        select(Workspace).where(Workspace.owner_id == user_id)
-    ).all()
-
-    member_workspace_ids = session.exec(
-        select(WorkspaceMember.workspace_id).where(
-            WorkspaceMember.user_id == user_id)
-    ).all()
-
-    member_workspaces = []
-    if member_workspace_ids:
-        member_workspaces = session.exec(
-            select(Workspace).where(Workspace.id.in_(member_workspace_ids))
-        ).all()
-
-    all_workspaces = {ws.id: ws for ws in owned_workspaces + member_workspaces}
-    return list(all_workspaces.values())
+def get_user_workspaces(*, session: Session, user_id: uuid.UUID, limit: int = 20, cursor: Optional[str] = None) -> tuple[List[Workspace], Optional[str]]:
+    """ Get a page of the workspaces owned by user or user is a member of the workspace """
+    member_workspace_ids = select(WorkspaceMember.workspace_id).where(
+        WorkspaceMember.user_id == user_id)
+    return keyset_paginate(
+        session=session,
+        statement=select(Workspace)
+        .where(or_(Workspace.owner_id == user_id, Workspace.id.in_(member_workspace_ids)))
+        .where(col(Workspace.deleted_at).is_(None))
+        .options(_MEMBERSHIPS_LOADER),
+        created_at=Workspace.created_at,
+        id=Workspace.id,
+        limit=limit,
+        cursor=cursor,
+    )
 
 
 def update_workspace_service(*, session: Session, workspace_id: uuid.UUID, workspace_update: WorkspaceCreate, user_id: uuid.UUID) -> Workspace | None:
@@ -86,39 +124,80 @@ def update_workspace_service(*, session: Session, workspace_id: uuid.UUID, works
     if workspace.owner_id != user_id:
         return None
 
+    # Update other fields
+    if workspace_update.description is not None:
+        workspace.description = workspace_update.description
+
     # If name changed, regenerate slug
     if workspace_update.name and workspace_update.name != workspace.name:
-        workspace.slug = generate_unique_workspace_slug(
+        workspace.name = workspace_update.name
+        slug = generate_unique_workspace_slug(
             session=session, base_name=workspace_update.name
         )
-        workspace.name = workspace_update.name
-
-    # Update other fields
-    if workspace_update.description is not None:
-        workspace.description = workspace_update.description
+        _flush_with_unique_slug(
+            session=session, workspace=workspace, slug=slug, base_name=workspace_update.name)
 
     session.add(workspace)
     session.commit()
-    session.refresh(workspace)
-    return workspace
+    return get_workspace_service(session=session, workspace_id=workspace.id)
 
 
 def delete_workspace_service(*, session: Session, workspace_id: uuid.UUID) -> bool:
-    """ Delete workspace by id. """
+    """ Mark the workspace deleted, hidden from now on. Its rows are removed by
+    workspace_purge_service.purge_workspace, in batches outside the request. """
     workspace = get_workspace_service(
         session=session, workspace_id=workspace_id)
     if workspace is None:
         return False
-    session.delete(workspace)
+    workspace.deleted_at = datetime.now(timezone.utc)
+    session.add(workspace)
     session.commit()
     return True
 
 
+def invite_user_to_workspace(*, session: Session, workspace_id: uuid.UUID, inviter_id: uuid.UUID, email: str, role: WorkspaceRole) -> WorkspaceInvitation | None:
+    """ Invite the user with this email to the workspace, unless they are a member. A pending
+    invitation is reused, with the new role. None when there is no such user or workspace. """
+    workspace = get_workspace_service(session=session, workspace_id=workspace_id)
+    invitee = session.exec(select(User).where(User.email == email)).first()
+    if workspace is None or invitee is None:
+        return None
+    if invitee.id == workspace.owner_id or any(member.user_id == invitee.id for member in workspace.memberships):
+        return None
+    invitation = session.exec(
+        select(WorkspaceInvitation).where(
+            WorkspaceInvitation.workspace_id == workspace_id,
+            WorkspaceInvitation.invitee_id == invitee.id,
+            WorkspaceInvitation.status == WorkspaceInvitationStatus.PENDING,
+        )
+    ).first()
+    if invitation is None:
+        invitation = WorkspaceInvitation(
+            workspace_id=workspace_id, inviter_id=inviter_id, invitee_id=invitee.id, role=role)
+    elif invitation.role == role:
+        return invitation
+    invitation.role = role
+    session.add(invitation)
+    session.commit()
+    return invitation
+
+
 # -----------------------------------
 def create_default_workspace_for_user(*, session: Session, user_id: uuid.UUID, user_name: str) -> Workspace:
-    """ Create personal workspace for the given user as - User's Workspace. """
+    """ Create personal workspace for the given user as - User's Workspace.
+
+    Returns the user's existing personal workspace instead, so a retried job (or the
+    job and the register fallback both running) does not create a second one.
+    """
+    name = f"{user_name}'s Workspace"
+    existing = session.exec(
+        select(Workspace).where(
+            Workspace.owner_id == user_id, Workspace.name == name, col(Workspace.deleted_at).is_(None))
+    ).first()
+    if existing is not None:
+        return existing
     workspace_create = WorkspaceCreate(
-        name=f"{user_name}'s Workspace",
+        name=name,
         description=f"{user_name}'s Personal Workspace",
     )
     workspace_obj = create_workspace_service(
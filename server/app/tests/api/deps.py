@@ -1,6 +1,13 @@
 import pytest
+from contextlib import nullcontext
 from fastapi.testclient import TestClient
+from redis import Redis
+from sqlalchemy import event
+from sqlmodel import Session
+from typing import Callable
 from app.core.config import settings
+from app.models.user import User
+from app.services.job_service import Worker
 
 
 @pytest.fixture
@@ -12,6 +19,35 @@ def user_data() -> dict[str, str]:
     }
 
 
+@pytest.fixture
+def user(session: Session, user_data: dict[str, str]) -> User:
+    """ The `user_data` user, inserted directly (the password hash is not needed). """
+    user = User(full_name=user_data["full_name"], email=user_data["email"], hashed_password="hashed")
+    session.add(user)
+    session.commit()
+    session.refresh(user)
+    return user
+
+
+@pytest.fixture
+def other_user(session: Session) -> User:
+    user = User(full_name="Other User", email="other@projex.com", hashed_password="hashed")
+    session.add(user)
+    session.commit()
+    session.refresh(user)
+    return user
+
+
+@pytest.fixture
+def count_queries(session: Session):
+    """ Collect the statements run on the session's engine while the test runs. """
+    statements: list[str] = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(session.get_bind(), "before_cursor_execute", listener)
+    yield statements
+    event.remove(session.get_bind(), "before_cursor_execute", listener)
+
+
 @pytest.fixture
 def create_user(client: TestClient, user_data: dict) -> dict:
     # Try registering the user; ignore if already exists
@@ -50,3 +86,9 @@ def auth_client(client: TestClient, access_token: str) -> TestClient:
     """TestClient with Authorization header pre-set."""
     client.headers.update({"Authorization": f"Bearer {access_token}"})
     return client
+
+
+@pytest.fixture
+def run_jobs(session: Session, fake_redis: Redis) -> Callable[[], int]:
+    """ Run the jobs the requests queued, as the worker would. Returns how many ran. """
+    return Worker(redis=fake_redis, session_factory=lambda: nullcontext(session)).drain
@@ -1,6 +1,12 @@
 from fastapi import status
 from fastapi.testclient import TestClient
+from redis.exceptions import ConnectionError
+from sqlalchemy.util.concurrency import in_greenlet
+from sqlmodel import Session, select
+from app.core import security
 from app.core.config import settings
+from app.models.workspace import Workspace
+from app.services import job_service, principal_service
 from app.tests.api.deps import *
 
 
@@ -14,6 +20,19 @@ def test_auth_register_api_success(client: TestClient, user_data: dict[str, str]
     assert "password" not in data
 
 
+def test_auth_register_api_without_job_queue(client: TestClient, session: Session, user_data: dict[str, str], monkeypatch):
+    def enqueue_job(**kwargs):
+        raise ConnectionError("Redis is down")
+
+    monkeypatch.setattr(job_service, "enqueue_job", enqueue_job)
+    response = client.post(
+        f"{settings.API_V1_STR}/auth/register", json=user_data)
+    assert response.status_code == status.HTTP_201_CREATED
+    # The default workspace is created in the request instead
+    workspaces = session.exec(select(Workspace)).all()
+    assert [str(workspace.owner_id) for workspace in workspaces] == [response.json()["id"]]
+
+
 def test_auth_register_api_user_exists(client: TestClient, user_data: dict[str, str]):
     client.post(
         f"{settings.API_V1_STR}/auth/register", json=user_data)
@@ -78,6 +97,22 @@ def test_auth_current_user_api_invalid_token(client: TestClient):
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
+def test_auth_current_user_api_redis_outside_the_session(auth_client: TestClient, monkeypatch: pytest.MonkeyPatch):
+    # With DATABASE_ASYNC the session runs services through run_sync on the event loop (in a greenlet),
+    # a blocking Redis call there would stall every other request
+    in_session = []
+    for name in ("get_principal_from_redis", "store_principal_in_redis"):
+        original = getattr(principal_service, name)
+        monkeypatch.setattr(principal_service, name,
+                            lambda *, _original=original, **kwargs: in_session.append(in_greenlet()) or _original(**kwargs))
+    principal_service.local_principal_cache.clear()
+
+    response = auth_client.get(f"{settings.API_V1_STR}/auth/me")
+    assert response.status_code == status.HTTP_200_OK
+    # Redis was missed, then filled from the database, neither inside the session bridge
+    assert in_session == [False, False]
+
+
 # ------ Refresh Token API Tests ----------------
 def test_refresh_token_api_success(client: TestClient, refresh_token: str):
     response = client.post(f"{settings.API_V1_STR}/auth/refresh",
@@ -88,6 +123,14 @@ def test_refresh_token_api_success(client: TestClient, refresh_token: str):
     assert "refresh_token" in data
 
 
+def test_refresh_token_api_reused_token(client: TestClient, refresh_token: str):
+    client.post(f"{settings.API_V1_STR}/auth/refresh",
+                json={"refresh_token": refresh_token})
+    response = client.post(f"{settings.API_V1_STR}/auth/refresh",
+                           json={"refresh_token": refresh_token})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
 def test_refresh_token_api_no_token(client: TestClient):
     response = client.post(f"{settings.API_V1_STR}/auth/refresh")
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
@@ -115,3 +158,49 @@ def test_auth_logout_api_invalid_token(client: TestClient):
     response = client.post(f"{settings.API_V1_STR}/auth/logout",
                            json={"refresh_token": "invalidtoken"})
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+# ------ Session API Tests ----------------
+def test_auth_login_api_second_device_keeps_first(client: TestClient, refresh_token: str, create_user: dict):
+    client.post(f"{settings.API_V1_STR}/auth/login", data={
+        "username": create_user["email"],
+        "password": create_user["password"]
+    })
+    response = client.post(f"{settings.API_V1_STR}/auth/refresh",
+                           json={"refresh_token": refresh_token})
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_auth_list_sessions_api_success(auth_client: TestClient, create_user: dict):
+    auth_client.post(f"{settings.API_V1_STR}/auth/login", data={
+        "username": create_user["email"],
+        "password": create_user["password"]
+    }, headers={"User-Agent": "projex-mobile"})
+    response = auth_client.get(f"{settings.API_V1_STR}/auth/sessions")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert len(data) == 2
+    assert "projex-mobile" in [session["device"] for session in data]
+
+
+def test_auth_logout_all_api_success(auth_client: TestClient, refresh_token: str):
+    response = auth_client.post(f"{settings.API_V1_STR}/auth/logout-all")
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    response = auth_client.post(f"{settings.API_V1_STR}/auth/refresh",
+                                json={"refresh_token": refresh_token})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    response = auth_client.get(f"{settings.API_V1_STR}/auth/sessions")
+    assert response.json() == []
+
+
+# ------ Password Hashing Pool Tests ----------------
+def test_auth_login_api_hasher_busy(client: TestClient, create_user: dict, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(security, "_password_jobs_in_flight",
+                        settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_MAX_PENDING)
+    response = client.post(
+        f"{settings.API_V1_STR}/auth/login", data={
+            "username": create_user["email"],
+            "password": create_user["password"]
+        })
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
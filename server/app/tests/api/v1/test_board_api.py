@@ -0,0 +1,67 @@
+import uuid
+from fastapi.testclient import TestClient
+from sqlalchemy.util.concurrency import in_greenlet
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.models.project import Project
+from app.models.task import Task
+from app.models.user import User
+from app.models.workspace import Workspace
+from app.services import board_service
+from app.tests.api.deps import *
+
+
+def test_board_summary_of_current_user(auth_client: TestClient):
+    response = auth_client.get(f"{settings.API_V1_STR}/board/summary")
+    assert response.status_code == 200
+    summary = response.json()
+    assert summary["total"] == 0
+    assert summary["overdue"] == 0
+    assert {"status": "draft", "priority": "high", "count": 0, "overdue": 0} in summary["cells"]
+
+
+def test_board_summary_of_project(auth_client: TestClient, session: Session):
+    workspace = auth_client.post(f"{settings.API_V1_STR}/workspaces/", json={"name": "Team"}).json()
+    project = auth_client.post(
+        f"{settings.API_V1_STR}/projects/", json={"name": "Launch", "workspace_id": workspace["id"], "status": "active"}).json()
+    session.add(Task(title="Design", owner_id=uuid.UUID(workspace["owner_id"]), project_id=uuid.UUID(project["id"])))
+    session.commit()
+
+    response = auth_client.get(f"{settings.API_V1_STR}/board/summary", params={"project_id": project["id"]})
+    assert response.status_code == 200
+    assert response.json()["total"] == 1
+
+
+def test_board_summary_of_unknown_project(auth_client: TestClient):
+    response = auth_client.get(f"{settings.API_V1_STR}/board/summary", params={"project_id": str(uuid.uuid4())})
+    assert response.status_code == 404
+
+
+def test_board_summary_of_someone_elses_project(auth_client: TestClient, session: Session, other_user: User):
+    workspace = Workspace(name="Private", slug="private", owner_id=other_user.id)
+    project = Project(name="Secret", owner_id=other_user.id, workspace_id=workspace.id)
+    session.add_all([workspace, project])
+    session.flush()
+    session.add(Task(title="Merger", owner_id=other_user.id, project_id=project.id))
+    session.commit()
+
+    response = auth_client.get(f"{settings.API_V1_STR}/board/summary", params={"project_id": str(project.id)})
+    assert response.status_code == 404
+
+
+def test_board_summary_redis_outside_the_session(auth_client: TestClient, monkeypatch: pytest.MonkeyPatch):
+    # With DATABASE_ASYNC the session runs services on the event loop, Redis must not be called there
+    in_session = []
+    for name in ("_cached_summary", "_store_summary"):
+        original = getattr(board_service, name)
+        monkeypatch.setattr(board_service, name,
+                            lambda *, _original=original, **kwargs: in_session.append(in_greenlet()) or _original(**kwargs))
+
+    response = auth_client.get(f"{settings.API_V1_STR}/board/summary")
+    assert response.status_code == 200
+    assert in_session == [False, False]
+
+
+def test_board_summary_requires_auth(client: TestClient):
+    assert client.get(f"{settings.API_V1_STR}/board/summary").status_code == 401
@@ -0,0 +1,89 @@
+import uuid
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.models.comment import Comment
+from app.models.task import Task
+from app.models.user import User
+from app.tests.api.deps import *
+
+
+@pytest.fixture
+def task_id(auth_client: TestClient) -> str:
+    response = auth_client.post(f"{settings.API_V1_STR}/tasks/bulk", json={"tasks": [{"title": "Discussed"}]})
+    assert response.status_code == 200
+    return response.json()["results"][0]["id"]
+
+
+def test_create_list_and_edit_comments(auth_client: TestClient, task_id: str, create_user: dict):
+    for index in range(3):
+        response = auth_client.post(
+            f"{settings.API_V1_STR}/tasks/{task_id}/comments/", json={"content": f"Comment {index}"})
+        assert response.status_code == 201
+    comment = response.json()
+    assert comment["author"]["full_name"] == create_user["full_name"]
+    assert set(comment["author"]) == {"id", "full_name", "image_url"}
+
+    contents, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = auth_client.get(f"{settings.API_V1_STR}/tasks/{task_id}/comments/", params=params)
+        assert response.status_code == 200
+        contents += [item["content"] for item in response.json()["items"]]
+        cursor = response.json()["next_cursor"]
+        if cursor is None:
+            break
+    assert contents == ["Comment 2", "Comment 1", "Comment 0"]
+
+    response = auth_client.patch(
+        f"{settings.API_V1_STR}/tasks/{task_id}/comments/{comment['id']}/", json={"content": "Edited"})
+    assert response.status_code == 200
+    assert response.json()["content"] == "Edited"
+    assert response.json()["is_edited"] is True
+
+
+def test_comment_on_unknown_task(auth_client: TestClient):
+    response = auth_client.post(f"{settings.API_V1_STR}/tasks/{uuid.uuid4()}/comments/", json={"content": "Hello"})
+    assert response.status_code == 404
+
+
+def test_comments_of_someone_elses_task(auth_client: TestClient, session: Session, other_user: User):
+    task = Task(title="Private", owner_id=other_user.id)
+    session.add(task)
+    session.flush()
+    session.add(Comment(content="Secret", author_id=other_user.id, task_id=task.id))
+    session.commit()
+
+    response = auth_client.post(f"{settings.API_V1_STR}/tasks/{task.id}/comments/", json={"content": "Hello"})
+    assert response.status_code == 404
+    assert auth_client.get(f"{settings.API_V1_STR}/tasks/{task.id}/comments/").status_code == 404
+
+
+def test_edit_own_comment_on_a_task_no_longer_visible(auth_client: TestClient, session: Session, other_user: User):
+    me = auth_client.get(f"{settings.API_V1_STR}/auth/me").json()
+    task = Task(title="Private", owner_id=other_user.id)
+    session.add(task)
+    session.flush()
+    # Written while the user could still see the task
+    comment = Comment(content="Mine", author_id=uuid.UUID(me["id"]), task_id=task.id)
+    session.add(comment)
+    session.commit()
+
+    response = auth_client.patch(
+        f"{settings.API_V1_STR}/tasks/{task.id}/comments/{comment.id}/", json={"content": "Edited"})
+    assert response.status_code == 404
+    session.refresh(comment)
+    assert comment.content == "Mine"
+
+
+def test_edit_unknown_comment(auth_client: TestClient, task_id: str):
+    response = auth_client.patch(
+        f"{settings.API_V1_STR}/tasks/{task_id}/comments/{uuid.uuid4()}/", json={"content": "Edited"})
+    assert response.status_code == 404
+
+
+def test_empty_comment_is_rejected(auth_client: TestClient, task_id: str):
+    response = auth_client.post(f"{settings.API_V1_STR}/tasks/{task_id}/comments/", json={"content": ""})
+    assert response.status_code == 422
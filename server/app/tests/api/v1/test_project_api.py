@@ -0,0 +1,96 @@
+import uuid
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.models.project import Project
+from app.models.user import User
+from app.models.workspace import Workspace, WorkspaceMember
+from app.tests.api.deps import *
+
+
+@pytest.fixture
+def workspace_id(auth_client: TestClient) -> str:
+    response = auth_client.post(f"{settings.API_V1_STR}/workspaces/", json={"name": "Team"})
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def _create_project(client: TestClient, workspace_id: str, name: str, status: str = "active"):
+    return client.post(
+        f"{settings.API_V1_STR}/projects/",
+        json={"workspace_id": workspace_id, "name": name, "status": status})
+
+
+def test_create_and_get_project(auth_client: TestClient, workspace_id: str):
+    response = _create_project(auth_client, workspace_id, "Mobile App")
+    assert response.status_code == 201
+    project = response.json()
+    assert project["name"] == "Mobile App"
+    assert project["members"] == []
+
+    response = auth_client.get(f"{settings.API_V1_STR}/projects/{project['id']}/")
+    assert response.status_code == 200
+    assert response.json()["id"] == project["id"]
+
+
+def test_create_project_duplicate_name(auth_client: TestClient, workspace_id: str):
+    assert _create_project(auth_client, workspace_id, "Mobile App").status_code == 201
+    assert _create_project(auth_client, workspace_id, "Mobile App").status_code == 409
+
+
+def test_create_project_unknown_workspace(auth_client: TestClient):
+    assert _create_project(auth_client, str(uuid.uuid4()), "Mobile App").status_code == 404
+
+
+def test_get_unknown_project(auth_client: TestClient):
+    response = auth_client.get(f"{settings.API_V1_STR}/projects/{uuid.uuid4()}/")
+    assert response.status_code == 404
+
+
+def test_list_projects_by_status_and_cursor(auth_client: TestClient, workspace_id: str):
+    for index, status in enumerate(["active", "planning", "active", "active"]):
+        assert _create_project(auth_client, workspace_id, f"Project {index}", status).status_code == 201
+
+    params = {"workspace_id": workspace_id, "status": "active", "limit": 2}
+    response = auth_client.get(f"{settings.API_V1_STR}/projects/", params=params)
+    assert response.status_code == 200
+    first = response.json()
+    response = auth_client.get(
+        f"{settings.API_V1_STR}/projects/", params={**params, "cursor": first["next_cursor"]})
+    rest = response.json()
+
+    assert [project["name"] for project in first["items"] + rest["items"]] == ["Project 0", "Project 2", "Project 3"]
+    assert rest["next_cursor"] is None
+
+
+@pytest.fixture
+def other_workspace(session: Session, other_user: User) -> Workspace:
+    workspace = Workspace(name="Private", slug="private", owner_id=other_user.id)
+    session.add(workspace)
+    session.commit()
+    return workspace
+
+
+def test_projects_of_someone_elses_workspace(auth_client: TestClient, session: Session, other_workspace: Workspace):
+    project = Project(name="Secret", owner_id=other_workspace.owner_id, workspace_id=other_workspace.id)
+    session.add(project)
+    session.commit()
+
+    assert _create_project(auth_client, str(other_workspace.id), "Mobile App").status_code == 404
+    response = auth_client.get(f"{settings.API_V1_STR}/projects/", params={"workspace_id": str(other_workspace.id)})
+    assert response.status_code == 404
+    assert auth_client.get(f"{settings.API_V1_STR}/projects/{project.id}/").status_code == 404
+
+
+def test_workspace_member_sees_projects(auth_client: TestClient, session: Session, other_workspace: Workspace):
+    me = auth_client.get(f"{settings.API_V1_STR}/auth/me").json()
+    session.add(WorkspaceMember(workspace_id=other_workspace.id, user_id=uuid.UUID(me["id"])))
+    session.commit()
+
+    response = _create_project(auth_client, str(other_workspace.id), "Mobile App")
+    assert response.status_code == 201
+    assert auth_client.get(f"{settings.API_V1_STR}/projects/{response.json()['id']}/").status_code == 200
+    response = auth_client.get(f"{settings.API_V1_STR}/projects/", params={"workspace_id": str(other_workspace.id)})
+    assert [project["name"] for project in response.json()["items"]] == ["Mobile App"]
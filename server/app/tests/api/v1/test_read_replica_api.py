@@ -0,0 +1,48 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel import SQLModel, create_engine
+
+from app.main import app
+from app.core import database
+from app.core.config import settings
+from app.core.database import get_redis
+from app.tests.api.deps import *
+
+
+@pytest.fixture
+def replica(tmp_path, monkeypatch):
+    """ An empty SQLite file standing in for a replica that has not caught up yet. """
+    url = f"sqlite:///{tmp_path / 'replica.db'}"
+    engine = create_engine(url)
+    SQLModel.metadata.create_all(engine)
+    monkeypatch.setattr(database, "replica_engines", [engine])
+    if settings.DATABASE_ASYNC:
+        async_engine = create_async_engine(url.replace("sqlite", "sqlite+aiosqlite", 1), poolclass=NullPool)
+        monkeypatch.setattr(database, "async_replica_engines", [async_engine])
+    yield engine
+    engine.dispose()
+
+
+def _workspace_names(client: TestClient) -> list[str]:
+    response = client.get(f"{settings.API_V1_STR}/workspaces/")
+    assert response.status_code == 200
+    return [workspace["name"] for workspace in response.json()["items"]]
+
+
+def test_get_routes_read_from_replica(auth_client: TestClient, replica):
+    assert _workspace_names(auth_client) == []
+
+
+def test_reads_stick_to_primary_after_write(auth_client: TestClient, replica):
+    response = auth_client.post(
+        f"{settings.API_V1_STR}/workspaces/",
+        json={"name": "Primary Only", "description": "Not replicated yet"},
+    )
+    assert response.status_code == 201
+    assert "Primary Only" in _workspace_names(auth_client)
+
+    # Once the sticky window is over the reads go back to the replica
+    app.dependency_overrides[get_redis]().flushall()
+    assert _workspace_names(auth_client) == []
@@ -0,0 +1,29 @@
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.models import User
+from app.tests.api.deps import *
+
+
+def test_db_pool_stats_requires_superuser(auth_client: TestClient):
+    response = auth_client.get(f"{settings.API_V1_STR}/system/db-pool")
+    assert response.status_code == 403
+
+
+def test_db_pool_stats(client: TestClient, session: Session, create_user: dict, access_token: str):
+    user = session.exec(select(User).where(User.email == create_user["email"])).one()
+    user.is_superuser = True
+    session.add(user)
+    session.commit()
+
+    response = client.get(
+        f"{settings.API_V1_STR}/system/db-pool",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["pid"] > 0
+    assert "pool_class" in data["engines"]["sync"]
+    if settings.DATABASE_ASYNC:
+        assert "async" in data["engines"]
@@ -1,6 +1,9 @@
 from fastapi import status
 from fastapi.testclient import TestClient
+from sqlalchemy import Engine, event
+from sqlalchemy.util.concurrency import in_greenlet
 from app.core.config import settings
+from app.services import tag_catalog_service
 from app.tests.api.deps import *
 
 
@@ -45,3 +48,64 @@ def test_tag_create_new_tag_api_fields_missing(auth_client: TestClient):
     response = auth_client.post(f"{settings.API_V1_STR}/tags/")
 
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+# ------ Search Tags API Tests -----------
+def test_tag_search_tags_api_limit_and_cursor(auth_client: TestClient):
+    for name in ("alpha", "alpine", "alps", "talpa"):
+        auth_client.post(f"{settings.API_V1_STR}/tags/", json={"name": name, "color_hex": "#ffffff"})
+
+    response = auth_client.get(f"{settings.API_V1_STR}/tags/search/", params={"q": "alp", "limit": 3})
+    assert response.status_code == status.HTTP_200_OK
+    assert [tag["name"] for tag in response.json()["items"]] == ["alpha", "alpine", "alps"]
+
+    response = auth_client.get(
+        f"{settings.API_V1_STR}/tags/search/",
+        params={"q": "alp", "limit": 3, "cursor": response.json()["next_cursor"]})
+    assert [tag["name"] for tag in response.json()["items"]] == ["talpa"]
+    assert response.json()["next_cursor"] is None
+
+
+def test_tag_search_tags_api_invalid_cursor(auth_client: TestClient):
+    response = auth_client.get(f"{settings.API_V1_STR}/tags/search/", params={"q": "a", "cursor": "@@"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_tag_endpoints_warm_catalog_needs_no_queries(auth_client: TestClient, create_tag: dict[str, str]):
+    # Warm the principal and tag catalog caches
+    auth_client.get(f"{settings.API_V1_STR}/tags/search/", params={"q": "test"})
+
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(Engine, "before_cursor_execute", listener)
+    try:
+        search = auth_client.get(f"{settings.API_V1_STR}/tags/search/", params={"q": "test"})
+        duplicate = auth_client.post(f"{settings.API_V1_STR}/tags/", json=create_tag)
+    finally:
+        event.remove(Engine, "before_cursor_execute", listener)
+
+    assert [tag["name"] for tag in search.json()["items"]] == [create_tag["name"]]
+    assert duplicate.status_code == status.HTTP_409_CONFLICT
+    assert statements == []
+
+
+def test_tag_create_new_tag_api_refreshes_catalog(auth_client: TestClient, create_tag: dict[str, str]):
+    auth_client.get(f"{settings.API_V1_STR}/tags/search/", params={"q": "new"})
+    auth_client.post(f"{settings.API_V1_STR}/tags/", json={"name": "New Tag", "color_hex": "#ffffff"})
+
+    response = auth_client.get(f"{settings.API_V1_STR}/tags/search/", params={"q": "new"})
+    assert [tag["name"] for tag in response.json()["items"]] == ["New Tag"]
+
+
+def test_tag_search_tags_api_redis_outside_the_session(auth_client: TestClient, monkeypatch: pytest.MonkeyPatch):
+    # With DATABASE_ASYNC the session runs services on the event loop, Redis must not be called there
+    in_session = []
+    for name in ("_ensure_listener", "_read_version"):
+        original = getattr(tag_catalog_service, name)
+        monkeypatch.setattr(tag_catalog_service, name,
+                            lambda redis, _original=original: in_session.append(in_greenlet()) or _original(redis))
+
+    response = auth_client.get(f"{settings.API_V1_STR}/tags/search/", params={"q": "test"})
+    assert response.status_code == status.HTTP_200_OK
+    assert in_session == [False, False]
@@ -0,0 +1,76 @@
+import uuid
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.models.task import Task
+from app.models.user import User
+from app.tests.api.deps import *
+
+
+def test_bulk_create_and_update_tasks(auth_client: TestClient):
+    response = auth_client.post(f"{settings.API_V1_STR}/tasks/bulk", json={"tasks": [
+        {"title": "Design", "priority": "high"},
+        {"title": "Build"},
+        {"title": "Elsewhere", "project_id": str(uuid.uuid4())},
+    ]})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["result"] for result in results] == ["created", "created", "not_found"]
+
+    response = auth_client.patch(f"{settings.API_V1_STR}/tasks/bulk", json={"tasks": [
+        {"id": results[0]["id"], "status": "done"},
+        {"id": results[1]["id"], "is_archived": True},
+        {"id": str(uuid.uuid4()), "priority": "low"},
+    ]})
+    assert response.status_code == 200
+    assert [result["result"] for result in response.json()["results"]] == ["updated", "updated", "not_found"]
+
+
+def test_bulk_write_refreshes_board_summary(auth_client: TestClient):
+    assert auth_client.get(f"{settings.API_V1_STR}/board/summary").json()["total"] == 0
+
+    auth_client.post(f"{settings.API_V1_STR}/tasks/bulk", json={"tasks": [{"title": "Design"}]})
+
+    assert auth_client.get(f"{settings.API_V1_STR}/board/summary").json()["total"] == 1
+
+
+def test_bulk_limit(auth_client: TestClient):
+    tasks = [{"title": f"Task {index}"} for index in range(settings.TASK_BULK_MAX_ITEMS + 1)]
+    response = auth_client.post(f"{settings.API_V1_STR}/tasks/bulk", json={"tasks": tasks})
+    assert response.status_code == 400
+
+
+def test_search_tasks(auth_client: TestClient):
+    auth_client.post(f"{settings.API_V1_STR}/tasks/bulk", json={"tasks": [
+        {"title": "Fix login redirect"},
+        {"title": "Write docs", "description": "Explain the login flow", "status": "in_review"},
+        {"title": "Plan sprint"},
+    ]})
+
+    response = auth_client.get(f"{settings.API_V1_STR}/tasks/search/", params={"q": "login", "limit": 1})
+    assert response.status_code == 200
+    page = response.json()
+    assert [task["title"] for task in page["items"]] == ["Fix login redirect"]
+
+    response = auth_client.get(
+        f"{settings.API_V1_STR}/tasks/search/", params={"q": "login", "limit": 1, "cursor": page["next_cursor"]})
+    assert [task["title"] for task in response.json()["items"]] == ["Write docs"]
+    assert response.json()["next_cursor"] is None
+
+    response = auth_client.get(f"{settings.API_V1_STR}/tasks/search/", params={"q": "login", "status": "in_review"})
+    assert [task["title"] for task in response.json()["items"]] == ["Write docs"]
+
+
+def test_search_tasks_of_someone_else(auth_client: TestClient, session: Session, other_user: User):
+    session.add(Task(title="Secret merger plan", owner_id=other_user.id))
+    session.commit()
+
+    response = auth_client.get(f"{settings.API_V1_STR}/tasks/search/", params={"q": "merger"})
+    assert response.status_code == 200
+    assert response.json()["items"] == []
+
+
+def test_search_tasks_needs_a_query(auth_client: TestClient):
+    response = auth_client.get(f"{settings.API_V1_STR}/tasks/search/")
+    assert response.status_code == 422
@@ -0,0 +1,70 @@
+import uuid
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.models.task import Task
+from app.models.user import User
+from app.tests.api.deps import *
+
+
+def _create_task(client: TestClient) -> str:
+    response = client.post(f"{settings.API_V1_STR}/tasks/bulk", json={"tasks": [{"title": "Design"}]})
+    return response.json()["results"][0]["id"]
+
+
+def test_timesheets_roll_up_by_week(auth_client: TestClient):
+    task_id = _create_task(auth_client)
+    timesheets = [
+        auth_client.post(f"{settings.API_V1_STR}/timesheets/", json={
+            "task_id": task_id, "description": "Work", "hours": hours, "work_date": work_date})
+        for hours, work_date in [(2, "2026-10-12T09:00:00Z"), (3.5, "2026-10-18T17:00:00Z"), (1, "2026-10-19T09:00:00Z")]
+    ]
+    assert all(response.status_code == 201 for response in timesheets)
+
+    response = auth_client.get(f"{settings.API_V1_STR}/timesheets/weekly/", params={"week": "2026-10-14"})
+    assert response.status_code == 200
+    assert response.json() == [{"task_id": task_id, "week_start": "2026-10-12", "hours": 5.5, "entries": 2}]
+
+    # Moved into the next week
+    response = auth_client.patch(
+        f"{settings.API_V1_STR}/timesheets/{timesheets[0].json()['id']}/", json={"work_date": "2026-10-20T09:00:00Z"})
+    assert response.status_code == 200
+    response = auth_client.delete(f"{settings.API_V1_STR}/timesheets/{timesheets[2].json()['id']}/")
+    assert response.status_code == 200
+
+    response = auth_client.get(f"{settings.API_V1_STR}/timesheets/weekly/", params={"week": "2026-10-25"})
+    assert response.json() == [{"task_id": task_id, "week_start": "2026-10-19", "hours": 2, "entries": 1}]
+
+
+def test_timesheet_for_unknown_task(auth_client: TestClient):
+    response = auth_client.post(f"{settings.API_V1_STR}/timesheets/", json={
+        "task_id": str(uuid.uuid4()), "description": "Work", "hours": 1})
+    assert response.status_code == 404
+
+
+def test_timesheet_for_someone_elses_task(auth_client: TestClient, session: Session, other_user: User):
+    task = Task(title="Private", owner_id=other_user.id)
+    session.add(task)
+    session.commit()
+
+    response = auth_client.post(f"{settings.API_V1_STR}/timesheets/", json={
+        "task_id": str(task.id), "description": "Work", "hours": 1})
+    assert response.status_code == 404
+    timesheet = auth_client.post(f"{settings.API_V1_STR}/timesheets/", json={
+        "task_id": _create_task(auth_client), "description": "Work", "hours": 1}).json()
+    response = auth_client.patch(f"{settings.API_V1_STR}/timesheets/{timesheet['id']}/", json={"task_id": str(task.id)})
+    assert response.status_code == 404
+    session.refresh(task)
+    assert not task.actual_hours
+
+
+def test_timesheet_hours_must_be_positive(auth_client: TestClient):
+    response = auth_client.post(f"{settings.API_V1_STR}/timesheets/", json={
+        "task_id": _create_task(auth_client), "description": "Work", "hours": 0})
+    assert response.status_code == 422
+
+
+def test_delete_unknown_timesheet(auth_client: TestClient):
+    response = auth_client.delete(f"{settings.API_V1_STR}/timesheets/{uuid.uuid4()}/")
+    assert response.status_code == 404
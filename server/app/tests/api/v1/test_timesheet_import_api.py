@@ -0,0 +1,46 @@
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.models import User
+from app.tests.api.deps import *
+
+
+def test_import_requires_superuser(auth_client: TestClient):
+    response = auth_client.post(
+        f"{settings.API_V1_STR}/timesheets/import/", files={"file": ("timesheets.csv", b"")})
+    assert response.status_code == 403
+
+
+def test_import_timesheets(auth_client: TestClient, session: Session, create_user: dict):
+    user = session.exec(select(User).where(User.email == create_user["email"])).one()
+    user.is_superuser = True
+    session.add(user)
+    session.commit()
+    task_id = auth_client.post(
+        f"{settings.API_V1_STR}/tasks/bulk", json={"tasks": [{"title": "Design"}]}).json()["results"][0]["id"]
+    content = (
+        "user_email,task_id,work_date,hours,description\n"
+        f"{create_user['email']},{task_id},2026-10-12,2,Design\n"
+        f"{create_user['email']},{task_id},2026-10-13,-1,Negative\n"
+    )
+
+    response = auth_client.post(
+        f"{settings.API_V1_STR}/timesheets/import/", files={"file": ("timesheets.csv", content.encode())})
+
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["imported"], report["rejected"]) == (1, 1)
+    assert report["errors"][0]["line"] == 3
+
+
+def test_import_missing_columns(auth_client: TestClient, session: Session, create_user: dict):
+    user = session.exec(select(User).where(User.email == create_user["email"])).one()
+    user.is_superuser = True
+    session.add(user)
+    session.commit()
+
+    response = auth_client.post(
+        f"{settings.API_V1_STR}/timesheets/import/", files={"file": ("timesheets.csv", b"hours\n1\n")})
+
+    assert response.status_code == 400
@@ -0,0 +1,162 @@
+import gzip
+import json
+import uuid
+from fastapi.testclient import TestClient
+from redis.exceptions import ConnectionError
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.models import Project, User, Workspace
+from app.models.workspace import WorkspaceInvitation, WorkspaceRole
+from app.services import job_service
+from app.tests.api.deps import *
+
+
+def test_list_workspaces_by_cursor(auth_client: TestClient, run_jobs):
+    # Registration queued the user's default workspace
+    assert run_jobs() == 1
+    for index in range(5):
+        response = auth_client.post(f"{settings.API_V1_STR}/workspaces/", json={"name": f"Workspace {index}"})
+        assert response.status_code == 201
+
+    names, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = auth_client.get(f"{settings.API_V1_STR}/workspaces/", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page["items"]) <= 2
+        names += [workspace["name"] for workspace in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert names[0] == f"{settings.FIRST_SUPERUSER_NAME}'s Workspace"
+    assert names[1:] == [f"Workspace {index}" for index in range(5)]
+
+
+def test_list_workspaces_limit_is_capped(auth_client: TestClient):
+    response = auth_client.get(
+        f"{settings.API_V1_STR}/workspaces/", params={"limit": settings.PAGE_MAX_LIMIT + 1})
+    assert response.status_code == 422
+
+
+def test_list_workspaces_invalid_cursor(auth_client: TestClient):
+    response = auth_client.get(f"{settings.API_V1_STR}/workspaces/", params={"cursor": "garbage"})
+    assert response.status_code == 400
+
+
+def test_export_workspace(auth_client: TestClient):
+    workspace = auth_client.post(f"{settings.API_V1_STR}/workspaces/", json={"name": "Export"}).json()
+    project = auth_client.post(
+        f"{settings.API_V1_STR}/projects/", json={"name": "Launch", "workspace_id": workspace["id"], "status": "active"}).json()
+    auth_client.post(
+        f"{settings.API_V1_STR}/tasks/bulk", json={"tasks": [{"title": "Design", "project_id": project["id"]}]})
+
+    response = auth_client.get(f"{settings.API_V1_STR}/workspaces/{workspace['id']}/export/")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-disposition"] == 'attachment; filename="workspace-export.ndjson"'
+    assert [json.loads(line)["type"] for line in response.text.splitlines()] == ["project", "task"]
+
+
+def test_export_workspace_csv_gzip(auth_client: TestClient):
+    workspace = auth_client.post(f"{settings.API_V1_STR}/workspaces/", json={"name": "Export"}).json()
+    auth_client.post(f"{settings.API_V1_STR}/projects/", json={"name": "Launch", "workspace_id": workspace["id"], "status": "active"})
+
+    response = auth_client.get(
+        f"{settings.API_V1_STR}/workspaces/{workspace['id']}/export/",
+        params={"format": "csv", "resource": "projects", "gzip": True})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/gzip"
+    assert response.headers["content-disposition"] == 'attachment; filename="workspace-export.projects.csv.gz"'
+    lines = gzip.decompress(response.content).decode().splitlines()
+    assert len(lines) == 2
+    assert "Launch" in lines[1]
+
+
+def test_export_workspace_of_someone_else(auth_client: TestClient, session: Session):
+    other = User(full_name="Other User", email="other@projex.com", hashed_password="hashed")
+    workspace = Workspace(name="Private", slug="private", owner_id=other.id)
+    session.add_all([other, workspace])
+    session.commit()
+
+    response = auth_client.get(f"{settings.API_V1_STR}/workspaces/{workspace.id}/export/")
+
+    assert response.status_code == 404
+
+
+def test_delete_workspace_hides_it_and_purges_in_background(auth_client: TestClient, session: Session, run_jobs):
+    workspace = auth_client.post(f"{settings.API_V1_STR}/workspaces/", json={"name": "Gone"}).json()
+    project = auth_client.post(
+        f"{settings.API_V1_STR}/projects/", json={"name": "Launch", "workspace_id": workspace["id"], "status": "active"}).json()
+    auth_client.post(
+        f"{settings.API_V1_STR}/tasks/bulk", json={"tasks": [{"title": "Design", "project_id": project["id"]}]})
+
+    response = auth_client.delete(f"{settings.API_V1_STR}/workspaces/{workspace['id']}/")
+
+    assert response.status_code == 202
+    assert auth_client.get(f"{settings.API_V1_STR}/workspaces/{workspace['id']}/").status_code == 404
+    assert auth_client.get(f"{settings.API_V1_STR}/projects/", params={"workspace_id": workspace["id"]}).status_code == 404
+    assert auth_client.get(f"{settings.API_V1_STR}/projects/{project['id']}/").status_code == 404
+    # The purge is queued for the worker (with the default workspace of the registration)
+    assert run_jobs() == 2
+    session.expire_all()
+    assert session.get(Workspace, uuid.UUID(workspace["id"])) is None
+    assert session.get(Project, uuid.UUID(project["id"])) is None
+
+
+def test_delete_workspace_without_job_queue(auth_client: TestClient, session: Session, monkeypatch):
+    workspace = auth_client.post(f"{settings.API_V1_STR}/workspaces/", json={"name": "Gone"}).json()
+
+    def enqueue_job(**kwargs):
+        raise ConnectionError("Redis is down")
+
+    monkeypatch.setattr(job_service, "enqueue_job", enqueue_job)
+    response = auth_client.delete(f"{settings.API_V1_STR}/workspaces/{workspace['id']}/")
+
+    assert response.status_code == 202
+    # Purged after the response instead
+    session.expire_all()
+    assert session.get(Workspace, uuid.UUID(workspace["id"])) is None
+
+
+def test_delete_workspace_of_someone_else(auth_client: TestClient, client: TestClient, session: Session, fake_redis):
+    other = User(full_name="Other User", email="other@projex.com", hashed_password="hashed")
+    workspace = Workspace(name="Private", slug="private", owner_id=other.id)
+    session.add_all([other, workspace])
+    session.commit()
+
+    assert auth_client.delete(f"{settings.API_V1_STR}/workspaces/{workspace.id}/").status_code == 404
+    del client.headers["Authorization"]
+    assert client.delete(f"{settings.API_V1_STR}/workspaces/{workspace.id}/").status_code == 401
+    session.refresh(workspace)
+    assert workspace.deleted_at is None
+    assert not fake_redis.exists(f"jobs:idempotency:purge-workspace:{workspace.id}")
+
+
+def test_invite_user_creates_one_invitation(auth_client: TestClient, session: Session, run_jobs):
+    workspace = auth_client.post(f"{settings.API_V1_STR}/workspaces/", json={"name": "Team"}).json()
+    invitee = User(full_name="Invitee", email="invitee@projex.com", hashed_password="hashed")
+    session.add(invitee)
+    session.commit()
+
+    for role in ("member", "member", "admin"):
+        response = auth_client.post(
+            f"{settings.API_V1_STR}/workspaces/{workspace['id']}/invite/",
+            json={"email": "invitee@projex.com", "role": role})
+        assert response.status_code == 202
+
+    # The three invites and the default workspace of the registration
+    assert run_jobs() == 4
+    invitations = session.exec(select(WorkspaceInvitation)).all()
+    # The pending invitation is reused, with the role of the last invite
+    assert [(invitation.invitee_id, invitation.role) for invitation in invitations] == [(invitee.id, WorkspaceRole.ADMIN)]
+
+
+def test_invite_user_to_unknown_workspace(auth_client: TestClient):
+    response = auth_client.post(
+        f"{settings.API_V1_STR}/workspaces/{uuid.uuid4()}/invite/", json={"email": "invitee@projex.com", "role": "member"})
+    assert response.status_code == 404
@@ -1,42 +1,72 @@
 import pytest
 import fakeredis
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
 from sqlmodel import Session, create_engine, SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel.pool import StaticPool
 
 
 from app.main import app
-from app.core.database import get_db, get_redis
+from app.core.config import settings
+from app.core.database import get_db, get_async_db, get_redis
+from app.services.tag_catalog_service import reset_tag_catalog
 from app.models import *
 
 
 @pytest.fixture(name="session")
-def session_fixture():
-    engine = create_engine(
-        "sqlite://",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool
-    )
+def session_fixture(tmp_path):
+    if settings.DATABASE_ASYNC:
+        # The app's aiosqlite engine has to see the same database as this session
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'test.db'}",
+            connect_args={"check_same_thread": False},
+        )
+    else:
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool
+        )
     SQLModel.metadata.create_all(engine)
     with Session(engine) as session:
         yield session
     SQLModel.metadata.drop_all(engine)
 
 
+@pytest.fixture
+def fake_redis() -> fakeredis.FakeStrictRedis:
+    return fakeredis.FakeStrictRedis()
+
+
 @pytest.fixture(name="client")
-def client_fixture(session: Session):
+def client_fixture(session: Session, fake_redis: fakeredis.FakeStrictRedis):
     def get_session_override():
         return session
 
-    # Create a fake Redis instance
-    fake_redis = fakeredis.FakeStrictRedis()
-
     # Override Redis dependency
     def get_redis_override():
         return fake_redis
 
+    # The tag catalog is per process, it must not outlive this test's database
+    reset_tag_catalog()
     app.dependency_overrides[get_db] = get_session_override
     app.dependency_overrides[get_redis] = get_redis_override
+
+    if settings.DATABASE_ASYNC:
+        async_engine = create_async_engine(
+            session.get_bind().url.set(drivername="sqlite+aiosqlite"),
+            poolclass=NullPool,
+        )
+
+        async def get_async_session_override():
+            async with AsyncSession(async_engine, expire_on_commit=False) as async_session:
+                yield async_session
+
+        app.dependency_overrides[get_async_db] = get_async_session_override
+
     with TestClient(app) as client:
         yield client
     app.dependency_overrides.clear()
+    reset_tag_catalog()
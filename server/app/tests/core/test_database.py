@@ -0,0 +1,63 @@
+import uuid
+import pytest
+from sqlmodel import SQLModel, create_engine, select
+
+from app.core.database import RoutingSession
+from app.models import *
+
+
+@pytest.fixture
+def primary_and_replica(tmp_path):
+    engines = []
+    for name in ("primary", "replica"):
+        engine = create_engine(f"sqlite:///{tmp_path / name}.db")
+        SQLModel.metadata.create_all(engine)
+        engines.append(engine)
+    yield engines
+    for engine in engines:
+        engine.dispose()
+
+
+def _add_tag(engine, name: str) -> None:
+    with RoutingSession(bind=engine) as session:
+        session.add(Tag(name=name))
+        session.commit()
+
+
+def test_reads_go_to_replica(primary_and_replica):
+    primary, replica = primary_and_replica
+    _add_tag(replica, "from-replica")
+
+    with RoutingSession(bind=primary, replica=replica) as session:
+        names = session.exec(select(Tag.name)).all()
+    assert names == ["from-replica"]
+
+
+def test_writes_go_to_primary_and_session_sticks_to_it(primary_and_replica):
+    primary, replica = primary_and_replica
+
+    with RoutingSession(bind=primary, replica=replica) as session:
+        session.add(Tag(name="written"))
+        session.commit()
+        # Read your writes: the session stays on the primary after writing
+        assert session.exec(select(Tag.name)).all() == ["written"]
+
+    with RoutingSession(bind=replica) as session:
+        assert session.exec(select(Tag)).all() == []
+
+
+def test_select_for_update_goes_to_primary(primary_and_replica):
+    primary, replica = primary_and_replica
+    _add_tag(primary, "locked")
+
+    with RoutingSession(bind=primary, replica=replica) as session:
+        assert session.exec(select(Tag.name).with_for_update()).all() == ["locked"]
+
+
+def test_without_replica_everything_uses_primary(primary_and_replica):
+    primary, _ = primary_and_replica
+    _add_tag(primary, "only-primary")
+
+    with RoutingSession(bind=primary) as session:
+        assert session.get(Tag, uuid.uuid4()) is None
+        assert session.exec(select(Tag.name)).all() == ["only-primary"]
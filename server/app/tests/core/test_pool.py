@@ -0,0 +1,52 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.core.pool import InstrumentedQueuePool, PoolMetrics, get_pool_stats
+
+
+@pytest.fixture
+def pooled_engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    yield engine
+    engine.dispose()
+
+
+def test_pool_metrics_bucket_waits():
+    metrics = PoolMetrics()
+    metrics.record(wait_ms=0.5)
+    metrics.record(wait_ms=30)
+    metrics.record(wait_ms=9000, timed_out=True)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["checkouts"] == 2
+    assert snapshot["timeouts"] == 1
+    assert snapshot["wait_max_ms"] == 9000
+    assert snapshot["wait_histogram"]["le_1ms"] == 1
+    assert snapshot["wait_histogram"]["le_50ms"] == 1
+    assert snapshot["wait_histogram"]["le_inf"] == 1
+
+
+def test_pool_stats_track_checkouts_and_timeouts(pooled_engine):
+    with pooled_engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        stats = get_pool_stats(engine=pooled_engine)
+        assert stats["pool_class"] == "InstrumentedQueuePool"
+        assert stats["checked_out"] == 1
+
+        # The only connection is held, so a second checkout waits and times out
+        with pytest.raises(PoolTimeoutError):
+            pooled_engine.connect()
+
+    stats = get_pool_stats(engine=pooled_engine)
+    assert stats["size"] == 1
+    assert stats["checked_out"] == 0
+    assert stats["checkouts"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["wait_max_ms"] >= 50
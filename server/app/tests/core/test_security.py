@@ -0,0 +1,92 @@
+import pytest
+import time
+from datetime import timedelta
+
+from app.core import security
+from app.core.config import settings
+from app.core.security import (
+    get_password_hash,
+    get_password_hash_async,
+    verify_password_async,
+    create_access_token,
+    decode_access_token,
+)
+from app.exceptions.auth import PasswordHasherBusyException, InvalidTokenException
+from app.utils import cache as cache_module
+
+
+# ---------- Async password hashing tests -------------
+@pytest.mark.asyncio
+async def test_get_password_hash_async_success():
+    hashed_password = await get_password_hash_async(password="secret")
+
+    assert hashed_password != "secret"
+    assert await verify_password_async(plain_password="secret", hashed_password=hashed_password)
+
+
+@pytest.mark.asyncio
+async def test_verify_password_async_wrong_password():
+    hashed_password = get_password_hash(password="secret")
+
+    assert not await verify_password_async(plain_password="wrong", hashed_password=hashed_password)
+
+
+@pytest.mark.asyncio
+async def test_password_hash_async_pool_full(monkeypatch: pytest.MonkeyPatch):
+    capacity = settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_MAX_PENDING
+    monkeypatch.setattr(security, "_password_jobs_in_flight", capacity)
+
+    with pytest.raises(PasswordHasherBusyException):
+        await get_password_hash_async(password="secret")
+
+
+@pytest.mark.asyncio
+async def test_password_jobs_released_after_run():
+    await get_password_hash_async(password="secret")
+
+    assert security.get_password_jobs_in_flight() == 0
+
+
+# ---------- Access token cache tests -------------
+@pytest.fixture
+def token_cache():
+    security.access_token_cache.clear()
+    yield security.access_token_cache
+    security.access_token_cache.clear()
+
+
+def test_decode_access_token_cache_hit(token_cache):
+    token = create_access_token(subject="user-1")
+
+    assert decode_access_token(token=token) == "user-1"
+    assert decode_access_token(token=token) == "user-1"
+    assert token_cache.stats()["misses"] == 1
+    assert token_cache.stats()["hits"] == 1
+
+
+def test_decode_access_token_cache_disabled(token_cache, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "ACCESS_TOKEN_CACHE_ENABLED", False)
+    token = create_access_token(subject="user-1")
+
+    decode_access_token(token=token)
+    decode_access_token(token=token)
+    assert token_cache.stats()["hits"] == 0
+    assert token_cache.stats()["size"] == 0
+
+
+def test_decode_access_token_cache_never_serves_expired(token_cache, monkeypatch: pytest.MonkeyPatch):
+    token = create_access_token(subject="user-1", expire_delta=timedelta(minutes=1))
+    decode_access_token(token=token)
+
+    # Jump the cache clock past the token's exp
+    real_time = time.time
+    monkeypatch.setattr(cache_module.time, "time", lambda: real_time() + 120)
+    decode_access_token(token=token)
+    assert token_cache.stats()["hits"] == 0
+    assert token_cache.stats()["misses"] == 2
+
+
+def test_decode_access_token_invalid_not_cached(token_cache):
+    with pytest.raises(InvalidTokenException):
+        decode_access_token(token="invalidtoken")
+    assert token_cache.stats()["size"] == 0
@@ -0,0 +1,52 @@
+import pytest
+from datetime import datetime, timezone
+from sqlmodel import Session
+
+from app.models.project import Project, ProjectMember
+from app.models.user import User
+from app.models.workspace import Workspace, WorkspaceMember
+from app.services.access_service import can_access_project, can_access_workspace
+from app.tests.api.deps import *
+
+
+# --------- Deps ---------------
+@pytest.fixture
+def project(session: Session, other_user: User) -> Project:
+    workspace = Workspace(name="Private", slug="private", owner_id=other_user.id)
+    session.add(workspace)
+    session.flush()
+    project = Project(name="Secret", owner_id=other_user.id, workspace_id=workspace.id)
+    session.add(project)
+    session.commit()
+    return project
+
+
+# ---------- Workspace access tests -------------
+def test_workspace_owner_and_members_only(session: Session, user: User, other_user: User, project: Project):
+    workspace_id = project.workspace_id
+
+    assert can_access_workspace(session=session, workspace_id=workspace_id, user_id=other_user.id)
+    assert not can_access_workspace(session=session, workspace_id=workspace_id, user_id=user.id)
+    session.add(WorkspaceMember(workspace_id=workspace_id, user_id=user.id))
+    session.commit()
+    assert can_access_workspace(session=session, workspace_id=workspace_id, user_id=user.id)
+
+
+def test_deleted_workspace_is_not_accessible(session: Session, other_user: User, project: Project):
+    session.get(Workspace, project.workspace_id).deleted_at = datetime.now(timezone.utc)
+    session.commit()
+
+    assert not can_access_workspace(session=session, workspace_id=project.workspace_id, user_id=other_user.id)
+    assert not can_access_project(session=session, project_id=project.id, user_id=other_user.id)
+
+
+# ---------- Project access tests -------------
+def test_project_through_workspace_or_project_membership(session: Session, user: User, other_user: User, project: Project):
+    assert can_access_project(session=session, project_id=project.id, user_id=other_user.id)
+    assert not can_access_project(session=session, project_id=project.id, user_id=user.id)
+
+    session.add(ProjectMember(project_id=project.id, user_id=user.id))
+    session.commit()
+    assert can_access_project(session=session, project_id=project.id, user_id=user.id)
+    # A project member does not see the rest of the workspace
+    assert not can_access_workspace(session=session, workspace_id=project.workspace_id, user_id=user.id)
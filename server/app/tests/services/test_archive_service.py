@@ -0,0 +1,100 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import event, func, select as sa_select
+from sqlmodel import Session, select
+
+from app.models.archive import (
+    comments_archive,
+    task_tags_archive,
+    tasks_archive,
+    timesheet_rollups_archive,
+    timesheets_archive,
+)
+from app.models.comment import Comment
+from app.models.tag import Tag, TaskTag
+from app.models.task import Task
+from app.models.timesheet import Timesheet, TimesheetRollup
+from app.models.user import User
+from app.schemas.task import TaskBulkUpdate
+from app.services import archive_service, task_service
+from app.services.timesheet_service import TimesheetDelta, apply_timesheet_deltas, get_user_week_rollups
+from app.tests.api.deps import *
+
+WORK_DATE = datetime(2026, 1, 5, 9, tzinfo=timezone.utc)
+
+
+# --------- Deps ---------------
+def _task_with_history(session: Session, user: User, *, archived_days_ago: int | None) -> uuid.UUID:
+    """ A task with a comment, a timesheet (and its rollup) and a tag, archived that many days ago. """
+    archived_at = None if archived_days_ago is None else datetime.now(timezone.utc) - timedelta(days=archived_days_ago)
+    task = Task(title="Old work", owner_id=user.id, is_archived=archived_at is not None, archived_at=archived_at)
+    tag = Tag(name=f"tag-{uuid.uuid4().hex[:8]}")
+    session.add_all([task, tag])
+    session.flush()
+    session.add_all([
+        Comment(content="Done long ago", author_id=user.id, task_id=task.id),
+        Timesheet(description="Work", hours=2, work_date=WORK_DATE, user_id=user.id, task_id=task.id),
+        TaskTag(task_id=task.id, tag_id=tag.id),
+    ])
+    apply_timesheet_deltas(session=session, deltas=[TimesheetDelta(user.id, task.id, WORK_DATE, 2, 1)])
+    session.commit()
+    return task.id
+
+
+def _count(session: Session, table, task_id: uuid.UUID) -> int:
+    column = table.c.id if "title" in table.c else table.c.task_id
+    return session.execute(sa_select(func.count()).select_from(table).where(column == task_id)).scalar_one()
+
+
+# ---------- Archive tests -------------
+def test_moves_only_long_archived_tasks_with_their_rows(session: Session, user: User):
+    old = _task_with_history(session, user, archived_days_ago=120)
+    recent = _task_with_history(session, user, archived_days_ago=10)
+    live = _task_with_history(session, user, archived_days_ago=None)
+
+    moved = archive_service.archive_tasks(session=session, older_than_days=90)
+
+    assert moved == 1
+    pairs = [
+        (Task.__table__, tasks_archive), (Comment.__table__, comments_archive),
+        (Timesheet.__table__, timesheets_archive), (TimesheetRollup.__table__, timesheet_rollups_archive),
+        (TaskTag.__table__, task_tags_archive),
+    ]
+    for live_table, archive_table in pairs:
+        assert (_count(session, live_table, old), _count(session, archive_table, old)) == (0, 1)
+        for task_id in (recent, live):
+            assert (_count(session, live_table, task_id), _count(session, archive_table, task_id)) == (1, 0)
+
+
+def test_moves_in_batches_and_can_run_again(session: Session, user: User):
+    for _ in range(5):
+        _task_with_history(session, user, archived_days_ago=200)
+    commits = []
+    event.listen(session, "after_commit", lambda *_: commits.append(1))
+
+    assert archive_service.archive_tasks(session=session, older_than_days=90, batch_size=2) == 5
+    assert len(commits) == 3
+    assert archive_service.archive_tasks(session=session, older_than_days=90, batch_size=2) == 0
+    assert session.exec(select(func.count()).select_from(Task)).one() == 0
+
+
+def test_bulk_archive_sets_archived_at(session: Session, user: User):
+    task_id = _task_with_history(session, user, archived_days_ago=None)
+
+    task_service.bulk_update_tasks(session=session, tasks=[TaskBulkUpdate(id=task_id, is_archived=True)], owner_id=user.id)
+    assert session.get(Task, task_id, populate_existing=True).archived_at is not None
+    task_service.bulk_update_tasks(session=session, tasks=[TaskBulkUpdate(id=task_id, is_archived=False)], owner_id=user.id)
+    assert session.get(Task, task_id, populate_existing=True).archived_at is None
+
+
+def test_weekly_rollups_include_archive_on_demand(session: Session, user: User):
+    old = _task_with_history(session, user, archived_days_ago=120)
+    live = _task_with_history(session, user, archived_days_ago=None)
+    archive_service.archive_tasks(session=session, older_than_days=90)
+
+    hot = get_user_week_rollups(session=session, user_id=user.id, week=WORK_DATE.date())
+    everything = get_user_week_rollups(session=session, user_id=user.id, week=WORK_DATE.date(), include_archived=True)
+
+    assert [rollup.task_id for rollup in hot] == [live]
+    assert sorted(rollup.task_id for rollup in everything) == sorted([old, live])
+
@@ -0,0 +1,124 @@
+import uuid
+import pytest
+import fakeredis
+from datetime import datetime, timedelta, timezone
+from redis import Redis
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.models.project import Project
+from app.models.task import Task, TaskPriority, TaskStatus
+from app.models.user import User
+from app.models.workspace import Workspace
+from app.services import board_service
+from app.tests.api.deps import *
+
+
+# --------- Deps ---------------
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeRedis()
+
+
+@pytest.fixture
+def project(session: Session, user: User) -> Project:
+    workspace = Workspace(name="Team", slug="team", owner_id=user.id)
+    session.add(workspace)
+    session.flush()
+    project = Project(name="App", owner_id=user.id, workspace_id=workspace.id)
+    session.add(project)
+    session.commit()
+    return project
+
+
+def _cells(summary) -> dict[tuple[TaskStatus, TaskPriority], tuple[int, int]]:
+    return {(cell.status, cell.priority): (cell.count, cell.overdue) for cell in summary.cells if cell.count}
+
+
+def _add_tasks(session: Session, user: User, project: Project | None = None) -> None:
+    yesterday = datetime.now(timezone.utc) - timedelta(days=1)
+    project_id = project.id if project else None
+    session.add_all([
+        Task(title="a", owner_id=user.id, project_id=project_id, status=TaskStatus.DRAFT, priority=TaskPriority.HIGH),
+        Task(title="b", owner_id=user.id, project_id=project_id, status=TaskStatus.DRAFT, priority=TaskPriority.HIGH,
+             due_date=yesterday),
+        Task(title="c", owner_id=user.id, project_id=project_id, status=TaskStatus.DONE, priority=TaskPriority.LOW,
+             due_date=yesterday),
+        Task(title="d", owner_id=user.id, project_id=project_id, status=TaskStatus.IN_REVIEW, is_archived=True),
+    ])
+    session.commit()
+
+
+# ---------- Board summary tests -------------
+def test_summary_counts_by_status_and_priority(session: Session, redis_client: Redis, user: User):
+    _add_tasks(session, user)
+
+    summary = board_service.compute_board_summary(session=session, owner_id=user.id)
+
+    # Archived tasks are left out, done tasks are never overdue
+    assert _cells(summary) == {
+        (TaskStatus.DRAFT, TaskPriority.HIGH): (2, 1),
+        (TaskStatus.DONE, TaskPriority.LOW): (1, 0),
+    }
+    assert len(summary.cells) == len(TaskStatus) * len(TaskPriority)
+    assert (summary.total, summary.overdue) == (3, 1)
+
+
+def test_summary_by_project(session: Session, redis_client: Redis, user: User, project: Project):
+    _add_tasks(session, user, project)
+    _add_tasks(session, user)
+
+    summary = board_service.get_board_summary(session=session, redis=redis_client, project_id=project.id)
+
+    assert summary.total == 3
+
+
+def test_cached_summary_until_a_task_changes(
+    session: Session, redis_client: Redis, user: User, count_queries: list[str]
+):
+    _add_tasks(session, user)
+    user_id = user.id
+    count_queries.clear()
+
+    first = board_service.get_board_summary(session=session, redis=redis_client, owner_id=user_id)
+    second = board_service.get_board_summary(session=session, redis=redis_client, owner_id=user_id)
+    assert second == first
+    assert len(count_queries) == 1
+
+    session.add(Task(title="e", owner_id=user_id, status=TaskStatus.DONE, priority=TaskPriority.LOW))
+    session.commit()
+    board_service.invalidate_board_summaries(redis=redis_client, owner_ids=[user_id])
+    count_queries.clear()
+
+    third = board_service.get_board_summary(session=session, redis=redis_client, owner_id=user_id)
+    assert len(count_queries) == 1
+    assert third.total == first.total + 1
+
+
+def test_summary_without_redis(session: Session, user: User):
+    _add_tasks(session, user)
+    broken = fakeredis.FakeRedis(server=fakeredis.FakeServer())
+    broken.connected = False
+
+    summary = board_service.get_board_summary(session=session, redis=broken, owner_id=user.id)
+
+    assert summary.total == 3
+
+
+def test_board_summary_reads_the_partial_index(session: Session, user: User):
+    executed: list[tuple] = []
+    listener = lambda *args: executed.append((args[2], args[3]))
+    event.listen(session.get_bind(), "before_cursor_execute", listener)
+    board_service.compute_board_summary(session=session, owner_id=user.id)
+    board_service.compute_board_summary(session=session, project_id=uuid.uuid4())
+    event.remove(session.get_bind(), "before_cursor_execute", listener)
+
+    plans = [
+        " ".join(row[-1] for row in session.connection().exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters).all())
+        for statement, parameters in executed
+    ]
+    assert "ix_tasks_open_owner_id_status_priority_due_date" in plans[0]
+    assert "ix_tasks_open_project_id_status_priority_due_date" in plans[1]
+    # Grouped in index order, no sort step
+    assert not any("TEMP B-TREE" in plan for plan in plans)
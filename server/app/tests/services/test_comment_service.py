@@ -0,0 +1,90 @@
+import uuid
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.models.comment import Comment
+from app.models.task import Task
+from app.models.user import User
+from app.schemas.comment import CommentCreate, CommentResponse, CommentUpdate
+from app.services import comment_service
+from app.tests.api.deps import *
+
+
+# --------- Deps ---------------
+@pytest.fixture
+def task_id(session: Session, user: User) -> uuid.UUID:
+    task = Task(title="Discussed", owner_id=user.id)
+    session.add(task)
+    session.commit()
+    return task.id
+
+
+# ---------- Comment feed tests -------------
+@pytest.mark.parametrize("comments", [3, 50])
+def test_task_comments_newest_first_one_query_per_page(
+    session: Session, user: User, task_id: uuid.UUID, count_queries: list[str], comments: int
+):
+    started = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    for index in range(comments):
+        # Pairs share a timestamp, the id breaks the tie
+        session.add(Comment(content=f"Comment {index}", author_id=user.id, task_id=task_id,
+                            created_at=started + timedelta(minutes=index // 2)))
+    # Another task's thread is not listed
+    other = Task(title="Other", owner_id=user.id)
+    session.add(other)
+    session.add(Comment(content="Elsewhere", author_id=user.id, task_id=other.id))
+    session.commit()
+    user_name = user.full_name
+    session.expunge_all()
+    count_queries.clear()
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        items, cursor = comment_service.get_task_comments(session=session, task_id=task_id, limit=10, cursor=cursor)
+        seen += [CommentResponse.model_validate(comment) for comment in items]
+        pages += 1
+        if cursor is None:
+            break
+
+    # The author comes with the page, no query per comment
+    assert len(count_queries) == pages
+    assert len(seen) == comments
+    assert all(comment.author.full_name == user_name for comment in seen)
+    keys = [(comment.created_at, comment.id) for comment in seen]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_task_comments_page_is_an_index_range(session: Session, user: User, task_id: uuid.UUID):
+    session.add_all(Comment(content=f"Comment {index}", author_id=user.id, task_id=task_id) for index in range(3))
+    session.commit()
+    executed: list[tuple] = []
+    listener = lambda *args: executed.append((args[2], args[3]))
+    event.listen(session.get_bind(), "before_cursor_execute", listener)
+    _, cursor = comment_service.get_task_comments(session=session, task_id=task_id, limit=1)
+    comment_service.get_task_comments(session=session, task_id=task_id, limit=1, cursor=cursor)
+    event.remove(session.get_bind(), "before_cursor_execute", listener)
+
+    for statement, parameters in executed:
+        plan = " ".join(row[-1] for row in session.connection().exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters).all())
+        # Read in page order straight from the index, no sort step
+        assert "ix_comments_task_id_created_at_id" in plan
+        assert "TEMP B-TREE" not in plan
+
+
+def test_update_comment_only_by_author(session: Session, user: User, task_id: uuid.UUID):
+    comment = comment_service.create_comment(
+        session=session, task_id=task_id, comment_create=CommentCreate(content="First"), author_id=user.id)
+
+    assert comment_service.update_comment(
+        session=session, task_id=task_id, comment_id=comment.id,
+        comment_update=CommentUpdate(content="Hijacked"), author_id=uuid.uuid4()) is None
+    updated = comment_service.update_comment(
+        session=session, task_id=task_id, comment_id=comment.id,
+        comment_update=CommentUpdate(content="Second"), author_id=user.id)
+
+    assert updated.content == "Second"
+    assert updated.is_edited
+    assert updated.author.id == user.id
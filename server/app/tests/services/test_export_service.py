@@ -0,0 +1,135 @@
+import csv
+import gzip
+import io
+import json
+import tracemalloc
+import uuid
+import pytest
+from datetime import datetime, timezone
+from sqlalchemy import insert
+from sqlmodel import Session
+
+from app.models.comment import Comment
+from app.models.project import Project
+from app.models.task import Task, TaskPriority, TaskStatus
+from app.models.timesheet import Timesheet
+from app.models.user import User
+from app.models.workspace import Workspace
+from app.services import archive_service, export_service
+from app.tests.api.deps import *
+
+
+# --------- Deps ---------------
+@pytest.fixture
+def workspace(session: Session, user: User) -> dict:
+    """ A workspace with one project, two tasks, a comment and a timesheet, and another workspace's project. """
+    workspace = Workspace(name="Export", slug="export", owner_id=user.id)
+    other = Workspace(name="Other", slug="other", owner_id=user.id)
+    project = Project(name="Launch", owner_id=user.id, workspace_id=workspace.id)
+    hidden = Project(name="Hidden", owner_id=user.id, workspace_id=other.id)
+    tasks = [Task(title=f"Task, {index}", owner_id=user.id, project_id=project.id) for index in range(2)]
+    session.add_all([workspace, other, project, hidden, *tasks])
+    session.flush()
+    session.add(Comment(content="Looks good", author_id=user.id, task_id=tasks[0].id))
+    session.add(Timesheet(description="Design", hours=2, user_id=user.id, task_id=tasks[1].id,
+                          work_date=datetime(2026, 10, 12, tzinfo=timezone.utc)))
+    session.commit()
+    return {"id": workspace.id, "project_id": project.id, "task_ids": {task.id for task in tasks}}
+
+
+def export(session: Session, workspace_id: uuid.UUID, **kwargs) -> bytes:
+    return b"".join(export_service.iter_workspace_export(session=session, workspace_id=workspace_id, **kwargs))
+
+
+# ---------- Export tests -------------
+def test_export_ndjson_all_resources(session: Session, workspace: dict):
+    records = [json.loads(line) for line in export(session, workspace["id"]).decode().splitlines()]
+
+    assert [record["type"] for record in records] == ["project", "task", "task", "comment", "timesheet"]
+    assert records[0]["id"] == str(workspace["project_id"])
+    assert records[0]["name"] == "Launch"
+    assert {uuid.UUID(record["id"]) for record in records[1:3]} == workspace["task_ids"]
+    assert records[1]["status"] == "draft"
+    assert records[3]["content"] == "Looks good"
+    assert records[4]["hours"] == 2
+    assert records[4]["work_date"].startswith("2026-10-12")
+
+
+def test_export_csv_one_resource(session: Session, workspace: dict):
+    rows = list(csv.DictReader(io.StringIO(
+        export(session, workspace["id"], export_format="csv", resource="tasks").decode())))
+
+    assert len(rows) == 2
+    assert {row["title"] for row in rows} == {"Task, 0", "Task, 1"}
+    assert {row["project_id"] for row in rows} == {str(workspace["project_id"])}
+
+
+def test_export_csv_empty_resource_has_header(session: Session, user: User):
+    workspace = Workspace(name="Empty", slug="empty", owner_id=user.id)
+    session.add(workspace)
+    session.commit()
+
+    content = export(session, workspace.id, export_format="csv")
+
+    assert content.decode().splitlines() == [",".join(Project.__table__.columns.keys())]
+
+
+def test_export_gzip_round_trip(session: Session, workspace: dict):
+    plain = export(session, workspace["id"])
+    compressed = export(session, workspace["id"], compress=True)
+
+    assert compressed[:2] == b"\x1f\x8b"
+    assert gzip.decompress(compressed) == plain
+
+
+def test_export_memory_does_not_grow_with_rows(session: Session, user: User, monkeypatch):
+    """ Peak memory of the export stays flat from 5k to 20k tasks (1M rows: app.benchmarks.workspace_export). """
+    monkeypatch.setattr(export_service, "EXPORT_YIELD_PER", 500)
+    workspace = Workspace(name="Big", slug="big", owner_id=user.id)
+    project = Project(name="Big", owner_id=user.id, workspace_id=workspace.id)
+    session.add_all([workspace, project])
+    session.commit()
+    workspace_id, project_id, user_id = workspace.id, project.id, user.id
+
+    now = datetime.now(timezone.utc)
+    peaks = []
+    for rows, added in ((5_000, 5_000), (20_000, 15_000)):
+        session.execute(insert(Task.__table__), [
+            {"id": uuid.uuid4(), "title": f"Task {index}", "description": "x" * 200, "is_archived": False,
+             "status": TaskStatus.DRAFT, "priority": TaskPriority.MEDIUM, "progress_percentage": 0,
+             "owner_id": user_id, "project_id": project_id, "created_at": now, "updated_at": now}
+            for index in range(added)
+        ])
+        session.commit()
+        session.expunge_all()
+
+        tracemalloc.start()
+        size = sum(len(chunk) for chunk in export_service.iter_workspace_export(
+            session=session, workspace_id=workspace_id, resource="tasks"))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peaks.append(peak)
+        assert size > rows * 200
+
+    # Four times the rows, not four times the memory (the 20k export alone is over 5 MB)
+    assert peaks[1] < peaks[0] * 1.5
+    assert peaks[1] < 2 * 2**20
+
+
+def test_export_includes_archive_on_demand(session: Session, workspace: dict):
+    task_id = next(iter(workspace["task_ids"]))
+    task = session.get(Task, task_id)
+    task.is_archived = True
+    task.archived_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    session.commit()
+    archive_service.archive_tasks(session=session, older_than_days=30)
+
+    def task_ids(**kwargs) -> set[uuid.UUID]:
+        lines = export(session, workspace["id"], resource="tasks", **kwargs).decode().splitlines()
+        return {uuid.UUID(json.loads(line)["id"]) for line in lines}
+
+    assert task_ids() == workspace["task_ids"] - {task_id}
+    assert task_ids(include_archived=True) == workspace["task_ids"]
+    rows = list(csv.DictReader(io.StringIO(
+        export(session, workspace["id"], export_format="csv", resource="comments", include_archived=True).decode())))
+    assert [row["content"] for row in rows] == ["Looks good"]
@@ -0,0 +1,189 @@
+import threading
+import time
+import pytest
+import fakeredis
+from redis import Redis
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.services import job_service
+from app.services.job_service import (
+    DEAD_KEY,
+    QUEUE_KEY,
+    RUNNING_KEY,
+    Worker,
+    claim_job,
+    complete_job,
+    enqueue_job,
+    extend_job,
+    recover_stuck_jobs,
+    retry_delay,
+)
+
+
+@pytest.fixture
+def redis_client():
+    """Return a fake Redis instance for testing."""
+    return fakeredis.FakeRedis()
+
+
+@pytest.fixture
+def calls(monkeypatch) -> list[dict]:
+    """ A `record` job appending its kwargs, and a `boom` job always failing. """
+    calls: list[dict] = []
+
+    def boom(*, session, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setitem(job_service.JOBS, "record", lambda *, session, **kwargs: calls.append(kwargs))
+    monkeypatch.setitem(job_service.JOBS, "boom", boom)
+    return calls
+
+
+def worker(redis_client: Redis, **kwargs) -> Worker:
+    # The test jobs do not touch the database, an unbound session is enough
+    return Worker(redis=redis_client, session_factory=Session, **kwargs)
+
+
+# ---------- Enqueue tests -------------
+def test_enqueue_claim_complete(redis_client: Redis, calls: list[dict]):
+    job_id = enqueue_job(redis=redis_client, name="record", kwargs={"n": 1})
+
+    job = claim_job(redis=redis_client)
+    assert job.id == job_id
+    assert (job.name, job.kwargs, job.attempts) == ("record", {"n": 1}, 1)
+    assert claim_job(redis=redis_client) is None
+    assert complete_job(redis=redis_client, job=job)
+    assert redis_client.zcard(RUNNING_KEY) == 0
+    assert not redis_client.exists(f"jobs:job:{job_id}")
+
+
+def test_enqueue_unknown_job(redis_client: Redis):
+    with pytest.raises(ValueError):
+        enqueue_job(redis=redis_client, name="nope")
+
+
+def test_enqueue_is_idempotent_by_key(redis_client: Redis, calls: list[dict]):
+    first = enqueue_job(redis=redis_client, name="record", kwargs={"n": 1}, idempotency_key="k")
+    second = enqueue_job(redis=redis_client, name="record", kwargs={"n": 2}, idempotency_key="k")
+
+    assert first == second
+    assert worker(redis_client).drain() == 1
+    # Still deduped once the job is done, until the key expires
+    assert enqueue_job(redis=redis_client, name="record", idempotency_key="k") == first
+    assert calls == [{"n": 1}]
+    assert 0 < redis_client.ttl("jobs:idempotency:k") <= settings.JOB_IDEMPOTENCY_TTL_SECONDS
+
+
+def test_delayed_job_waits(redis_client: Redis, calls: list[dict]):
+    job_id = enqueue_job(redis=redis_client, name="record", delay_seconds=60)
+
+    assert claim_job(redis=redis_client) is None
+    assert redis_client.zscore(QUEUE_KEY, job_id) == pytest.approx(time.time() + 60, abs=5)
+
+
+# ---------- Retry tests -------------
+def test_retry_delay_backs_off_exponentially():
+    assert [retry_delay(attempt) for attempt in (1, 2, 3)] == [
+        settings.JOB_RETRY_BASE_DELAY_SECONDS * factor for factor in (1, 2, 4)]
+    assert retry_delay(100) == settings.JOB_RETRY_MAX_DELAY_SECONDS
+
+
+def test_failed_job_is_retried_later(redis_client: Redis, calls: list[dict]):
+    job_id = enqueue_job(redis=redis_client, name="boom")
+
+    assert worker(redis_client).drain() == 1
+    # Back in the queue after the first backoff, not before
+    assert claim_job(redis=redis_client) is None
+    assert redis_client.zscore(QUEUE_KEY, job_id) == pytest.approx(time.time() + retry_delay(1), abs=5)
+    assert redis_client.hget(f"jobs:job:{job_id}", "error") == b"RuntimeError('boom')"
+
+
+def test_failed_job_is_dead_after_max_attempts(redis_client: Redis, calls: list[dict], monkeypatch):
+    monkeypatch.setattr(settings, "JOB_RETRY_BASE_DELAY_SECONDS", 0)
+    job_id = enqueue_job(redis=redis_client, name="boom", max_attempts=3)
+
+    assert worker(redis_client).drain() == 3
+    assert redis_client.lrange(DEAD_KEY, 0, -1) == [job_id.encode()]
+    assert redis_client.zcard(QUEUE_KEY) == 0
+    assert redis_client.hget(f"jobs:job:{job_id}", "attempts") == b"3"
+
+
+# ---------- Visibility timeout tests -------------
+def test_stuck_job_is_recovered(redis_client: Redis, calls: list[dict]):
+    enqueue_job(redis=redis_client, name="record")
+    stuck = claim_job(redis=redis_client, visibility_timeout=0.01)
+    time.sleep(0.02)
+
+    assert recover_stuck_jobs(redis=redis_client) == 1
+    job = claim_job(redis=redis_client)
+    assert (job.id, job.attempts) == (stuck.id, 2)
+    # The first worker lost its claim
+    assert not complete_job(redis=redis_client, job=stuck)
+    assert not extend_job(redis=redis_client, job=stuck)
+    assert complete_job(redis=redis_client, job=job)
+
+
+def test_extended_job_is_not_recovered(redis_client: Redis, calls: list[dict]):
+    enqueue_job(redis=redis_client, name="record")
+    job = claim_job(redis=redis_client, visibility_timeout=0.01)
+
+    assert extend_job(redis=redis_client, job=job, visibility_timeout=60)
+    time.sleep(0.02)
+    assert recover_stuck_jobs(redis=redis_client) == 0
+
+
+def test_stuck_job_on_its_last_attempt_is_dead(redis_client: Redis, calls: list[dict]):
+    job_id = enqueue_job(redis=redis_client, name="record", max_attempts=1)
+    claim_job(redis=redis_client, visibility_timeout=0.01)
+    time.sleep(0.02)
+
+    assert recover_stuck_jobs(redis=redis_client) == 1
+    assert redis_client.lrange(DEAD_KEY, 0, -1) == [job_id.encode()]
+
+
+# ---------- Worker tests -------------
+def test_worker_runs_jobs_concurrently(redis_client: Redis, monkeypatch):
+    # Every job waits for the others, they only finish if all run at once
+    barrier = threading.Barrier(3, timeout=5)
+    done = threading.Semaphore(0)
+
+    def meet(*, session):
+        barrier.wait()
+        done.release()
+
+    monkeypatch.setitem(job_service.JOBS, "meet", meet)
+    for _ in range(3):
+        enqueue_job(redis=redis_client, name="meet")
+    stop = threading.Event()
+    thread = threading.Thread(target=worker(redis_client, concurrency=3, poll_interval=0.01).run, args=(stop,))
+    thread.start()
+    try:
+        assert all(done.acquire(timeout=5) for _ in range(3))
+    finally:
+        stop.set()
+        thread.join(timeout=5)
+    assert redis_client.zcard(QUEUE_KEY) == 0
+    assert redis_client.zcard(RUNNING_KEY) == 0
+
+
+def test_worker_keeps_running_while_redis_is_down(calls: list[dict]):
+    server = fakeredis.FakeServer()
+    redis_client = fakeredis.FakeRedis(server=server)
+    enqueue_job(redis=redis_client, name="record", kwargs={"n": 1})
+    server.connected = False
+    stop = threading.Event()
+    thread = threading.Thread(target=worker(redis_client, poll_interval=0.01).run, args=(stop,))
+    thread.start()
+    try:
+        time.sleep(0.2)
+        assert thread.is_alive()
+        server.connected = True
+        deadline = time.monotonic() + 5
+        while not calls and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        stop.set()
+        thread.join(timeout=5)
+    # Claimed once Redis was back
+    assert calls == [{"n": 1}]
@@ -0,0 +1,93 @@
+import pytest
+import uuid
+import fakeredis
+from redis import Redis
+from sqlmodel import Session
+
+from app.models.user import User
+from app.schemas.auth import UserUpdate
+from app.services.principal_service import (
+    local_principal_cache,
+    cache_principal,
+    get_cached_principal,
+    get_principal,
+    invalidate_principal,
+    load_principal,
+)
+from app.services.user_service import update_user, deactivate_user
+from app.tests.api.deps import *
+
+
+# --------- Deps ---------------
+@pytest.fixture
+def redis_client():
+    """Return a fake Redis instance for testing."""
+    local_principal_cache.clear()
+    yield fakeredis.FakeRedis()
+    local_principal_cache.clear()
+
+
+# ---------- Get principal service tests -------------
+def test_get_principal_loads_from_db_and_caches(session: Session, redis_client: Redis, user: User):
+    principal = get_principal(session=session, redis=redis_client, user_id=user.id)
+
+    assert principal.id == user.id
+    assert principal.email == user.email
+    assert redis_client.exists(f"principal:{user.id}")
+    assert local_principal_cache.get(user.id) == principal
+
+
+def test_get_principal_served_from_redis(session: Session, redis_client: Redis, user: User):
+    get_principal(session=session, redis=redis_client, user_id=user.id)
+    local_principal_cache.clear()
+    session.delete(user)
+    session.commit()
+
+    # Row is gone, so only the Redis tier can answer
+    principal = get_principal(session=session, redis=redis_client, user_id=user.id)
+    assert principal is not None
+    assert principal.full_name == user.full_name
+
+
+def test_get_principal_not_found(session: Session, redis_client: Redis):
+    principal = get_principal(session=session, redis=redis_client, user_id=uuid.uuid4())
+
+    assert principal is None
+
+
+def test_get_cached_principal_never_reads_the_database(session: Session, redis_client: Redis, user: User):
+    assert get_cached_principal(redis=redis_client, user_id=user.id) is None
+
+    cache_principal(redis=redis_client, principal=load_principal(session=session, user_id=user.id))
+    local_principal_cache.clear()
+
+    # Filled from Redis, the local cache answers the next call
+    principal = get_cached_principal(redis=redis_client, user_id=user.id)
+    assert principal.id == user.id
+    assert local_principal_cache.get(user.id) == principal
+
+
+# ---------- Invalidation tests -------------
+def test_invalidate_principal(session: Session, redis_client: Redis, user: User):
+    get_principal(session=session, redis=redis_client, user_id=user.id)
+    invalidate_principal(redis=redis_client, user_id=user.id)
+
+    assert not redis_client.exists(f"principal:{user.id}")
+    assert local_principal_cache.get(user.id) is None
+
+
+def test_update_user_invalidates_principal(session: Session, redis_client: Redis, user: User):
+    get_principal(session=session, redis=redis_client, user_id=user.id)
+    update_user(session=session, redis=redis_client, user=user,
+                user_update=UserUpdate(full_name="New Name"))
+
+    principal = get_principal(session=session, redis=redis_client, user_id=user.id)
+    assert principal.full_name == "New Name"
+
+
+def test_deactivate_user_invalidates_principal(session: Session, redis_client: Redis, user: User):
+    get_principal(session=session, redis=redis_client, user_id=user.id)
+    deactivate_user(session=session, redis=redis_client, user=user)
+
+    principal = get_principal(session=session, redis=redis_client, user_id=user.id)
+    assert principal.is_active is False
@@ -0,0 +1,76 @@
+import pytest
+from sqlmodel import Session, select
+
+from app.models.project import Project, ProjectMember, ProjectStatus
+from app.models.user import User
+from app.models.workspace import Workspace
+from app.schemas.project import ProjectResponse
+from app.services import project_service
+from app.tests.api.deps import *
+
+
+# --------- Deps ---------------
+@pytest.fixture
+def workspace(session: Session, user: User) -> Workspace:
+    workspace = Workspace(name="Team", slug="team", owner_id=user.id)
+    session.add(workspace)
+    session.commit()
+    return workspace
+
+
+def _add_projects(session: Session, workspace: Workspace, user: User, statuses: list[ProjectStatus]) -> None:
+    for index, project_status in enumerate(statuses):
+        project = Project(
+            name=f"Project {index}", status=project_status, owner_id=user.id, workspace_id=workspace.id)
+        session.add(project)
+        session.flush()
+        session.add(ProjectMember(project_id=project.id, user_id=user.id))
+    session.commit()
+
+
+# ---------- Project listing tests -------------
+@pytest.mark.parametrize("projects", [1, 5, 30])
+def test_list_projects_query_count_is_constant(
+    session: Session, user: User, workspace: Workspace, count_queries: list[str], projects: int
+):
+    _add_projects(session, workspace, user, [ProjectStatus.ACTIVE] * projects)
+    workspace_id, user_name = workspace.id, user.full_name
+    session.expunge_all()
+    count_queries.clear()
+
+    page, next_cursor = project_service.get_all_workspace_projects(
+        session=session, workspace_id=workspace_id, limit=100)
+    responses = [ProjectResponse.model_validate(project) for project in page]
+
+    # One query for the projects, one for their members
+    assert len(count_queries) == 2
+    assert len(responses) == projects
+    assert next_cursor is None
+    assert all([member.full_name for member in response.members] == [user_name] for response in responses)
+
+
+def test_list_projects_by_status(session: Session, user: User, workspace: Workspace):
+    _add_projects(session, workspace, user, [
+        ProjectStatus.ACTIVE, ProjectStatus.PLANNING, ProjectStatus.ACTIVE, ProjectStatus.ARCHIVED, ProjectStatus.ACTIVE,
+    ])
+
+    first, cursor = project_service.get_all_workspace_projects(
+        session=session, workspace_id=workspace.id, status=ProjectStatus.ACTIVE, limit=2)
+    rest, last_cursor = project_service.get_all_workspace_projects(
+        session=session, workspace_id=workspace.id, status=ProjectStatus.ACTIVE, limit=2, cursor=cursor)
+
+    assert [project.name for project in first + rest] == ["Project 0", "Project 2", "Project 4"]
+    assert last_cursor is None
+
+
+def test_project_details_load_members(session: Session, user: User, workspace: Workspace, count_queries: list[str]):
+    _add_projects(session, workspace, user, [ProjectStatus.PLANNING])
+    project_id, user_name = session.exec(select(Project.id)).one(), user.full_name
+    session.expunge_all()
+    count_queries.clear()
+
+    project = project_service.get_project_details_by_id(session=session, project_id=project_id)
+    response = ProjectResponse.model_validate(project)
+
+    assert len(count_queries) == 2
+    assert [member.full_name for member in response.members] == [user_name]
@@ -1,13 +1,16 @@
 import pytest
+import time
 import uuid
 import fakeredis
+from concurrent.futures import ThreadPoolExecutor
 from redis import Redis
-from datetime import timedelta
-from app.core.config import settings
 from app.services.redis_service import (
-    store_refresh_token_in_redis,
-    get_refresh_token_from_redis,
-    delete_refresh_token_from_Redis,
+    store_refresh_session,
+    rotate_refresh_token,
+    revoke_refresh_session,
+    revoke_all_refresh_sessions,
+    list_refresh_sessions,
+    refresh_rotation_stats,
 )
 
 
@@ -17,49 +20,158 @@ def redis_client():
     return fakeredis.FakeRedis()
 
 
-def test_store_refresh_token_in_redis(redis_client: Redis):
+@pytest.fixture
+def rotation_stats():
+    refresh_rotation_stats.update(
+        rotations=0, rejected=0, total_seconds=0.0, max_seconds=0.0)
+    return refresh_rotation_stats
+
+
+# ---------- Store / list refresh session tests -------------
+def test_store_refresh_session(redis_client: Redis):
     user_id = uuid.uuid4()
-    token = "sample_refresh_token"
 
-    store_refresh_token_in_redis(
-        redis=redis_client, user_id=user_id, token=token)
-    stored_value = redis_client.get(f"refresh_token:{user_id}")
-    assert stored_value is not None
-    assert stored_value.decode() == token
+    store_refresh_session(
+        redis=redis_client, user_id=user_id, session_id="s1", token="token", device="phone")
+    sessions = list_refresh_sessions(redis=redis_client, user_id=user_id)
+    assert len(sessions) == 1
+    assert sessions[0]["session_id"] == "s1"
+    assert sessions[0]["device"] == "phone"
 
 
-def test_get_refresh_token_in_redis(redis_client: Redis):
+def test_store_refresh_session_multiple_devices(redis_client: Redis):
     user_id = uuid.uuid4()
-    token = "sample_refresh_token"
 
-    redis_client.setex(f"refresh_token:{user_id}", timedelta(
-        days=settings.REFRESH_TOKEN_EXPIRE_DAYS), token)
-    saved_token = get_refresh_token_from_redis(
-        redis=redis_client, user_id=user_id)
-    assert saved_token == token
+    store_refresh_session(redis=redis_client, user_id=user_id, session_id="s1", token="t1")
+    store_refresh_session(redis=redis_client, user_id=user_id, session_id="s2", token="t2")
+    sessions = list_refresh_sessions(redis=redis_client, user_id=user_id)
+    assert {session["session_id"] for session in sessions} == {"s1", "s2"}
 
 
-def test_delete_refresh_token(redis_client):
+def test_store_refresh_session_expiry(redis_client: Redis):
     user_id = uuid.uuid4()
-    token = "sample_refresh_token"
-    # store first
-    store_refresh_token_in_redis(
-        redis=redis_client, user_id=user_id, token=token)
-    assert get_refresh_token_from_redis(
-        redis=redis_client, user_id=user_id) == token
-    # delete
-    delete_refresh_token_from_Redis(redis=redis_client, user_id=user_id)
-    assert get_refresh_token_from_redis(
-        redis=redis_client, user_id=user_id) is None
-
-
-def test_store_token_expiry(redis_client):
-    user_id = uuid.uuid4()
-    token = "sample_refresh_token"
-
-    store_refresh_token_in_redis(
-        redis=redis_client, user_id=user_id, token=token, expiry_days=2)
 
-    ttl = redis_client.ttl(f"refresh_token:{user_id}")
+    store_refresh_session(
+        redis=redis_client, user_id=user_id, session_id="s1", token="t1", expiry_days=2)
+    ttl = redis_client.ttl(f"refresh_sessions:{user_id}")
     # TTL should be roughly equal to 2 days in seconds (allowing a small margin)
     assert 172000 <= ttl <= 173000
+    assert redis_client.zscore(f"refresh_sessions_exp:{user_id}", "s1") > time.time()
+
+
+def test_store_refresh_session_prunes_expired(redis_client: Redis):
+    user_id = uuid.uuid4()
+    store_refresh_session(redis=redis_client, user_id=user_id, session_id="old", token="t1")
+    redis_client.zadd(f"refresh_sessions_exp:{user_id}", {"old": time.time() - 1})
+
+    store_refresh_session(redis=redis_client, user_id=user_id, session_id="new", token="t2")
+    assert not redis_client.hexists(f"refresh_sessions:{user_id}", "old")
+    assert [s["session_id"] for s in list_refresh_sessions(
+        redis=redis_client, user_id=user_id)] == ["new"]
+
+
+# ---------- Revoke session tests -------------
+def test_revoke_refresh_session(redis_client: Redis):
+    user_id = uuid.uuid4()
+    store_refresh_session(redis=redis_client, user_id=user_id, session_id="s1", token="t1")
+    store_refresh_session(redis=redis_client, user_id=user_id, session_id="s2", token="t2")
+
+    revoke_refresh_session(redis=redis_client, user_id=user_id, session_id="s1")
+    assert [s["session_id"] for s in list_refresh_sessions(
+        redis=redis_client, user_id=user_id)] == ["s2"]
+    assert rotate_refresh_token(
+        redis=redis_client, user_id=user_id, session_id="s1", old_token="t1", new_token="n") is False
+
+
+def test_revoke_all_refresh_sessions(redis_client: Redis):
+    user_id = uuid.uuid4()
+    store_refresh_session(redis=redis_client, user_id=user_id, session_id="s1", token="t1")
+    store_refresh_session(redis=redis_client, user_id=user_id, session_id="s2", token="t2")
+
+    revoke_all_refresh_sessions(redis=redis_client, user_id=user_id)
+    assert list_refresh_sessions(redis=redis_client, user_id=user_id) == []
+    assert rotate_refresh_token(
+        redis=redis_client, user_id=user_id, session_id="s2", old_token="t2", new_token="n") is False
+
+    # New logins after the revocation work again
+    store_refresh_session(redis=redis_client, user_id=user_id, session_id="s3", token="t3")
+    assert [s["session_id"] for s in list_refresh_sessions(
+        redis=redis_client, user_id=user_id)] == ["s3"]
+
+
+# ---------- Refresh token rotation tests -------------
+def test_rotate_refresh_token_success(redis_client: Redis, rotation_stats: dict):
+    user_id = uuid.uuid4()
+    store_refresh_session(redis=redis_client, user_id=user_id, session_id="s1", token="old")
+
+    rotated = rotate_refresh_token(
+        redis=redis_client, user_id=user_id, session_id="s1", old_token="old", new_token="new")
+    assert rotated is True
+    assert rotate_refresh_token(
+        redis=redis_client, user_id=user_id, session_id="s1", old_token="new", new_token="newer") is True
+    assert rotation_stats["rotations"] == 2
+
+
+def test_rotate_refresh_token_mismatch(redis_client: Redis, rotation_stats: dict):
+    user_id = uuid.uuid4()
+    store_refresh_session(redis=redis_client, user_id=user_id, session_id="s1", token="current")
+
+    rotated = rotate_refresh_token(
+        redis=redis_client, user_id=user_id, session_id="s1", old_token="stale", new_token="new")
+    assert rotated is False
+    assert rotate_refresh_token(
+        redis=redis_client, user_id=user_id, session_id="s1", old_token="current", new_token="new") is True
+    assert rotation_stats["rejected"] == 1
+
+
+def test_rotate_refresh_token_missing(redis_client: Redis):
+    rotated = rotate_refresh_token(
+        redis=redis_client, user_id=uuid.uuid4(), session_id="s1", old_token="old", new_token="new")
+    assert rotated is False
+
+
+def test_rotate_refresh_token_expired_session(redis_client: Redis):
+    user_id = uuid.uuid4()
+    store_refresh_session(redis=redis_client, user_id=user_id, session_id="s1", token="old")
+    redis_client.zadd(f"refresh_sessions_exp:{user_id}", {"s1": time.time() - 1})
+
+    rotated = rotate_refresh_token(
+        redis=redis_client, user_id=user_id, session_id="s1", old_token="old", new_token="new")
+    assert rotated is False
+
+
+def test_rotate_refresh_token_concurrent(redis_client: Redis, rotation_stats: dict):
+    user_id = uuid.uuid4()
+    store_refresh_session(redis=redis_client, user_id=user_id, session_id="s1", token="old")
+
+    def rotate(index: int) -> bool:
+        return rotate_refresh_token(
+            redis=redis_client, user_id=user_id, session_id="s1", old_token="old", new_token=f"new-{index}")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(rotate, range(20)))
+
+    assert results.count(True) == 1
+    winner = results.index(True)
+    assert rotate_refresh_token(
+        redis=redis_client, user_id=user_id, session_id="s1", old_token=f"new-{winner}", new_token="next")
+    assert rotation_stats["rejected"] == 19
+    assert rotation_stats["total_seconds"] >= rotation_stats["max_seconds"] > 0
+
+
+def test_rotate_refresh_token_single_round_trip(redis_client: Redis, monkeypatch: pytest.MonkeyPatch):
+    user_id = uuid.uuid4()
+    store_refresh_session(redis=redis_client, user_id=user_id, session_id="s1", token="a")
+    # First call loads the script into Redis
+    rotate_refresh_token(redis=redis_client, user_id=user_id, session_id="s1", old_token="a", new_token="b")
+
+    commands = []
+    execute_command = redis_client.execute_command
+
+    def counting_execute_command(*args, **kwargs):
+        commands.append(args[0])
+        return execute_command(*args, **kwargs)
+
+    monkeypatch.setattr(redis_client, "execute_command", counting_execute_command)
+    rotate_refresh_token(redis=redis_client, user_id=user_id, session_id="s1", old_token="b", new_token="c")
+    assert commands == ["EVALSHA"]
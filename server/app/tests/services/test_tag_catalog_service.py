@@ -0,0 +1,117 @@
+import time
+import pytest
+import fakeredis
+from redis import Redis
+from sqlmodel import Session
+
+from app.models.tag import Tag
+from app.services import tag_catalog_service
+from app.services.tag_catalog_service import get_tag_catalog, publish_tags_changed, reset_tag_catalog
+from app.services.tag_service import search_tags
+from app.tests.api.deps import *
+
+
+# --------- Deps ---------------
+@pytest.fixture
+def redis_client():
+    reset_tag_catalog()
+    yield fakeredis.FakeRedis()
+    reset_tag_catalog()
+
+
+@pytest.fixture
+def redis_down():
+    server = fakeredis.FakeServer()
+    server.connected = False
+    reset_tag_catalog()
+    yield fakeredis.FakeRedis(server=server)
+    reset_tag_catalog()
+
+
+@pytest.fixture
+def tag_names(session: Session) -> list[str]:
+    names = ["Backend", "back", "Feedback", "Backlog", "Callback", "frontend", "back_end", "backup", "Bug"]
+    session.add_all(Tag(name=name, color_hex="#ffffff") for name in names)
+    session.commit()
+    return names
+
+
+def _wait_for(condition) -> None:
+    deadline = time.monotonic() + 5
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+# ---------- Tag catalog tests -------------
+@pytest.mark.parametrize("query", ["back", "BACK", "k_e", "b", "bug", "nothing", "", None])
+def test_catalog_search_matches_database_search(session: Session, redis_client: Redis, tag_names: list[str], query):
+    catalog = get_tag_catalog(session=session, redis=redis_client)
+
+    expected, _ = search_tags(session=session, query=query, limit=100)
+    tags, next_cursor = catalog.search(query=query, limit=100)
+
+    assert [tag.name for tag in tags] == [tag.name for tag in expected]
+    assert next_cursor is None
+
+
+def test_catalog_search_cursor_pages_through_all_results(session: Session, redis_client: Redis, tag_names: list[str]):
+    catalog = get_tag_catalog(session=session, redis=redis_client)
+    expected, _ = catalog.search(query="back", limit=100)
+
+    names, cursor = [], None
+    while True:
+        tags, cursor = catalog.search(query="back", limit=2, cursor=cursor)
+        names += [tag.name for tag in tags]
+        if cursor is None:
+            break
+
+    assert names == [tag.name for tag in expected]
+
+
+def test_catalog_get_by_name_is_exact(session: Session, redis_client: Redis, tag_names: list[str]):
+    catalog = get_tag_catalog(session=session, redis=redis_client)
+
+    assert catalog.get_by_name("Backend").name == "Backend"
+    assert catalog.get_by_name("backend") is None
+
+
+def test_catalog_is_reused_until_a_change_is_published(session: Session, redis_client: Redis, tag_names: list[str]):
+    catalog = get_tag_catalog(session=session, redis=redis_client)
+    assert get_tag_catalog(session=session, redis=redis_client) is catalog
+
+    session.add(Tag(name="Design", color_hex="#ffffff"))
+    session.commit()
+    # Another worker created the tag and published the change
+    version = redis_client.incr(tag_catalog_service.TAGS_VERSION_KEY)
+    redis_client.publish(tag_catalog_service.TAGS_CHANGED_CHANNEL, version)
+    _wait_for(lambda: tag_catalog_service._latest_version == version)
+
+    reloaded = get_tag_catalog(session=session, redis=redis_client)
+    assert reloaded is not catalog
+    assert reloaded.get_by_name("Design") is not None
+
+
+def test_publish_tags_changed_drops_local_catalog(session: Session, redis_client: Redis, tag_names: list[str]):
+    catalog = get_tag_catalog(session=session, redis=redis_client)
+
+    publish_tags_changed(redis=redis_client)
+
+    assert get_tag_catalog(session=session, redis=redis_client) is not catalog
+    assert int(redis_client.get(tag_catalog_service.TAGS_VERSION_KEY)) == 1
+
+
+def test_catalog_is_reused_while_redis_is_down(
+    session: Session, redis_down: Redis, tag_names: list[str], count_queries: list[str], monkeypatch
+):
+    subscribes = []
+    pubsub = redis_down.pubsub
+    monkeypatch.setattr(redis_down, "pubsub", lambda **kwargs: subscribes.append(kwargs) or pubsub(**kwargs))
+
+    catalog = get_tag_catalog(session=session, redis=redis_down)
+    count_queries.clear()
+
+    assert catalog.version is None
+    assert all(get_tag_catalog(session=session, redis=redis_down) is catalog for _ in range(3))
+    # Neither the tags table nor Redis is hit again before the max age
+    assert not [statement for statement in count_queries if "FROM tags" in statement]
+    assert len(subscribes) == 1
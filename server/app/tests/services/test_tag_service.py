@@ -3,6 +3,8 @@ import uuid
 from sqlmodel import Session
 from sqlalchemy.exc import IntegrityError
 
+from app.exceptions.pagination import InvalidCursorException
+from app.models.tag import Tag
 from app.schemas.tag import TagCreate
 from app.services.tag_service import (
     create_new_tag,
@@ -77,12 +79,54 @@ def test_get_tag_by_name_tag_not_found(session: Session):
 
 
 def test_search_tags_success(session: Session, create_tag: dict[str, str]):
-    tags = search_tags(session=session, query=create_tag['name'])
+    tags, _ = search_tags(session=session, query=create_tag["name"])
 
     assert len(tags) > 0
 
 
 def test_search_tags_not_found(session: Session):
-    tags = search_tags(session=session, query="Not found")
+    tags, _ = search_tags(session=session, query="Not found")
 
     assert len(tags) == 0
+
+
+@pytest.fixture
+def search_tag_names(session: Session) -> list[str]:
+    names = ["Backend", "back", "Feedback", "Backlog", "Callback", "frontend", "back_end", "backup"]
+    session.add_all(Tag(name=name) for name in names)
+    session.commit()
+    return names
+
+
+def test_search_tags_ranks_exact_then_prefix_then_substring(session: Session, search_tag_names: list[str]):
+    tags, next_cursor = search_tags(session=session, query="BACK")
+
+    assert [tag.name for tag in tags] == [
+        "back", "back_end", "Backend", "Backlog", "backup", "Callback", "Feedback"]
+    assert next_cursor is None
+
+
+def test_search_tags_escapes_like_wildcards(session: Session, search_tag_names: list[str]):
+    tags, _ = search_tags(session=session, query="k_e")
+
+    assert [tag.name for tag in tags] == ["back_end"]
+
+
+@pytest.mark.parametrize("query", ["back", "", None])
+def test_search_tags_cursor_pages_through_all_results(session: Session, search_tag_names: list[str], query):
+    expected, _ = search_tags(session=session, query=query, limit=100)
+
+    names, cursor = [], None
+    while True:
+        tags, cursor = search_tags(session=session, query=query, limit=3, cursor=cursor)
+        names += [tag.name for tag in tags]
+        assert len(tags) <= 3
+        if cursor is None:
+            break
+
+    assert names == [tag.name for tag in expected]
+
+
+def test_search_tags_invalid_cursor(session: Session):
+    with pytest.raises(InvalidCursorException):
+        search_tags(session=session, query="back", cursor="not-a-cursor")
@@ -0,0 +1,221 @@
+import uuid
+import pytest
+from datetime import datetime, timezone
+from sqlalchemy import text
+from sqlmodel import Session, select
+
+from app.models.project import Project
+from app.models.task import Task, TaskPriority, TaskStatus
+from app.models.user import User
+from app.models.workspace import Workspace, WorkspaceMember
+from app.schemas.task import TaskBulkUpdate, TaskCreate
+from app.services import task_service
+from app.tests.api.deps import *
+
+
+# --------- Deps ---------------
+@pytest.fixture
+def project_id(session: Session, user: User) -> uuid.UUID:
+    workspace = Workspace(name="Team", slug="team", owner_id=user.id)
+    session.add(workspace)
+    session.flush()
+    project = Project(name="App", owner_id=user.id, workspace_id=workspace.id)
+    session.add(project)
+    session.commit()
+    return project.id
+
+
+# ---------- Bulk create tests -------------
+def test_bulk_create_in_one_insert(session: Session, user: User, project_id: uuid.UUID, count_queries: list[str]):
+    user_id = user.id
+    tasks = [TaskCreate(title=f"Task {index}", project_id=project_id) for index in range(200)]
+    tasks.insert(3, TaskCreate(title="Lost", project_id=uuid.uuid4()))
+    count_queries.clear()
+
+    results, project_ids = task_service.bulk_create_tasks(session=session, tasks=tasks, owner_id=user_id)
+
+    # One project lookup, one INSERT
+    assert len([statement for statement in count_queries if statement.startswith("INSERT")]) == 1
+    assert len(count_queries) == 2
+    assert project_ids == {project_id}
+    assert [result.result for result in results].count("created") == 200
+    assert results[3].result == "not_found"
+    stored = session.exec(select(Task).where(Task.owner_id == user_id)).all()
+    assert {task.id for task in stored} == {result.id for result in results if result.id}
+    assert all(task.status == TaskStatus.DRAFT and task.created_at for task in stored)
+
+
+def test_bulk_create_skips_projects_of_others(session: Session, user: User, other_user: User):
+    workspace = Workspace(name="Private", slug="private", owner_id=other_user.id)
+    project = Project(name="Secret", owner_id=other_user.id, workspace_id=workspace.id)
+    session.add_all([workspace, project])
+    session.commit()
+
+    results, project_ids = task_service.bulk_create_tasks(
+        session=session, tasks=[TaskCreate(title="Sneaky", project_id=project.id)], owner_id=user.id)
+
+    assert [result.result for result in results] == ["not_found"]
+    assert project_ids == set()
+    assert session.exec(select(Task)).all() == []
+
+
+# ---------- Bulk update tests -------------
+def test_bulk_update_groups_same_changes(session: Session, user: User, count_queries: list[str]):
+    user_id = user.id
+    tasks = [Task(title=f"Task {index}", owner_id=user_id) for index in range(6)]
+    other = Task(title="Not mine", owner_id=uuid.uuid4())
+    session.add_all([*tasks, other])
+    session.commit()
+    ids = [task.id for task in tasks]
+    other_id = other.id
+    count_queries.clear()
+
+    results, _ = task_service.bulk_update_tasks(session=session, owner_id=user_id, tasks=[
+        *(TaskBulkUpdate(id=task_id, priority=TaskPriority.URGENT) for task_id in ids[:3]),
+        *(TaskBulkUpdate(id=task_id, status=TaskStatus.DONE) for task_id in ids[3:5]),
+        TaskBulkUpdate(id=ids[5], is_archived=True),
+        TaskBulkUpdate(id=other_id, is_archived=True),
+        TaskBulkUpdate(id=uuid.uuid4(), priority=TaskPriority.LOW),
+    ])
+
+    # One UPDATE per distinct change
+    assert len([statement for statement in count_queries if statement.startswith("UPDATE")]) == 4
+    assert [result.result for result in results] == ["updated"] * 6 + ["not_found"] * 2
+    session.expire_all()
+    stored = {task.id: task for task in session.exec(select(Task)).all()}
+    assert all(stored[task_id].priority == TaskPriority.URGENT for task_id in ids[:3])
+    assert all(stored[task_id].status == TaskStatus.DONE and stored[task_id].completed_at for task_id in ids[3:5])
+    assert stored[ids[5]].is_archived
+    assert not stored[other_id].is_archived
+
+
+def test_bulk_update_keeps_completed_time(session: Session, user: User):
+    done_at = datetime(2026, 1, 5, 9, 30, tzinfo=timezone.utc)
+    done = Task(title="Shipped", status=TaskStatus.DONE, completed_at=done_at, owner_id=user.id)
+    todo = Task(title="Open", owner_id=user.id)
+    session.add_all([done, todo])
+    session.commit()
+    done_id, todo_id = done.id, todo.id
+
+    task_service.bulk_update_tasks(session=session, owner_id=user.id, tasks=[
+        TaskBulkUpdate(id=task_id, status=TaskStatus.DONE) for task_id in (done_id, todo_id)
+    ])
+
+    session.expire_all()
+    # Only the task that changed is stamped
+    assert session.get(Task, done_id).completed_at == done_at
+    assert session.get(Task, todo_id).completed_at > done_at
+
+
+def test_bulk_update_keeps_archive_countdown(session: Session, user: User):
+    archived_at = datetime(2026, 1, 5, 9, 30, tzinfo=timezone.utc)
+    task = Task(title="Old", is_archived=True, archived_at=archived_at, owner_id=user.id)
+    session.add(task)
+    session.commit()
+    task_id = task.id
+
+    task_service.bulk_update_tasks(session=session, owner_id=user.id, tasks=[TaskBulkUpdate(id=task_id, is_archived=True)])
+
+    session.expire_all()
+    assert session.get(Task, task_id).archived_at == archived_at
+
+
+# ---------- Search tests -------------
+@pytest.fixture
+def searchable(session: Session, user: User) -> dict[str, uuid.UUID]:
+    tasks = {
+        "title": Task(title="Fix login redirect", description="Users land on a blank page", owner_id=user.id),
+        "description": Task(title="Write docs", description="Explain the login flow",
+                            priority=TaskPriority.HIGH, owner_id=user.id),
+        "done": Task(title="Login audit", status=TaskStatus.DONE, owner_id=user.id),
+        "unrelated": Task(title="Plan sprint", description="Pick the next stories", owner_id=user.id),
+    }
+    session.add_all(tasks.values())
+    session.commit()
+    return {key: task.id for key, task in tasks.items()}
+
+
+def test_search_ranks_title_matches_first(session: Session, user: User, searchable: dict[str, uuid.UUID]):
+    tasks, cursor = task_service.search_tasks(session=session, query="logins", user_id=user.id)
+
+    # Stemmed, "logins" finds "login"
+    assert cursor is None
+    assert {task.id for task in tasks} == {searchable["title"], searchable["description"], searchable["done"]}
+    assert tasks[-1].id == searchable["description"]
+
+
+def test_search_filters(session: Session, user: User, searchable: dict[str, uuid.UUID]):
+    def ids(**filters) -> set[uuid.UUID]:
+        return {task.id for task in task_service.search_tasks(session=session, query="login", user_id=user.id, **filters)[0]}
+
+    assert ids(status=TaskStatus.DONE) == {searchable["done"]}
+    assert ids(priority=TaskPriority.HIGH) == {searchable["description"]}
+    assert ids(owner_id=uuid.uuid4()) == set()
+    assert len(ids(owner_id=user.id)) == 3
+
+
+def test_search_only_finds_visible_tasks(session: Session, user: User, other_user: User):
+    workspace = Workspace(name="Private", slug="private", owner_id=other_user.id)
+    project = Project(name="Deals", owner_id=other_user.id, workspace_id=workspace.id)
+    session.add_all([workspace, project])
+    session.flush()
+    private = Task(title="Secret merger plan", owner_id=other_user.id)
+    shared = Task(title="Merger checklist", owner_id=other_user.id, project_id=project.id)
+    session.add_all([private, shared])
+    session.commit()
+
+    def ids(**filters) -> set[uuid.UUID]:
+        return {task.id for task in task_service.search_tasks(session=session, query="merger", user_id=user.id, **filters)[0]}
+
+    assert ids() == set()
+    session.add(WorkspaceMember(workspace_id=workspace.id, user_id=user.id))
+    session.commit()
+    # The workspace's tasks, not the other user's own ones, even when filtering on them
+    assert ids() == {shared.id}
+    assert ids(owner_id=other_user.id) == {shared.id}
+
+
+def test_search_pages_by_rank_then_id(session: Session, user: User):
+    # Same rank for all of them, the id breaks the tie
+    session.add_all(Task(title=f"Release {index}", owner_id=user.id) for index in range(7))
+    session.commit()
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        tasks, cursor = task_service.search_tasks(session=session, query="release", user_id=user.id, limit=3, cursor=cursor)
+        seen += [task.id for task in tasks]
+        pages += 1
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert len(seen) == len(set(seen)) == 7
+    assert seen == sorted(seen)
+
+
+def test_search_follows_edits_and_deletes(session: Session, user: User, searchable: dict[str, uuid.UUID]):
+    task = session.get(Task, searchable["unrelated"])
+    task.title = "Login metrics"
+    session.delete(session.get(Task, searchable["done"]))
+    session.commit()
+
+    ids = {task.id for task in task_service.search_tasks(session=session, query="login", user_id=user.id)[0]}
+
+    assert ids == {searchable["title"], searchable["description"], searchable["unrelated"]}
+
+
+def test_search_survives_renumbered_rowids(session: Session, user: User, searchable: dict[str, uuid.UUID]):
+    # tasks has no INTEGER PRIMARY KEY, VACUUM or a table rebuild may renumber its implicit rowid
+    session.exec(text("UPDATE tasks SET rowid = rowid + 100"))
+    session.commit()
+
+    ids = {task.id for task in task_service.search_tasks(session=session, query="login", user_id=user.id)[0]}
+
+    assert ids == {searchable["title"], searchable["description"], searchable["done"]}
+
+
+@pytest.mark.parametrize("query", ['login OR "', "title:login", "login*", "--", "NEAR(login"])
+def test_search_input_is_not_query_syntax(session: Session, user: User, searchable: dict[str, uuid.UUID], query: str):
+    tasks, _ = task_service.search_tasks(session=session, query=query, user_id=user.id)
+
+    assert {task.id for task in tasks} <= set(searchable.values())
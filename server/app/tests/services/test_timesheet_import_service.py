@@ -0,0 +1,77 @@
+import io
+import uuid
+import pytest
+from datetime import datetime, timedelta
+from sqlmodel import Session, select
+
+from app.exceptions.timesheet import TimesheetImportException
+from app.models.task import Task
+from app.models.timesheet import Timesheet, TimesheetRollup
+from app.models.user import User
+from app.services.timesheet_import_service import _parse_work_date, import_timesheets
+from app.tests.api.deps import *
+
+HEADER = "user_email,task_id,work_date,hours,description\n"
+
+
+# --------- Deps ---------------
+@pytest.fixture
+def task_id(session: Session, user: User) -> uuid.UUID:
+    task = Task(title="Migrated", owner_id=user.id)
+    session.add(task)
+    session.commit()
+    return task.id
+
+
+# ---------- Import tests -------------
+def test_import_valid_and_invalid_lines(session: Session, user: User, task_id: uuid.UUID):
+    email = user.email
+    csv = io.StringIO(HEADER + "".join([
+        f"{email},{task_id},2026-10-12T09:00:00,2,Design\n",
+        f"{email},{task_id},2026-10-13,1.5,Review\n",
+        f"nobody@projex.com,{task_id},2026-10-13,1,Ghost\n",
+        f"{email},{uuid.uuid4()},2026-10-13,1,Lost task\n",
+        f"{email},{task_id},2026-10-13,0,No hours\n",
+        f"{email},{task_id},yesterday,1,Bad date\n",
+        f"{email},{task_id},2026-10-20T08:00:00+02:00,4,Next week\n",
+    ]))
+
+    report = import_timesheets(session=session, lines=csv, chunk_size=3)
+
+    assert (report.imported, report.rejected) == (3, 4)
+    assert [error.line for error in report.errors] == [4, 5, 6, 7]
+    assert len(session.exec(select(Timesheet)).all()) == 3
+    rollups = {(rollup.week_start.isoformat(), rollup.hours) for rollup in session.exec(select(TimesheetRollup)).all()}
+    assert rollups == {("2026-10-12", 3.5), ("2026-10-19", 4)}
+    assert session.get(Task, task_id).actual_hours == 7.5
+
+
+def test_import_stores_work_dates_in_utc(session: Session, user: User, task_id: uuid.UUID):
+    # Sunday evening in New York is Monday in UTC, the next week. Converted while
+    # parsing, COPY (Postgres) would drop the offset
+    assert _parse_work_date("2026-10-18T23:30:00-05:00").utcoffset() == timedelta(0)
+    csv = io.StringIO(HEADER + f"{user.email},{task_id},2026-10-18T23:30:00-05:00,2,Late\n")
+
+    assert import_timesheets(session=session, lines=csv).imported == 1
+
+    timesheet = session.exec(select(Timesheet)).one()
+    assert timesheet.work_date.replace(tzinfo=None) == datetime(2026, 10, 19, 4, 30)
+    assert session.exec(select(TimesheetRollup.week_start)).one().isoformat() == "2026-10-19"
+
+
+def test_import_looks_up_each_chunk_once(session: Session, user: User, task_id: uuid.UUID, count_queries: list[str]):
+    email = user.email
+    csv = io.StringIO(HEADER + "".join(f"{email},{task_id},2026-10-12,1,Line {index}\n" for index in range(10)))
+    count_queries.clear()
+
+    report = import_timesheets(session=session, lines=csv, chunk_size=5)
+
+    assert report.imported == 10
+    assert len([statement for statement in count_queries if "FROM users" in statement]) == 2
+    assert len([statement for statement in count_queries if "FROM tasks" in statement]) == 2
+    assert len([statement for statement in count_queries if statement.startswith("INSERT INTO timesheets ")]) == 2
+
+
+def test_import_missing_columns(session: Session):
+    with pytest.raises(TimesheetImportException):
+        import_timesheets(session=session, lines=io.StringIO("user_email,hours\n"))
@@ -0,0 +1,43 @@
+import pytest
+from datetime import date
+from sqlmodel import Session
+
+from app.services.timesheet_partition_service import (
+    MonthPartition,
+    create_timesheet_partitions,
+    detach_timesheet_partitions,
+    month_partition,
+    month_start,
+)
+from app.tests.api.deps import *
+
+
+# ---------- Month tests -------------
+@pytest.mark.parametrize("day, months, expected", [
+    (date(2026, 10, 18), 0, date(2026, 10, 1)),
+    (date(2026, 10, 18), 3, date(2027, 1, 1)),
+    (date(2026, 1, 31), -1, date(2025, 12, 1)),
+    (date(2026, 12, 1), 13, date(2028, 1, 1)),
+    (date(2026, 3, 15), -15, date(2024, 12, 1)),
+])
+def test_month_start(day: date, months: int, expected: date):
+    assert month_start(day, months) == expected
+
+
+def test_month_partition_bounds_and_name():
+    assert month_partition(date(2026, 12, 31)) == MonthPartition(
+        "timesheets_y2026m12", date(2026, 12, 1), date(2027, 1, 1))
+    assert month_partition(date(2027, 2, 1)).name == "timesheets_y2027m02"
+
+
+def test_consecutive_partitions_cover_every_day():
+    partitions = [month_partition(month_start(date(2026, 1, 1), offset)) for offset in range(24)]
+
+    assert all(current.end == following.start for current, following in zip(partitions, partitions[1:]))
+
+
+# ---------- Maintenance tests -------------
+def test_maintenance_is_a_no_op_without_partitioning(session: Session):
+    """ SQLite (and an unmigrated Postgres) keep timesheets as a plain table. """
+    assert create_timesheet_partitions(session=session, months_ahead=3) == []
+    assert detach_timesheet_partitions(session=session, retain_months=1) == []
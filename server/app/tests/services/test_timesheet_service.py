@@ -0,0 +1,134 @@
+import random
+import uuid
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from sqlalchemy import func
+from sqlmodel import Session, delete, select
+
+from app.models.task import Task
+from app.models.timesheet import Timesheet, TimesheetRollup
+from app.models.user import User
+from app.schemas.auth import UserCreate
+from app.schemas.timesheet import TimesheetCreate, TimesheetUpdate
+from app.services import timesheet_service
+from app.services.user_service import create_new_user
+from app.tests.api.deps import *
+
+
+# --------- Deps ---------------
+@pytest.fixture
+def user_id(session: Session, user_data: dict[str, str]) -> uuid.UUID:
+    return create_new_user(
+        session=session, user_create=UserCreate(**user_data), hashed_password="hashed").id
+
+
+@pytest.fixture
+def task_ids(session: Session, user_id: uuid.UUID) -> list[uuid.UUID]:
+    tasks = [Task(title=f"Task {index}", owner_id=user_id) for index in range(3)]
+    session.add_all(tasks)
+    session.commit()
+    return [task.id for task in tasks]
+
+
+def _raw_rollups(session: Session) -> dict[tuple, tuple[float, int]]:
+    """ Rollups summed straight from the timesheets. """
+    sums: dict[tuple, list] = {}
+    for timesheet in session.exec(select(Timesheet)).all():
+        key = (timesheet.user_id, timesheet.task_id, timesheet_service.week_start(timesheet.work_date))
+        hours, entries = sums.get(key, (0.0, 0))
+        sums[key] = (hours + timesheet.hours, entries + 1)
+    return {key: (pytest.approx(hours), entries) for key, (hours, entries) in sums.items()}
+
+
+def _stored_rollups(session: Session) -> dict[tuple, tuple[float, int]]:
+    return {
+        (rollup.user_id, rollup.task_id, rollup.week_start): (rollup.hours, rollup.entries)
+        for rollup in session.exec(select(TimesheetRollup)).all()
+    }
+
+
+def _task_hours(session: Session) -> dict[uuid.UUID, float]:
+    raw = dict(session.exec(select(Timesheet.task_id, func.sum(Timesheet.hours)).group_by(Timesheet.task_id)).all())
+    stored = {task.id: task.actual_hours or 0 for task in session.exec(select(Task)).all()}
+    return {task_id: (stored[task_id], pytest.approx(raw.get(task_id, 0))) for task_id in stored}
+
+
+# ---------- Week tests -------------
+@pytest.mark.parametrize("day, monday", [
+    (date(2026, 10, 12), date(2026, 10, 12)),
+    (date(2026, 10, 18), date(2026, 10, 12)),
+    (datetime(2027, 1, 1, 23, 30), date(2026, 12, 28)),
+    (datetime(2026, 10, 19, 1, 0, tzinfo=timezone(timedelta(hours=3))), date(2026, 10, 12)),
+])
+def test_week_start(day, monday):
+    assert timesheet_service.week_start(day) == monday
+
+
+# ---------- Incremental rollup tests -------------
+def test_rollups_follow_inserts_edits_and_deletes(session: Session, user_id: uuid.UUID, task_ids: list[uuid.UUID]):
+    rng = random.Random(7)
+    start = datetime(2026, 9, 1, 9, tzinfo=timezone.utc)
+    timesheet_ids = []
+    for index in range(40):
+        timesheet = timesheet_service.create_timesheet(session=session, user_id=user_id, timesheet_create=TimesheetCreate(
+            task_id=rng.choice(task_ids), description=f"Work {index}",
+            hours=rng.choice([0.25, 0.5, 1.5, 3, 7.75]), work_date=start + timedelta(days=rng.randrange(30))))
+        timesheet_ids.append(timesheet.id)
+    for timesheet_id in rng.sample(timesheet_ids, 15):
+        timesheet_service.update_timesheet(session=session, user_id=user_id, timesheet_id=timesheet_id,
+                                           timesheet_update=TimesheetUpdate(
+                                               hours=rng.choice([1, 2.5]), task_id=rng.choice(task_ids),
+                                               work_date=start + timedelta(days=rng.randrange(30))))
+    for timesheet_id in rng.sample(timesheet_ids, 10):
+        timesheet_service.delete_timesheet(session=session, user_id=user_id, timesheet_id=timesheet_id)
+
+    assert _stored_rollups(session) == _raw_rollups(session)
+    assert all(stored == raw for stored, raw in _task_hours(session).values())
+
+
+def test_last_timesheet_removes_rollup(session: Session, user_id: uuid.UUID, task_ids: list[uuid.UUID]):
+    timesheet = timesheet_service.create_timesheet(session=session, user_id=user_id, timesheet_create=TimesheetCreate(
+        task_id=task_ids[0], description="Work", hours=2))
+    assert len(_stored_rollups(session)) == 1
+
+    assert timesheet_service.delete_timesheet(session=session, user_id=user_id, timesheet_id=timesheet.id)
+
+    assert _stored_rollups(session) == {}
+    assert session.get(Task, task_ids[0]).actual_hours == 0
+
+
+def test_other_users_timesheet_is_not_found(session: Session, user_id: uuid.UUID, task_ids: list[uuid.UUID]):
+    timesheet = timesheet_service.create_timesheet(session=session, user_id=user_id, timesheet_create=TimesheetCreate(
+        task_id=task_ids[0], description="Work", hours=2))
+
+    assert not timesheet_service.delete_timesheet(session=session, user_id=uuid.uuid4(), timesheet_id=timesheet.id)
+    assert timesheet_service.update_timesheet(
+        session=session, user_id=uuid.uuid4(), timesheet_id=timesheet.id,
+        timesheet_update=TimesheetUpdate(hours=1)) is None
+
+
+# ---------- Rebuild tests -------------
+def test_rebuild_matches_raw_sums(session: Session, user_id: uuid.UUID, task_ids: list[uuid.UUID]):
+    other_ids = [
+        create_new_user(session=session, user_create=UserCreate(
+            full_name=f"User {index}", email=f"user{index}@projex.com", password="password"),
+            hashed_password="hashed").id
+        for index in range(4)
+    ]
+    rng = random.Random(3)
+    # Written around the service, so the rollups know nothing about them
+    session.add_all(
+        Timesheet(description="Imported", hours=rng.choice([0.5, 1, 4]), user_id=rng.choice([user_id, *other_ids]),
+                  task_id=rng.choice(task_ids), work_date=datetime(2026, 1, 1, 8, 15, tzinfo=timezone.utc) + timedelta(days=rng.randrange(60)))
+        for _ in range(100)
+    )
+    session.exec(delete(TimesheetRollup))
+    session.add(TimesheetRollup(user_id=user_id, task_id=task_ids[0], week_start=date(2020, 1, 6), hours=5, entries=1))
+    session.commit()
+
+    written = timesheet_service.rebuild_timesheet_rollups(session=session, batch_size=2)
+
+    session.expire_all()
+    assert _stored_rollups(session) == _raw_rollups(session)
+    assert written == len(_raw_rollups(session))
+    assert all(stored == raw for stored, raw in _task_hours(session).values())
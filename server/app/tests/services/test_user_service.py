@@ -4,6 +4,7 @@ from sqlalchemy.exc import IntegrityError
 from app.schemas.auth import UserCreate
 from app.services.user_service import (
     get_user_by_email,
+    get_user_by_email_detached,
     create_new_user,
     authenticate_user
 )
@@ -44,6 +45,18 @@ def test_get_user_by_email_not_found(session: Session):
     assert user is None
 
 
+def test_get_user_by_email_detached_keeps_the_session(session: Session, user_data: dict[str, str]):
+    created_user = create_new_user(session=session, user_create=UserCreate(**user_data))
+
+    user = get_user_by_email_detached(session=session, email=user_data["email"])
+    assert user is not None
+    assert user.email == created_user.email
+    assert user not in session
+    # The connection went back to the pool, the session still serves the request
+    assert not session.in_transaction()
+    assert get_user_by_email(session=session, email=user_data["email"]) is not None
+
+
 # ---------- Authenticate user service tests -------------
 def test_authenticate_user_success(session: Session, user_data: dict[str, str]):
     user_create = UserCreate(**user_data)
@@ -0,0 +1,113 @@
+import uuid
+import pytest
+from datetime import datetime, timezone
+from sqlalchemy import func, select as sa_select
+from sqlmodel import Session, select
+
+from app.models.archive import comments_archive, tasks_archive
+from app.models.comment import Comment
+from app.models.project import Project, ProjectMember
+from app.models.tag import Tag, TaskTag
+from app.models.task import Task
+from app.models.timesheet import Timesheet
+from app.models.user import User
+from app.models.workspace import Workspace, WorkspaceInvitation, WorkspaceMember
+from app.services import archive_service, workspace_service
+from app.services.workspace_purge_service import purge_deleted_workspaces, purge_workspace
+from app.tests.api.deps import *
+
+
+# --------- Deps ---------------
+def fill_workspace(session: Session, user: User, name: str) -> uuid.UUID:
+    """ Two projects with members, five tasks with comments, timesheets and tags, one archived task, an invitation. """
+    workspace = Workspace(name=name, slug=name.lower(), owner_id=user.id)
+    projects = [Project(name=f"{name} {index}", owner_id=user.id, workspace_id=workspace.id) for index in range(2)]
+    tag = Tag(name=f"{name} tag")
+    session.add_all([workspace, *projects, tag])
+    session.flush()
+    session.add(WorkspaceMember(workspace_id=workspace.id, user_id=user.id))
+    session.add(WorkspaceInvitation(workspace_id=workspace.id, inviter_id=user.id, invitee_id=user.id))
+    for project in projects:
+        session.add(ProjectMember(project_id=project.id, user_id=user.id))
+    tasks = [Task(title=f"Task {index}", owner_id=user.id, project_id=projects[index % 2].id) for index in range(5)]
+    session.add_all(tasks)
+    session.flush()
+    for task in tasks:
+        session.add(Comment(content="Noted", author_id=user.id, task_id=task.id))
+        session.add(Timesheet(description="Work", hours=1, user_id=user.id, task_id=task.id))
+        session.add(TaskTag(task_id=task.id, tag_id=tag.id))
+    tasks[0].is_archived = True
+    tasks[0].archived_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    session.commit()
+    archive_service.archive_tasks(session=session, older_than_days=30)
+    return workspace.id
+
+
+def count(session: Session, table) -> int:
+    return session.execute(sa_select(func.count()).select_from(table)).scalar_one()
+
+
+# ---------- Delete tests -------------
+def test_deleted_workspace_is_hidden(session: Session, user: User):
+    workspace_id = fill_workspace(session, user, "Gone")
+
+    assert workspace_service.delete_workspace_service(session=session, workspace_id=workspace_id)
+
+    assert workspace_service.get_workspace_service(session=session, workspace_id=workspace_id) is None
+    workspaces, _ = workspace_service.get_user_workspaces(session=session, user_id=user.id)
+    assert workspace_id not in {workspace.id for workspace in workspaces}
+    assert not workspace_service.check_workspace_exists_for_user(session=session, user_id=user.id, workspace_name="Gone")
+    # Deleting again finds nothing
+    assert not workspace_service.delete_workspace_service(session=session, workspace_id=workspace_id)
+
+
+# ---------- Purge tests -------------
+def test_purge_removes_workspace_rows_in_batches(session: Session, user: User):
+    workspace_id = fill_workspace(session, user, "Gone")
+    kept_id = fill_workspace(session, user, "Kept")
+    workspace_service.delete_workspace_service(session=session, workspace_id=workspace_id)
+    batches = []
+
+    progress = purge_workspace(session=session, workspace_id=workspace_id, batch_size=2,
+                               on_progress=lambda table, deleted: batches.append((table, deleted)))
+
+    # Timesheets added through the session have no rollups (timesheet_service writes those)
+    assert progress == {
+        "comments": 4, "timesheets": 4, "timesheet_rollups": 0, "task_tags": 4, "tasks": 4,
+        "comments_archive": 1, "timesheets_archive": 1, "timesheet_rollups_archive": 0,
+        "task_tags_archive": 1, "tasks_archive": 1,
+        "project_members": 2, "projects": 2, "workspace_members": 1, "workspace_invitations": 1, "workspaces": 1,
+    }
+    # Never more than a batch of tasks or projects at a time
+    assert [deleted for table, deleted in batches if table == "tasks"] == [2, 2]
+    assert session.get(Workspace, workspace_id) is None
+    # The other workspace is untouched
+    assert count(session, Task) == 4
+    assert count(session, tasks_archive) == 1
+    assert count(session, comments_archive) == 1
+    assert session.exec(select(Project.workspace_id).distinct()).all() == [kept_id]
+
+
+def test_purge_ignores_live_workspace(session: Session, user: User):
+    workspace_id = fill_workspace(session, user, "Live")
+
+    assert purge_workspace(session=session, workspace_id=workspace_id) == {}
+    assert count(session, Task) == 4
+
+
+def test_interrupted_purge_resumes(session: Session, user: User):
+    workspace_id = fill_workspace(session, user, "Gone")
+    workspace_service.delete_workspace_service(session=session, workspace_id=workspace_id)
+
+    def crash(table: str, deleted: int):
+        raise RuntimeError("worker killed")
+
+    with pytest.raises(RuntimeError):
+        purge_workspace(session=session, workspace_id=workspace_id, batch_size=2, on_progress=crash)
+    # The first batch is committed, the workspace is still marked for purge
+    assert count(session, Task) == 2
+
+    assert purge_deleted_workspaces(session=session, batch_size=2) == 1
+    assert session.get(Workspace, workspace_id) is None
+    assert count(session, Task) == 0
+    assert count(session, Project) == 0
@@ -0,0 +1,94 @@
+import pytest
+from sqlmodel import Session, select
+
+from app.models.user import User
+from app.models.workspace import Workspace, WorkspaceMember, WorkspaceRole
+from app.schemas.workspace import WorkspaceCreate, WorkspaceResponse
+from app.services import workspace_service
+from app.utils.workspace_slug import generate_unique_workspace_slug
+from app.tests.api.deps import *
+
+
+# --------- Deps ---------------
+@pytest.fixture
+def racing_slug(monkeypatch, session: Session, user: User):
+    """ A concurrent request commits a workspace with the slug we just picked. """
+    calls = []
+
+    def generate(*, session: Session, base_name: str) -> str:
+        slug = generate_unique_workspace_slug(session=session, base_name=base_name)
+        if not calls:
+            session.add(Workspace(name=base_name, slug=slug, owner_id=user.id))
+            session.commit()
+        calls.append(slug)
+        return slug
+
+    monkeypatch.setattr(workspace_service, "generate_unique_workspace_slug", generate)
+    return calls
+
+
+# ---------- Slug race tests -------------
+def test_create_workspace_retries_taken_slug(session: Session, user: User, racing_slug: list[str]):
+    workspace = workspace_service.create_workspace_service(
+        session=session, workspace_create=WorkspaceCreate(name="Team"), user_id=user.id)
+
+    assert racing_slug == ["team", "team-1"]
+    assert workspace.slug == "team-1"
+    assert sorted(session.exec(select(Workspace.slug)).all()) == ["team", "team-1"]
+
+
+def test_update_workspace_retries_taken_slug(session: Session, user: User, racing_slug: list[str]):
+    workspace = Workspace(name="Old", slug="old", owner_id=user.id)
+    session.add(workspace)
+    session.commit()
+
+    updated = workspace_service.update_workspace_service(
+        session=session, workspace_id=workspace.id,
+        workspace_update=WorkspaceCreate(name="Team", description="Renamed"), user_id=user.id)
+
+    assert updated.slug == "team-1"
+    assert updated.name == "Team"
+    assert updated.description == "Renamed"
+
+
+# ---------- Workspace listing tests -------------
+@pytest.mark.parametrize("owned, member_of", [(1, 0), (3, 4), (10, 25)])
+def test_get_user_workspaces_query_count_is_constant(
+    session: Session, user: User, other_user: User, count_queries: list[str], owned: int, member_of: int
+):
+    for index in range(owned):
+        session.add(Workspace(name=f"Owned {index}", slug=f"owned-{index}", owner_id=user.id))
+    for index in range(member_of):
+        workspace = Workspace(name=f"Shared {index}", slug=f"shared-{index}", owner_id=other_user.id)
+        session.add(workspace)
+        session.add(WorkspaceMember(workspace_id=workspace.id, user_id=user.id, role=WorkspaceRole.VIEWER))
+        session.add(WorkspaceMember(workspace_id=workspace.id, user_id=other_user.id, role=WorkspaceRole.ADMIN))
+    # Someone else's workspace is not listed
+    session.add(Workspace(name="Private", slug="private", owner_id=other_user.id))
+    session.commit()
+    user_id, user_name, other_user_id = user.id, user.full_name, other_user.id
+    session.expunge_all()
+    count_queries.clear()
+
+    workspaces, next_cursor = workspace_service.get_user_workspaces(session=session, user_id=user_id, limit=100)
+    responses = [WorkspaceResponse.model_validate(workspace) for workspace in workspaces]
+
+    # One query for the workspaces, one for the members (with their users joined)
+    assert len(count_queries) == 2
+    assert len(responses) == owned + member_of
+    assert next_cursor is None
+    shared = [response for response in responses if response.owner_id == other_user_id]
+    assert len(shared) == member_of
+    assert all(
+        {(member.name, member.role) for member in response.members}
+        == {("Other User", WorkspaceRole.ADMIN), (user_name, WorkspaceRole.VIEWER)}
+        for response in shared
+    )
+
+
+def test_create_default_workspace_only_once(session: Session, user: User):
+    first = workspace_service.create_default_workspace_for_user(session=session, user_id=user.id, user_name="Ada")
+    again = workspace_service.create_default_workspace_for_user(session=session, user_id=user.id, user_name="Ada")
+
+    assert again.id == first.id
+    assert len(session.exec(select(Workspace).where(Workspace.owner_id == user.id)).all()) == 1
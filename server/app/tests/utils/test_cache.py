@@ -0,0 +1,34 @@
+import time
+
+from app.utils.cache import ExpiringLRUCache
+
+
+def test_expiring_lru_cache_get_set():
+    cache = ExpiringLRUCache(max_size=2)
+    cache.set("a", 1, expires_at=time.time() + 60)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_expiring_lru_cache_evicts_least_recently_used():
+    cache = ExpiringLRUCache(max_size=2)
+    expires_at = time.time() + 60
+    cache.set("a", 1, expires_at=expires_at)
+    cache.set("b", 2, expires_at=expires_at)
+    cache.get("a")
+    cache.set("c", 3, expires_at=expires_at)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_expiring_lru_cache_skips_expired():
+    cache = ExpiringLRUCache(max_size=2)
+    cache.set("a", 1, expires_at=time.time() - 1)
+
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 0
@@ -0,0 +1,71 @@
+import pytest
+from datetime import datetime, timezone
+from sqlmodel import Session, select
+
+from app.exceptions.pagination import InvalidCursorException
+from app.models.user import User
+from app.models.workspace import Workspace
+from app.utils.cursor import encode_cursor
+from app.utils.pagination import keyset_paginate
+from app.tests.api.deps import *
+
+
+# --------- Deps ---------------
+def _paginate(session: Session, *, limit: int, cursor: str | None = None, descending: bool = False):
+    return keyset_paginate(
+        session=session,
+        statement=select(Workspace),
+        created_at=Workspace.created_at,
+        id=Workspace.id,
+        limit=limit,
+        cursor=cursor,
+        descending=descending,
+    )
+
+
+# ---------- Keyset pagination tests -------------
+@pytest.mark.parametrize("descending", [False, True])
+def test_pages_through_every_row_once(session: Session, user: User, descending: bool):
+    # Half the rows share a timestamp, the id breaks the tie
+    same_time = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for index in range(10):
+        created_at = same_time if index % 2 else datetime(2026, 1, 2, index, tzinfo=timezone.utc)
+        session.add(Workspace(name=f"ws {index}", slug=f"ws-{index}", owner_id=user.id, created_at=created_at))
+    session.commit()
+    expected = [
+        workspace.id for workspace in
+        session.exec(select(Workspace).order_by(Workspace.created_at, Workspace.id)).all()
+    ]
+    if descending:
+        expected.reverse()
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        items, cursor = _paginate(session, limit=3, cursor=cursor, descending=descending)
+        seen += [workspace.id for workspace in items]
+        pages += 1
+        if cursor is None:
+            break
+
+    assert seen == expected
+    assert pages == 4
+
+
+def test_exact_last_page_has_no_cursor(session: Session, user: User):
+    session.add_all(Workspace(name=f"ws {index}", slug=f"ws-{index}", owner_id=user.id) for index in range(3))
+    session.commit()
+
+    items, cursor = _paginate(session, limit=3)
+
+    assert len(items) == 3
+    assert cursor is None
+
+
+@pytest.mark.parametrize("cursor", [
+    "not-a-cursor",
+    encode_cursor(["yesterday", "not-a-uuid"]),
+    encode_cursor([1, 2]),
+])
+def test_invalid_cursor(session: Session, cursor: str):
+    with pytest.raises(InvalidCursorException):
+        _paginate(session, limit=3, cursor=cursor)
@@ -0,0 +1,22 @@
+from app.utils.trie import PrefixTrie
+
+
+def test_prefix_trie_iterates_in_key_order():
+    trie = PrefixTrie()
+    for key in ["bug", "backend", "back", "backlog", "design", "back"]:
+        trie.insert(key, key.upper())
+
+    assert [key for key, _ in trie.iter_prefix("ba")] == ["back", "back", "backend", "backlog"]
+    assert [key for key, _ in trie.iter_prefix("")] == ["back", "back", "backend", "backlog", "bug", "design"]
+    assert list(trie.iter_prefix("x")) == []
+
+
+def test_prefix_trie_get_exact_key():
+    trie = PrefixTrie()
+    trie.insert("back", 1)
+    trie.insert("back", 2)
+    trie.insert("backend", 3)
+
+    assert trie.get("back") == [1, 2]
+    assert trie.get("bac") == []
+    assert trie.get("missing") == []
@@ -0,0 +1,48 @@
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.models.user import User
+from app.models.workspace import Workspace
+from app.utils.workspace_slug import generate_unique_workspace_slug
+from app.tests.api.deps import *
+
+
+# --------- Deps ---------------
+def _add_workspaces(session: Session, owner: User, *slugs: str) -> None:
+    session.add_all(Workspace(name=slug, slug=slug, owner_id=owner.id) for slug in slugs)
+    session.commit()
+
+
+# ---------- Slug generation tests -------------
+def test_slug_is_free(session: Session):
+    assert generate_unique_workspace_slug(session=session, base_name="John's Workspace") == "johns-workspace"
+
+
+def test_slug_takes_next_suffix(session: Session, user: User):
+    _add_workspaces(session, user, "johns-workspace", "johns-workspace-1", "johns-workspace-7")
+    assert generate_unique_workspace_slug(session=session, base_name="John's Workspace") == "johns-workspace-8"
+
+
+def test_slug_ignores_non_numeric_suffixes(session: Session, user: User):
+    _add_workspaces(session, user, "johns-workspace", "johns-workspace-team", "johns-workspace-1-old")
+    assert generate_unique_workspace_slug(session=session, base_name="John's Workspace") == "johns-workspace-1"
+
+
+def test_slug_suffix_of_other_base_is_ignored(session: Session, user: User):
+    _add_workspaces(session, user, "johns-workspace-2")
+    assert generate_unique_workspace_slug(session=session, base_name="John's Workspace") == "johns-workspace-3"
+    assert generate_unique_workspace_slug(session=session, base_name="John") == "john"
+
+
+def test_slug_uses_a_single_query(session: Session, user: User):
+    _add_workspaces(session, user, "team", *(f"team-{index}" for index in range(1, 50)))
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(session.get_bind(), "before_cursor_execute", listener)
+    try:
+        slug = generate_unique_workspace_slug(session=session, base_name="Team")
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", listener)
+
+    assert slug == "team-50"
+    assert len(statements) == 1
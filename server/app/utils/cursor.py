@@ -0,0 +1,24 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+from app.exceptions.pagination import InvalidCursorException
+
+
+def encode_cursor(values: list[Any]) -> str:
+    """ Encode the sort key of the last returned row as an opaque cursor. """
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *, types: tuple[type | tuple[type, ...], ...]) -> list[Any]:
+    """ Decode a cursor made by `encode_cursor`, checking each value against `types`. """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursorException()
+    if not isinstance(values, list) or len(values) != len(types) or not all(
+            isinstance(value, expected) for value, expected in zip(values, types)):
+        raise InvalidCursorException()
+    return values
@@ -0,0 +1,48 @@
+import uuid
+from datetime import datetime
+from sqlalchemy import tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlmodel import Session
+from sqlmodel.sql.expression import SelectOfScalar
+from typing import Optional, TypeVar
+
+from app.exceptions.pagination import InvalidCursorException
+from app.utils.cursor import decode_cursor, encode_cursor
+
+T = TypeVar("T")
+
+
+def keyset_paginate(
+    *,
+    session: Session,
+    statement: SelectOfScalar[T],
+    created_at: InstrumentedAttribute,
+    id: InstrumentedAttribute,
+    limit: int,
+    cursor: Optional[str] = None,
+    descending: bool = False,
+) -> tuple[list[T], Optional[str]]:
+    """ One page of `statement` ordered by (created_at, id), starting after `cursor`.
+
+    The cursor turns into a `(created_at, id) > (...)` range condition instead of
+    an OFFSET, so with an index ending in (created_at, id) a deep page costs the
+    same as the first one. `descending` gives newest first (and `<`). Returns the
+    page and the cursor of the next one.
+    """
+    if cursor:
+        after_created_at, after_id = decode_cursor(cursor, types=(str, str))
+        try:
+            after = (datetime.fromisoformat(after_created_at), uuid.UUID(after_id))
+        except ValueError:
+            raise InvalidCursorException()
+        key = tuple_(created_at, id)
+        statement = statement.where(key < tuple_(*after) if descending else key > tuple_(*after))
+
+    order_by = (created_at.desc(), id.desc()) if descending else (created_at, id)
+    # One extra row tells whether there is a next page
+    rows = session.exec(statement.order_by(*order_by).limit(limit + 1)).all()
+    items = list(rows[:limit])
+    if len(rows) <= limit:
+        return items, None
+    last = items[-1]
+    return items, encode_cursor([getattr(last, created_at.key).isoformat(), str(getattr(last, id.key))])
@@ -11,3 +11,19 @@ def slugify(value: str) -> str:
     )
     value = re.sub(r"[^\w\s-]", "", value).strip().lower()
     return re.sub(r"[-\s]+", "-", value)
+
+
+def trigrams(value: str) -> frozenset[str]:
+    """Trigrams of the words in value, padded the way pg_trgm does it."""
+    grams = set()
+    for word in re.findall(r"[^\W_]+", value.lower()):
+        padded = f"  {word} "
+        grams.update(padded[index:index + 3] for index in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+def trigram_similarity(left: frozenset[str], right: frozenset[str]) -> float:
+    """Shared trigrams over all trigrams, like pg_trgm's similarity()."""
+    if not left or not right:
+        return 0.0
+    return len(left & right) / len(left | right)
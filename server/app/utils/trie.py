@@ -0,0 +1,53 @@
+from collections.abc import Iterator
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class _TrieNode(Generic[T]):
+    __slots__ = ("children", "values")
+
+    def __init__(self):
+        self.children: dict[str, "_TrieNode[T]"] = {}
+        self.values: list[T] = []
+
+
+class PrefixTrie(Generic[T]):
+    """ Prefix trie mapping string keys to values, iterated in key order. """
+
+    def __init__(self):
+        self._root: _TrieNode[T] = _TrieNode()
+
+    def insert(self, key: str, value: T) -> None:
+        """ Add a value under key, values of the same key keep insertion order. """
+        node = self._root
+        for char in key:
+            node = node.children.setdefault(char, _TrieNode())
+        node.values.append(value)
+
+    def _find(self, prefix: str) -> _TrieNode[T] | None:
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def get(self, key: str) -> list[T]:
+        """ Values stored under exactly key. """
+        node = self._find(key)
+        return list(node.values) if node else []
+
+    def iter_prefix(self, prefix: str) -> Iterator[tuple[str, T]]:
+        """ Yield (key, value) for every key starting with prefix, in key order. """
+        node = self._find(prefix)
+        if node is None:
+            return
+        stack = [(prefix, node)]
+        while stack:
+            key, node = stack.pop()
+            for value in node.values:
+                yield key, value
+            # Reversed so the smallest child is popped first
+            for char in sorted(node.children, reverse=True):
+                stack.append((key + char, node.children[char]))
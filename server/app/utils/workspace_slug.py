@@ -1,3 +1,4 @@
+from sqlalchemy import BigInteger, and_, case, cast, func, or_
 from sqlmodel import Session, select
 from app.utils.text import slugify
 
@@ -5,13 +6,29 @@ from app.models.workspace import Workspace
 
 
 def generate_unique_workspace_slug(*, session: Session, base_name: str) -> str:
-    """Generate a unique slug for workspace names."""
-    base_slug = slugify(base_name)
-    slug = base_slug
-    counter = 1
+    """Generate a unique slug for workspace names.
 
-    while session.exec(select(Workspace).where(Workspace.slug == slug)).first():
-        slug = f"{base_slug}-{counter}"
-        counter += 1
+    One aggregate query finds the highest numeric suffix already taken
+    (`slug`, `slug-1`, `slug-2`, ...) and the next one is returned, so the cost
+    does not grow with the number of collisions. Concurrent callers can still get
+    the same slug, the insert relies on the unique constraint for that.
+    """
+    base_slug = slugify(base_name)
+    suffix = func.substr(Workspace.slug, len(base_slug) + 2)
+    highest = session.exec(
+        select(func.max(case(
+            (Workspace.slug == base_slug, 0),
+            else_=cast(suffix, BigInteger),
+        )))
+        .where(or_(
+            Workspace.slug == base_slug,
+            and_(
+                Workspace.slug.startswith(f"{base_slug}-", autoescape=True),
+                Workspace.slug.regexp_match(f"^{base_slug}-[0-9]{{1,18}}$"),
+            ),
+        ))
+    ).one()
 
-    return slug
+    if highest is None:
+        return base_slug
+    return f"{base_slug}-{highest + 1}"